@@ -0,0 +1,24 @@
+# algorithms/__init__.py
+# Registre des algorithmes : nom -> (module, fonction). Les modules ne sont importés qu'à
+# la demande, pour ne pas charger DEAP quand on n'exécute que des heuristiques.
+from importlib import import_module
+
+ALGORITHMS = {
+    "first-fit": ("algorithms.first_fit", "first_fit"),
+    "best-fit": ("algorithms.best_fit", "best_fit"),
+    "min-min": ("algorithms.min_min", "min_min"),
+    "max-min": ("algorithms.max_min", "max_min"),
+    "genetic algorithm": ("algorithms.genetic", "genetic_algorithm"),
+}
+
+# Algorithmes qui reçoivent un modèle de VMs et renvoient (affectation, VMs remplies)
+METAHEURISTICS = ("genetic algorithm",)
+
+
+def get_algorithm(name: str):
+    """Fonction d'un algorithme à partir de son nom (voir ALGORITHMS)."""
+    try:
+        module, function = ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"Algorithme inconnu : {name} (attendu : {', '.join(ALGORITHMS)})") from None
+    return getattr(import_module(module), function)
@@ -1,8 +1,15 @@
 # algorithms/best_fit.py
 from models.entities import Service, VM
-from typing import List, Dict
+from algorithms.vm_index import BestFitIndex, INDEX_MIN_VMS
+from typing import List, Dict, Optional
+
+def best_fit(services: List[Service], vms: List[VM], indexed: Optional[bool] = None) -> Dict[int, int]:
+    # indexed=None : index de capacité (liste triée par blocs) à partir de INDEX_MIN_VMS VMs
+    if indexed is None:
+        indexed = len(vms) >= INDEX_MIN_VMS
+    if indexed:
+        return _best_fit_indexed(services, vms)
 
-def best_fit(services: List[Service], vms: List[VM]) -> Dict[int, int]:
     assignment = {}
     for service in services:
         best_vm = None
@@ -16,4 +23,16 @@ def best_fit(services: List[Service], vms: List[VM]) -> Dict[int, int]:
         if best_vm:
             best_vm.assign(service)
             assignment[service.id] = best_vm.id
-    return assignment
\ No newline at end of file
+    return assignment
+
+def _best_fit_indexed(services: List[Service], vms: List[VM]) -> Dict[int, int]:
+    assignment = {}
+    index = BestFitIndex(vms, services)
+    for service in services:
+        position = index.find(service.cpu, service.ram)
+        if position >= 0:
+            best_vm = vms[position]
+            best_vm.assign(service)
+            index.update(position)
+            assignment[service.id] = best_vm.id
+    return assignment
@@ -0,0 +1,150 @@
+# algorithms/bounds.py
+# Bornes inférieures rapides (makespan, nombre de VMs) et critère d'arrêt anticipé de l'AG
+import math
+import threading
+import time
+from typing import List, Optional, Dict
+from models.entities import Service, VM
+from algorithms.fitness import INFEASIBLE_FITNESS
+
+
+def makespan_lower_bound(services: List[Service], vms: List[VM]) -> float:
+    """
+    Makespan minimal de toute affectation complète : au moins le travail total réparti sur
+    la vitesse cumulée des VMs (travail total / nombre de VMs si elles sont homogènes), et
+    au moins le plus long service exécuté sur la VM la plus rapide.
+    """
+    if not services or not vms:
+        return 0.0
+    total = sum(s.exec_time for s in services)
+    return max(total / sum(vm.speed for vm in vms),
+               max(s.exec_time for s in services) / max(vm.speed for vm in vms))
+
+
+def _bins_needed(demand: float, capacities: List[float]) -> int:
+    """Plus petit k tel que les k plus grandes capacités couvrent la demande (len + 1 si impossible)."""
+    covered = 0.0
+    for k, capacity in enumerate(sorted(capacities, reverse=True), start=1):
+        covered += capacity
+        if covered >= demand:
+            return k
+    return len(capacities) + 1
+
+
+def vms_lower_bound(services: List[Service], vms: List[VM]) -> int:
+    """
+    Nombre minimal de VMs utilisées (bin packing CPU/RAM) : il faut assez de VMs, les plus
+    grandes d'abord, pour couvrir la demande totale en CPU, et de même en RAM.
+    """
+    if not services:
+        return 0
+    cpu = _bins_needed(sum(s.cpu for s in services), [vm.cpu_capacity for vm in vms])
+    ram = _bins_needed(sum(s.ram for s in services), [vm.ram_capacity for vm in vms])
+    return max(1, cpu, ram)
+
+
+def is_infeasible(services: List[Service], vms: List[VM]) -> bool:
+    """
+    Vrai si aucune affectation complète ne respecte les capacités (condition suffisante) :
+    un service ne tient sur aucune VM, ou la demande totale dépasse la capacité totale.
+    """
+    for s in services:
+        if not any(s.cpu <= vm.cpu_capacity and s.ram <= vm.ram_capacity for vm in vms):
+            return True
+    return bool(services) and vms_lower_bound(services, vms) > len(vms)
+
+
+def fitness_lower_bound(services: List[Service], vms: List[VM], objective: str = "makespan") -> float:
+    """
+    Borne inférieure de la fitness de l'AG (voir PopulationEvaluator) pour un objectif.
+    Si l'instance est infaisable, tous les individus valent INFEASIBLE_FITNESS.
+    """
+    if is_infeasible(services, vms):
+        return float(INFEASIBLE_FITNESS)
+    if objective == "vms":
+        return float(vms_lower_bound(services, vms))
+    makespan = makespan_lower_bound(services, vms)
+    if objective == "hybrid":
+        max_exec_time = max(s.exec_time for s in services) if services else 1
+        return 0.7 * (makespan / max_exec_time) + 0.3 * vms_lower_bound(services, vms)
+    return makespan
+
+
+class CancelToken:
+    """
+    Jeton d'annulation partagé entre l'appelant (interface, autre thread, ...) et l'AG :
+    après `cancel()`, l'AG s'arrête à la fin de la génération en cours et renvoie la
+    meilleure solution trouvée.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class EarlyStopping:
+    """
+    Critère d'arrêt de l'AG, mis à jour à chaque génération avec la meilleure fitness
+    de la population courante :
+      - "bound" : cette fitness atteint la borne inférieure à `tolerance` près (relative) ;
+        None désactive ce critère
+      - "stall" : la meilleure fitness rencontrée ne s'est pas améliorée depuis
+        `stall_generations` générations ; None désactive ce critère
+      - "cancelled" : `cancel` (CancelToken) a été annulé
+      - "time_budget" : l'échéance `deadline` (horloge time.perf_counter) est dépassée
+    """
+
+    def __init__(self, lower_bound: float, tolerance: Optional[float] = 0.0,
+                 stall_generations: Optional[int] = None,
+                 deadline: Optional[float] = None,
+                 cancel: Optional[CancelToken] = None):
+        self.lower_bound = lower_bound
+        self.tolerance = tolerance
+        self.stall_generations = stall_generations
+        self.deadline = deadline
+        self.cancel = cancel
+        self.best = math.inf
+        self.generations = 0
+        self.last_improvement = 0
+        self.stop_reason: Optional[str] = None
+
+    def update(self, best: float, generations: int = 1) -> bool:
+        """Enregistre `generations` générations de plus ; renvoie True s'il faut s'arrêter."""
+        self.generations += generations
+        if best < self.best:
+            self.best = best
+            self.last_improvement = self.generations
+        if self.tolerance is not None and best <= self.lower_bound + self.tolerance * abs(self.lower_bound):
+            self.stop_reason = "bound"
+        elif (self.stall_generations is not None
+              and self.generations - self.last_improvement >= self.stall_generations):
+            self.stop_reason = "stall"
+        elif self.cancel is not None and self.cancel.cancelled:
+            self.stop_reason = "cancelled"
+        elif self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.stop_reason = "time_budget"
+        return self.stop_reason is not None
+
+    def gap(self) -> float:
+        """Écart relatif à la borne : (meilleure fitness - borne) / borne."""
+        if math.isinf(self.best):
+            return math.inf
+        if self.lower_bound <= 0:
+            return 0.0 if self.best <= self.lower_bound else math.inf
+        return max(0.0, (self.best - self.lower_bound) / self.lower_bound)
+
+    def report(self, max_generations: int) -> Dict:
+        return {
+            "lower_bound": self.lower_bound,
+            "best_fitness": self.best,
+            "gap": self.gap(),
+            "generations_run": self.generations,
+            "generations_saved": max(0, max_generations - self.generations),
+            "stop_reason": self.stop_reason or "max_generations",
+        }
@@ -0,0 +1,244 @@
+# algorithms/delta.py
+# Évaluation incrémentale (delta) des individus de l'AG : chaque individu garde l'état
+# agrégé de ses VMs, et un croisement / une mutation ne met à jour que les VMs touchées.
+import random
+import numpy as np
+from typing import List
+from algorithms.fitness import PopulationEvaluator, INFEASIBLE_FITNESS
+
+# Nombre de mises à jour delta tolérées sur une VM avant un recalcul exact
+MAX_DIRTY_UPDATES = 64
+# Tolérance relative sur les erreurs d'arrondi accumulées par les mises à jour delta
+RELATIVE_TOLERANCE = 1e-8
+# Au-delà de cette fraction de gènes modifiés, les services de chaque VM ne sont pas mis
+# à jour un par un mais reconstruits à partir du génome, au prochain recalcul exact
+REBUILD_FRACTION = 0.125
+
+
+def _group(positions: np.ndarray, vms: np.ndarray) -> dict:
+    """Positions regroupées par VM : {vm: [positions]}."""
+    order = np.argsort(vms, kind="stable")
+    sorted_vms = vms[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_vms[1:] != sorted_vms[:-1])))
+    moved = positions[order].tolist()
+    ends = starts[1:].tolist() + [len(moved)]
+    return {vm: moved[a:b] for vm, a, b in zip(sorted_vms[starts].tolist(), starts.tolist(), ends)}
+
+
+def _members(genome, count: np.ndarray) -> list:
+    """Services de chaque VM (tri stable du génome, découpé selon le nombre de services par VM)."""
+    order = np.argsort(np.asarray(genome, dtype=np.intp), kind="stable")
+    return [frozenset(part.tolist()) for part in np.split(order, np.cumsum(count)[:-1])]
+
+
+class VMAggregates:
+    """
+    État agrégé des VMs d'un individu (un tableau de taille n_vms par grandeur) et
+    services de chaque VM (frozensets d'indices, pour les recalculs exacts ; None : à
+    reconstruire à partir du génome).
+
+    Les ensembles de services ne sont jamais modifiés en place : un individu et ses
+    clones (toolbox.clone = copy.deepcopy) les partagent, et une VM touchée reçoit un
+    nouvel ensemble.
+    """
+    __slots__ = ("cpu_free", "ram_free", "completion_time", "count", "overloaded", "infeasible", "dirty",
+                 "members")
+
+    def __init__(self, cpu_free, ram_free, completion_time, count, members=None):
+        self.cpu_free = cpu_free
+        self.ram_free = ram_free
+        self.completion_time = completion_time
+        self.count = count
+        self.overloaded = (cpu_free < 0) | (ram_free < 0)
+        self.infeasible = int(self.overloaded.sum())   # nombre de VMs surchargées
+        self.dirty = np.zeros(len(cpu_free), dtype=np.int32)  # mises à jour depuis le dernier calcul exact
+        self.members = members
+
+    def __deepcopy__(self, memo):
+        clone = VMAggregates.__new__(VMAggregates)
+        for name in ("cpu_free", "ram_free", "completion_time", "count", "overloaded", "dirty"):
+            setattr(clone, name, getattr(self, name).copy())
+        clone.infeasible = self.infeasible
+        clone.members = list(self.members) if self.members is not None else None
+        return clone
+
+    def move(self, positions: np.ndarray, old_vms: np.ndarray, new_vms: np.ndarray):
+        """Déplace les services `positions` de `old_vms` vers `new_vms` (un nouvel ensemble par VM touchée)."""
+        removed, added = _group(positions, old_vms), _group(positions, new_vms)
+        members = self.members
+        for vm in removed.keys() | added.keys():
+            members[vm] = members[vm].difference(removed.get(vm, ())).union(added.get(vm, ()))
+
+
+class DeltaEvaluator:
+    """
+    Évaluation en O(gènes modifiés) des descendants, avec les mêmes fitness que
+    `PopulationEvaluator`.
+
+    Les mises à jour delta (soustraire la contribution d'un service sur l'ancienne VM,
+    l'ajouter sur la nouvelle) introduisent des erreurs d'arrondi. Elles sont bornées
+    par une tolérance : seules les VMs dont la valeur approchée est trop proche d'une
+    décision (capacité atteinte, VM critique pour le makespan) sont recalculées
+    exactement, dans l'ordre des services comme `VM.assign`. Les valeurs retournées
+    sont donc identiques bit à bit à celles de l'évaluation complète.
+
+    `crossover` et `mutation` remplacent tools.cxTwoPoint et tools.mutUniformInt (mêmes
+    tirages aléatoires) et ne transmettent à `update` que les gènes modifiés ; les
+    recalculs exacts parcourent les services de la VM, pas le génome.
+    """
+
+    def __init__(self, evaluator: PopulationEvaluator):
+        self.evaluator = evaluator
+        self.cpu = evaluator.cpu
+        self.ram = evaluator.ram
+        self.exec_time = evaluator.exec_time
+        self.speed = evaluator.speed
+        self.n_services = evaluator.n_services
+        self.cpu_tol = RELATIVE_TOLERANCE * (float(evaluator.cpu_capacity.max(initial=0)) + float(self.cpu.sum()) + 1)
+        self.ram_tol = RELATIVE_TOLERANCE * (float(evaluator.ram_capacity.max(initial=0)) + float(self.ram.sum()) + 1)
+        # Somme des plus longs temps d'exécution (sur la VM la plus lente)
+        self.time_tol = RELATIVE_TOLERANCE * (float(self.exec_time.sum()) / float(self.speed.min(initial=np.inf)) + 1)
+
+    # --- Opérateurs génétiques suivis -------------------------------------------------
+
+    def crossover(self, ind1, ind2):
+        """
+        tools.cxTwoPoint (mêmes tirages aléatoires) : seuls les gènes du segment échangé
+        qui diffèrent entre les deux parents sont répercutés sur leur état.
+        """
+        size = min(len(ind1), len(ind2))
+        cxpoint1 = random.randint(1, size)
+        cxpoint2 = random.randint(1, size - 1)
+        if cxpoint2 >= cxpoint1:
+            cxpoint2 += 1
+        else:
+            cxpoint1, cxpoint2 = cxpoint2, cxpoint1
+
+        genes1, genes2 = ind1[cxpoint1:cxpoint2], ind2[cxpoint1:cxpoint2]
+        ind1[cxpoint1:cxpoint2], ind2[cxpoint1:cxpoint2] = genes2, genes1
+        genes1 = np.asarray(genes1, dtype=np.intp)
+        genes2 = np.asarray(genes2, dtype=np.intp)
+        changed = np.flatnonzero(genes1 != genes2)
+        self.update(ind1, cxpoint1 + changed, genes1[changed])
+        self.update(ind2, cxpoint1 + changed, genes2[changed])
+        return ind1, ind2
+
+    def mutation(self, individual, low: int, up: int, indpb: float):
+        """
+        tools.mutUniformInt avec des bornes entières (mêmes tirages aléatoires) : seuls
+        les gènes tirés sont répercutés sur l'état de l'individu.
+        """
+        positions, old_vms = [], []
+        for i in range(len(individual)):
+            if random.random() < indpb:
+                positions.append(i)
+                old_vms.append(individual[i])
+                individual[i] = random.randint(low, up)
+        self.update(individual, np.asarray(positions, dtype=np.intp), np.asarray(old_vms, dtype=np.intp))
+        return individual,
+
+    def update(self, individual, positions: np.ndarray, old_vms: np.ndarray):
+        """
+        Répercute sur l'état de `individual` les gènes `positions`, qui valaient
+        `old_vms` avant modification, en O(gènes modifiés).
+        """
+        state = getattr(individual, "delta_state", None)
+        if state is None or positions.size == 0:
+            return
+        new_vms = np.fromiter((individual[i] for i in positions.tolist()), dtype=np.intp, count=positions.size)
+        keep = new_vms != old_vms
+        if not keep.all():
+            positions, old_vms, new_vms = positions[keep], old_vms[keep], new_vms[keep]
+            if positions.size == 0:
+                return
+
+        cpu, ram = self.cpu[positions], self.ram[positions]
+        np.add.at(state.cpu_free, old_vms, cpu)
+        np.add.at(state.cpu_free, new_vms, -cpu)
+        np.add.at(state.ram_free, old_vms, ram)
+        np.add.at(state.ram_free, new_vms, -ram)
+        np.add.at(state.completion_time, old_vms, -self.evaluator.exec_times(positions, old_vms))
+        np.add.at(state.completion_time, new_vms, self.evaluator.exec_times(positions, new_vms))
+        np.add.at(state.count, old_vms, -1)
+        np.add.at(state.count, new_vms, 1)
+        if state.members is not None:
+            if positions.size > REBUILD_FRACTION * self.n_services:
+                state.members = None
+            else:
+                state.move(positions, old_vms, new_vms)
+
+        touched = np.unique(np.concatenate((old_vms, new_vms)))
+        state.dirty[touched] += 1
+        self._classify(state, individual, touched)
+
+    # --- Calculs exacts ---------------------------------------------------------------
+
+    def _recompute(self, state: VMAggregates, individual, vm: int):
+        """Recalcule exactement l'état d'une VM (sommes séquentielles dans l'ordre des services)."""
+        if state.members is None:
+            state.members = _members(individual, state.count)
+        idx = np.array(sorted(state.members[vm]), dtype=np.intp)
+        ev = self.evaluator
+        # np.cumsum accumule séquentiellement : même arrondi que les `-=` / `+=` de VM.assign
+        state.cpu_free[vm] = np.cumsum(np.concatenate(([ev.cpu_capacity[vm]], -self.cpu[idx])))[-1]
+        state.ram_free[vm] = np.cumsum(np.concatenate(([ev.ram_capacity[vm]], -self.ram[idx])))[-1]
+        state.completion_time[vm] = np.cumsum(self.exec_time[idx] / self.speed[vm])[-1] if idx.size else 0.0
+        state.count[vm] = idx.size
+        state.dirty[vm] = 0
+
+    def _classify(self, state: VMAggregates, individual, vms: np.ndarray):
+        """Met à jour le statut « surchargée » des VMs touchées."""
+        for vm in vms[state.dirty[vms] > MAX_DIRTY_UPDATES]:
+            self._recompute(state, individual, vm)
+
+        # Proche de la capacité : le signe de la valeur approchée n'est pas fiable
+        uncertain = vms[(state.dirty[vms] > 0) &
+                        ((np.abs(state.cpu_free[vms]) <= self.cpu_tol) |
+                         (np.abs(state.ram_free[vms]) <= self.ram_tol))]
+        for vm in uncertain:
+            self._recompute(state, individual, vm)
+
+        overloaded = (state.cpu_free[vms] < 0) | (state.ram_free[vms] < 0)
+        state.infeasible += int(overloaded.sum()) - int(state.overloaded[vms].sum())
+        state.overloaded[vms] = overloaded
+
+    def _makespan(self, state: VMAggregates, individual) -> float:
+        completion = state.completion_time
+        top = completion.max()
+        # VMs candidates au makespan dont la valeur n'est qu'approchée
+        candidates = np.flatnonzero((completion >= top - self.time_tol) & (state.dirty > 0))
+        if candidates.size:
+            for vm in candidates:
+                self._recompute(state, individual, vm)
+            top = completion.max()
+        return float(top)
+
+    def fitness(self, individual) -> float:
+        state: VMAggregates = individual.delta_state
+        if state.infeasible:
+            return float(INFEASIBLE_FITNESS)
+
+        objective = self.evaluator.objective
+        if objective == "vms":
+            return float((state.count > 0).sum())
+        makespan = self._makespan(state, individual)
+        if objective == "hybrid":
+            vms_used = float((state.count > 0).sum())
+            return 0.7 * (makespan / self.evaluator.max_exec_time) + 0.3 * vms_used
+        return makespan
+
+    def evaluate(self, individuals: List) -> List[float]:
+        """
+        Fitness des individus. Ceux qui n'ont pas encore d'état (population initiale)
+        sont évalués en une passe vectorisée qui initialise leur état.
+        """
+        fresh = [ind for ind in individuals if getattr(ind, "delta_state", None) is None]
+        if fresh:
+            state = self.evaluator.vm_state(fresh)
+            for row, ind in enumerate(fresh):
+                # Services de chaque VM : construits au premier recalcul exact
+                ind.delta_state = VMAggregates(state["cpu_free"][row].copy(),
+                                               state["ram_free"][row].copy(),
+                                               state["completion_time"][row].copy(),
+                                               state["count"][row].copy())
+        return [self.fitness(ind) for ind in individuals]
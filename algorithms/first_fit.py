@@ -1,8 +1,15 @@
 # algorithms/first_fit.py
 from models.entities import Service, VM
-from typing import List, Dict
+from algorithms.vm_index import FirstFitIndex, INDEX_MIN_VMS
+from typing import List, Dict, Optional
+
+def first_fit(services: List[Service], vms: List[VM], indexed: Optional[bool] = None) -> Dict[int, int]:
+    # indexed=None : index de capacité (arbre de segments) à partir de INDEX_MIN_VMS VMs
+    if indexed is None:
+        indexed = len(vms) >= INDEX_MIN_VMS
+    if indexed:
+        return _first_fit_indexed(services, vms)
 
-def first_fit(services: List[Service], vms: List[VM]) -> Dict[int, int]:
     assignment = {}
     for service in services:
         for vm in vms:
@@ -10,4 +17,16 @@ def first_fit(services: List[Service], vms: List[VM]) -> Dict[int, int]:
                 vm.assign(service)
                 assignment[service.id] = vm.id
                 break
-    return assignment
\ No newline at end of file
+    return assignment
+
+def _first_fit_indexed(services: List[Service], vms: List[VM]) -> Dict[int, int]:
+    assignment = {}
+    index = FirstFitIndex(vms, services)
+    for service in services:
+        position = index.find(service.cpu, service.ram)
+        if position >= 0:
+            vm = vms[position]
+            vm.assign(service)
+            index.update(position)
+            assignment[service.id] = vm.id
+    return assignment
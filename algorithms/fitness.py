@@ -0,0 +1,197 @@
+# algorithms/fitness.py
+# Évaluation vectorisée (NumPy) de la fitness d'une population complète pour l'AG
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from typing import List, Dict, Optional
+from models.entities import Service, VM
+from models.etc import vm_speeds
+
+INFEASIBLE_FITNESS = 10**9   # même pénalité que l'ancienne closure `evaluate`
+
+# Nombre maximal de gènes traités par passe (borne la mémoire des tableaux temporaires)
+MAX_GENES_PER_BATCH = 4_000_000
+
+
+class PopulationEvaluator:
+    """
+    Évalue toute une population (matrice de génomes pop_size x n_services) en une passe.
+
+    Les charges CPU/RAM, le nombre de services et le temps de complétion de chaque VM
+    sont calculés pour tous les individus à la fois avec `np.bincount` (scatter-add).
+    `np.bincount` accumule les poids dans l'ordre du tableau : en plaçant la capacité
+    de chaque VM avant les demandes des services, on reproduit exactement les
+    soustractions successives de `VM.assign`, donc les mêmes valeurs flottantes.
+
+    Le temps du service s sur la VM v est etc[s, v] = exec_time[s] / speed[v] (matrice
+    ETC, models/etc.py), calculé à la demande pour les seuls couples demandés
+    (`exec_times`) : la matrice n_services x n_vms n'est jamais construite.
+    """
+
+    def __init__(self, services: List[Service], vms_template: List[VM], objective: str = "makespan"):
+        self.n_services = len(services)
+        self.n_vms = len(vms_template)
+        self.objective = objective
+
+        self.cpu = np.array([s.cpu for s in services], dtype=np.float64)
+        self.ram = np.array([s.ram for s in services], dtype=np.float64)
+        self.exec_time = np.array([s.exec_time for s in services], dtype=np.float64)
+        self.speed = vm_speeds(vms_template)
+        self._rows = np.arange(self.n_services, dtype=np.intp)
+        self.cpu_capacity = np.array([vm.cpu_capacity for vm in vms_template], dtype=np.float64)
+        self.ram_capacity = np.array([vm.ram_capacity for vm in vms_template], dtype=np.float64)
+        self.max_exec_time = max(s.exec_time for s in services) if services else 1
+
+    def exec_times(self, services, vms) -> np.ndarray:
+        """
+        Temps d'exécution etc[s, v] des couples (services[k], vms[k]) (indices, tableaux de
+        formes compatibles) : même division flottante que `VM.exec_time_of`.
+        """
+        return self.exec_time[services] / self.speed[vms]
+
+    def as_matrix(self, genomes) -> np.ndarray:
+        """Convertit une liste d'individus (ou une matrice) en matrice d'entiers."""
+        return np.asarray(genomes, dtype=np.intp).reshape(len(genomes), self.n_services)
+
+    def vm_state(self, genomes) -> Dict[str, np.ndarray]:
+        """
+        État de chaque VM pour chaque individu, tableaux de forme (pop_size, n_vms) :
+        cpu_free, ram_free, completion_time et count (nombre de services).
+        """
+        genomes = self.as_matrix(genomes)
+        pop_size, m = genomes.shape[0], self.n_vms
+        size = pop_size * m
+
+        # Indice de "case" (individu, VM) de chaque gène
+        bins = (genomes + (np.arange(pop_size, dtype=np.intp) * m)[:, None]).ravel()
+        cap_bins = np.arange(size, dtype=np.intp)
+        all_bins = np.concatenate((cap_bins, bins))
+
+        cpu_free = np.bincount(
+            all_bins,
+            weights=np.concatenate((np.tile(self.cpu_capacity, pop_size), -np.tile(self.cpu, pop_size))),
+            minlength=size)
+        ram_free = np.bincount(
+            all_bins,
+            weights=np.concatenate((np.tile(self.ram_capacity, pop_size), -np.tile(self.ram, pop_size))),
+            minlength=size)
+        # Temps d'exécution de chaque service sur la VM choisie : etc[s, genome[s]]
+        completion = np.bincount(bins, weights=self.exec_times(self._rows, genomes).ravel(), minlength=size)
+        count = np.bincount(bins, minlength=size)
+
+        shape = (pop_size, m)
+        return {
+            "cpu_free": cpu_free.reshape(shape),
+            "ram_free": ram_free.reshape(shape),
+            "completion_time": completion.reshape(shape),
+            "count": count.reshape(shape),
+        }
+
+    def fitness_from_state(self, state: Dict[str, np.ndarray]) -> np.ndarray:
+        """Calcule la fitness (à minimiser) à partir de l'état des VMs."""
+        # Les capacités ne font que décroître : une VM est surchargée à un moment
+        # de l'affectation séquentielle si et seulement si son solde final est négatif.
+        feasible = (state["cpu_free"] >= 0).all(axis=1) & (state["ram_free"] >= 0).all(axis=1)
+        makespan = state["completion_time"].max(axis=1)
+
+        if self.objective == "vms":
+            fitness = (state["count"] > 0).sum(axis=1).astype(np.float64)
+        elif self.objective == "hybrid":
+            vms_used = (state["count"] > 0).sum(axis=1).astype(np.float64)
+            fitness = 0.7 * (makespan / self.max_exec_time) + 0.3 * vms_used
+        else:
+            # "makespan" et objectif inconnu : minimiser le makespan
+            fitness = makespan
+
+        return np.where(feasible, fitness, float(INFEASIBLE_FITNESS))
+
+    def evaluate(self, genomes) -> np.ndarray:
+        """Fitness de chaque individu de la population (tableau de taille pop_size)."""
+        genomes = self.as_matrix(genomes)
+        rows = max(1, MAX_GENES_PER_BATCH // max(self.n_services, 1))
+        if genomes.shape[0] <= rows:
+            return self.fitness_from_state(self.vm_state(genomes))
+        return np.concatenate([
+            self.fitness_from_state(self.vm_state(genomes[start:start + rows]))
+            for start in range(0, genomes.shape[0], rows)
+        ])
+
+
+class FitnessCache:
+    """
+    Mémoïsation LRU des fitness, indexée par une empreinte compacte du génome.
+
+    La clé est un condensé BLAKE2b de 16 octets du génome : chaque entrée a donc une
+    taille fixe (~150 octets avec la structure LRU) quel que soit le nombre de
+    services, et `max_entries` borne directement la mémoire utilisée. Les compteurs
+    de succès/échecs sont historisés par génération dans `history`.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.history: List[Dict[str, int]] = []
+        self._generation_hits = 0
+        self._generation_misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(genome) -> bytes:
+        return hashlib.blake2b(np.ascontiguousarray(genome, dtype=np.int32).tobytes(),
+                               digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[float]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: float):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evaluate(self, evaluator: PopulationEvaluator, genomes) -> np.ndarray:
+        """Fitness des génomes : seuls les génomes inconnus (et distincts) sont évalués."""
+        matrix = evaluator.as_matrix(genomes)
+        fitness = np.empty(matrix.shape[0], dtype=np.float64)
+        pending: Dict[bytes, List[int]] = {}
+
+        for i, row in enumerate(matrix):
+            key = self.key(row)
+            value = self.get(key)
+            if value is not None:
+                fitness[i] = value
+                self._generation_hits += 1
+            elif key in pending:
+                # Doublon dans le même lot : une seule évaluation
+                pending[key].append(i)
+                self._generation_hits += 1
+            else:
+                pending[key] = [i]
+                self._generation_misses += 1
+
+        if pending:
+            values = evaluator.evaluate(matrix[[positions[0] for positions in pending.values()]])
+            for (key, positions), value in zip(pending.items(), values):
+                self.put(key, float(value))
+                fitness[positions] = value
+        return fitness
+
+    def end_generation(self):
+        """Clôture les compteurs de la génération courante."""
+        self.history.append({
+            "generation": len(self.history),
+            "hits": self._generation_hits,
+            "misses": self._generation_misses,
+            "size": len(self._entries),
+        })
+        self.hits += self._generation_hits
+        self.misses += self._generation_misses
+        self._generation_hits = 0
+        self._generation_misses = 0
@@ -1,110 +1,434 @@
 # algorithms/genetic.py
 import random
-from typing import List, Dict, Tuple
-from deap import base, creator, tools
+import time
+import numpy as np
+from typing import List, Dict, Tuple, Optional, Iterator
 from models.entities import Service, VM
+from algorithms.fitness import PopulationEvaluator, FitnessCache, INFEASIBLE_FITNESS
+from algorithms.delta import DeltaEvaluator
+from algorithms.bounds import CancelToken, EarlyStopping, fitness_lower_bound
+from algorithms.warm_start import seed_genomes
+from algorithms.repair import GenomeRepair
+from utils import instrumentation
 
-# Création des classes DEAP (une seule fois)
-try:
-    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
-    creator.create("Individual", list, fitness=creator.FitnessMin)
-except:
-    pass  # Classes déjà créées
 
-def genetic_algorithm(services: List[Service], vms_template: List[VM],
-                      pop_size=100, generations=200, cxpb=0.7, mutpb=0.3, 
-                      objective: str = "makespan") -> Tuple[Dict[int, int], List[VM]]:
+def _deap():
     """
-    Algorithme génétique multi-objectif pour l'allocation de services aux VMs.
-    
-    Args:
-        objective: "makespan" (minimiser temps), "vms" (minimiser VMs), "hybrid" (compromis)
+    Importe DEAP à la demande (son import est coûteux) et crée ses classes une seule
+    fois. Renvoie les modules (base, creator, tools).
     """
-    n_services = len(services)
-    n_vms = len(vms_template)
+    from deap import base, creator, tools
+    if not hasattr(creator, "Individual"):  # Classes pas encore créées
+        creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+        creator.create("Individual", list, fitness=creator.FitnessMin)
+    return base, creator, tools
 
-    # Outils DEAP
+
+def _no_crossover(ind1, ind2):
+    """Croisement d'individus de moins de deux gènes : aucun point de coupe possible."""
+    return ind1, ind2
+
+
+def _make_toolbox(n_services: int, n_vms: int, evaluator: PopulationEvaluator,
+                  delta: Optional[DeltaEvaluator] = None):
+    """Outils DEAP communs au mode séquentiel et au modèle en îles."""
+    base, creator, tools = _deap()
     toolbox = base.Toolbox()
     toolbox.register("vm_id", random.randint, 0, n_vms - 1)
     toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.vm_id, n_services)
     toolbox.register("population", tools.initRepeat, list, toolbox.individual)
 
     def evaluate(individual):
-        # Création de VMs temporaires pour évaluer cette solution
-        temp_vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity) for vm in vms_template]
-        for svc_idx, vm_idx in enumerate(individual):
-            svc = services[svc_idx]
-            if not temp_vms[vm_idx].can_host(svc):
-                return (10**9,)  # pénalité énorme si invalide
-            temp_vms[vm_idx].assign(svc)
-        
-        # Calcul de la fitness selon l'objectif
-        if objective == "makespan":
-            # Minimiser le temps d'exécution total
-            makespan = max(vm.completion_time for vm in temp_vms)
-            return (makespan,)
-        
-        elif objective == "vms":
-            # Minimiser le nombre de VMs utilisées
-            vms_used = sum(1 for vm in temp_vms if vm.services)
-            return (float(vms_used),)
-        
-        elif objective == "hybrid":
-            # Compromis : 70% makespan + 30% VMs utilisées
-            makespan = max(vm.completion_time for vm in temp_vms)
-            vms_used = sum(1 for vm in temp_vms if vm.services)
-            # Normaliser pour les mêmes échelles
-            max_exec_time = max(s.exec_time for s in services) if services else 1
-            fitness = 0.7 * (makespan / max_exec_time) + 0.3 * vms_used
-            return (fitness,)
-        
-        else:
-            # Par défaut : minimiser makespan
-            makespan = max(vm.completion_time for vm in temp_vms)
-            return (makespan,)
+        return (float(evaluator.evaluate([individual])[0]),)
 
     toolbox.register("evaluate", evaluate)
-    toolbox.register("mate", tools.cxTwoPoint)
-    toolbox.register("mutate", tools.mutUniformInt, low=0, up=n_vms-1, indpb=0.2)
+    if delta is not None:
+        # Mode incrémental : mêmes opérateurs, les gènes modifiés sont répercutés sur l'état des individus
+        toolbox.register("mate", delta.crossover)
+        toolbox.register("mutate", delta.mutation, low=0, up=n_vms-1, indpb=0.2)
+    else:
+        toolbox.register("mate", tools.cxTwoPoint)
+        toolbox.register("mutate", tools.mutUniformInt, low=0, up=n_vms-1, indpb=0.2)
+    if n_services < 2:
+        # tools.cxTwoPoint tire deux points de coupe distincts parmi 1..n_services
+        toolbox.register("mate", _no_crossover)
     toolbox.register("select", tools.selTournament, tournsize=3)
+    return toolbox
+
+
+def _evaluate_invalid(individuals: list, evaluator: PopulationEvaluator,
+                      cache: Optional[FitnessCache] = None,
+                      delta: Optional[DeltaEvaluator] = None,
+                      repair: Optional[GenomeRepair] = None) -> int:
+    """
+    Évalue les individus dont la fitness n'est pas connue, après réparation si `repair`
+    est fourni : le génome réparé remplace celui de l'individu (repair.write_back) ou
+    ne sert qu'au calcul de sa fitness. Renvoie le nombre d'individus évalués.
+    """
+    invalid = [ind for ind in individuals if not ind.fitness.valid]
+    if not invalid:
+        return 0
+    targets = invalid
+    if repair is not None:
+        repaired = repair.repair_all(invalid)
+        if repair.write_back:
+            for ind, genome in zip(invalid, repaired):
+                old = np.asarray(ind, dtype=np.intp)
+                ind[:] = genome
+                if delta is not None:
+                    # Répercute les gènes déplacés sur l'état de l'individu
+                    moved = np.flatnonzero(np.asarray(genome, dtype=np.intp) != old)
+                    delta.update(ind, moved, old[moved])
+        else:
+            # L'individu garde son génome : seule la fitness du génome réparé lui est attribuée
+            targets = repaired
+
+    if delta is not None and targets is invalid:
+        fitnesses = delta.evaluate(invalid)
+    elif cache is not None:
+        fitnesses = cache.evaluate(evaluator, targets)
+    else:
+        fitnesses = evaluator.evaluate(targets)
+    for ind, fit in zip(invalid, fitnesses):
+        ind.fitness.values = (float(fit),)
+
+    profiler = instrumentation.current()
+    if profiler is not None:
+        profiler.count("ga.evaluations", len(invalid))
+        profiler.count("ga.infeasible", sum(1 for fit in fitnesses if fit >= INFEASIBLE_FITNESS))
+    return len(invalid)
 
-    # Évolution
-    pop = toolbox.population(n=pop_size)
+
+def _evolve(pop: list, toolbox, evaluator: PopulationEvaluator,
+            generations: int, cxpb: float, mutpb: float,
+            cache: Optional[FitnessCache] = None,
+            delta: Optional[DeltaEvaluator] = None,
+            stopper: Optional[EarlyStopping] = None,
+            repair: Optional[GenomeRepair] = None,
+            record_generations: bool = True,
+            first_generation: int = 0) -> int:
+    """
+    Fait évoluer `pop` (modifiée en place) pendant au plus `generations` générations
+    (moins si `stopper` demande l'arrêt). Renvoie le nombre de générations effectuées.
+    Si l'instrumentation est active (utils/instrumentation.py), les phases sont
+    chronométrées et chaque génération est enregistrée (sauf record_generations=False),
+    numérotée à partir de `first_generation`.
+    """
+    profiler = instrumentation.current()
     for gen in range(generations):
-        offspring = toolbox.select(pop, len(pop))
-        offspring = list(map(toolbox.clone, offspring))
+        start = time.perf_counter() if profiler is not None else 0.0
+        with instrumentation.phase("ga.selection"):
+            offspring = toolbox.select(pop, len(pop))
+            offspring = list(map(toolbox.clone, offspring))
 
-        for child1, child2 in zip(offspring[::2], offspring[1::2]):
-            if random.random() < cxpb:
-                toolbox.mate(child1, child2)
-                del child1.fitness.values
-                del child2.fitness.values
+        with instrumentation.phase("ga.variation"):
+            for child1, child2 in zip(offspring[::2], offspring[1::2]):
+                if random.random() < cxpb:
+                    toolbox.mate(child1, child2)
+                    del child1.fitness.values
+                    del child2.fitness.values
 
-        for mutant in offspring:
-            if random.random() < mutpb:
-                toolbox.mutate(mutant)
-                del mutant.fitness.values
+            for mutant in offspring:
+                if random.random() < mutpb:
+                    toolbox.mutate(mutant)
+                    del mutant.fitness.values
 
         # Évaluation des nouveaux individus
-        invalid = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = map(toolbox.evaluate, invalid)
-        for ind, fit in zip(invalid, fitnesses):
-            ind.fitness.values = fit
+        with instrumentation.phase("ga.evaluation"):
+            evaluated = _evaluate_invalid(offspring, evaluator, cache, delta, repair)
+        if cache is not None:
+            cache.end_generation()
 
         pop[:] = offspring
+        best = min(ind.fitness.values[0] for ind in pop) if stopper is not None or profiler is not None else None
+        if profiler is not None:
+            entry = {"generation": first_generation + gen, "time_s": time.perf_counter() - start,
+                     "evaluations": evaluated, "best_fitness": best}
+            if cache is not None:
+                entry["cache_hits"] = cache.history[-1]["hits"]
+                entry["cache_misses"] = cache.history[-1]["misses"]
+                profiler.count("ga.cache_hits", entry["cache_hits"])
+                profiler.count("ga.cache_misses", entry["cache_misses"])
+            if record_generations:
+                profiler.generation(**entry)
+        if stopper is not None and stopper.update(best):
+            return gen + 1
+    return generations
 
-    # Meilleur individu
-    best = tools.selBest(pop, 1)[0]
 
-    # ON RECONSTRUIT LES VRAIES VMs AVEC LA MEILLEURE SOLUTION
-    final_vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity) for vm in vms_template]
+def _build_solution(best, services: List[Service], vms_template: List[VM],
+                    stats: Optional[dict] = None,
+                    repairer: Optional[GenomeRepair] = None) -> Tuple[Dict[int, int], List[VM]]:
+    """
+    Reconstruit de vraies VMs à partir du meilleur génome, réparé au préalable (voir
+    algorithms/repair.py) : un service n'est rejeté que s'il ne tient sur aucune VM
+    restante. Le nombre de services rejetés est noté dans stats["rejected"].
+
+    repairer: réparation avec l'objectif du run (voir `_final_repair`) ; par défaut,
+              réparation pour l'objectif "makespan"
+    """
+    best = (repairer or GenomeRepair(services, vms_template)).repair(best)
+    final_vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
     assignment = {}
     for svc_idx, vm_idx in enumerate(best):
         svc = services[svc_idx]
         if final_vms[vm_idx].can_host(svc):  # can_host
             final_vms[vm_idx].assign(svc)
             assignment[svc.id] = final_vms[vm_idx].id
+    if stats is not None:
+        stats["rejected"] = len(services) - len(assignment)
 
-    # ON RETOURNE L'ASSIGNATION + ON REMPLACE LES VMS 
+    # ON RETOURNE L'ASSIGNATION + ON REMPLACE LES VMS
     # → mais comme on ne peut pas modifier vms depuis ici, on retourne aussi les VMs remplis
-    return assignment, final_vms
\ No newline at end of file
+    return assignment, final_vms
+
+
+def _final_repair(services: List[Service], vms_template: List[VM], objective: str,
+                  evaluator: PopulationEvaluator) -> GenomeRepair:
+    """
+    Réparation du génome rendu par l'AG : même objectif et même évaluateur que la
+    réparation pendant l'évolution (objectif "vms" : d'abord les VMs déjà utilisées),
+    mais statistiques séparées.
+    """
+    return GenomeRepair(services, vms_template, objective, evaluator=evaluator)
+
+
+def _init_population(services: List[Service], vms_template: List[VM], pop_size: int,
+                     objective: str, cache_size: int, incremental: bool, warm_start: float,
+                     repair: bool, repair_write_back: bool):
+    """
+    Prépare un run séquentiel : évaluateur, outils DEAP, cache, réparation et population
+    initiale (évaluée seulement avec warm_start). Renvoie
+    (pop, toolbox, evaluator, cache, delta, repairer).
+    """
+    with instrumentation.phase("ga.setup"):
+        # Évaluation vectorisée de toute la population (mêmes valeurs que l'évaluation VM par VM)
+        evaluator = PopulationEvaluator(services, vms_template, objective)
+        delta = DeltaEvaluator(evaluator) if incremental else None
+        toolbox = _make_toolbox(len(services), len(vms_template), evaluator, delta)
+        cache = FitnessCache(cache_size) if cache_size > 0 and delta is None else None
+        repairer = (GenomeRepair(services, vms_template, objective, repair_write_back, evaluator)
+                    if repair else None)
+
+    with instrumentation.phase("ga.initial_population"):
+        pop = toolbox.population(n=pop_size)
+        if warm_start > 0:
+            for ind, genome in zip(pop, seed_genomes(services, vms_template, round(warm_start * pop_size))):
+                ind[:] = genome
+            _evaluate_invalid(pop, evaluator, cache, delta, repairer)
+    return pop, toolbox, evaluator, cache, delta, repairer
+
+
+def genetic_algorithm(services: List[Service], vms_template: List[VM],
+                      pop_size=100, generations=200, cxpb=0.7, mutpb=0.3,
+                      objective: str = "makespan",
+                      islands: int = 1, migration_interval: int = 20, migration_size: int = 2,
+                      workers: Optional[int] = None,
+                      seed: Optional[int] = None,
+                      cache_size: int = 10_000,
+                      incremental: bool = False,
+                      tolerance: Optional[float] = 0.0,
+                      stall_generations: Optional[int] = None,
+                      warm_start: float = 0.0,
+                      repair: bool = False,
+                      repair_write_back: bool = True,
+                      time_budget: Optional[float] = None,
+                      cancel: Optional[CancelToken] = None,
+                      stats: Optional[dict] = None) -> Tuple[Dict[int, int], List[VM]]:
+    """
+    Algorithme génétique multi-objectif pour l'allocation de services aux VMs.
+    Version génération par génération (courbe de convergence, arrêt à la demande) :
+    voir `iter_genetic_algorithm`.
+
+    Args:
+        objective: "makespan" (minimiser temps), "vms" (minimiser VMs), "hybrid" (compromis)
+        islands: nombre de sous-populations (> 1 : modèle en îles, voir algorithms/island.py)
+        migration_interval: générations entre deux migrations (modèle en îles)
+        migration_size: nombre d'élites envoyées à l'île voisine à chaque migration
+        workers: nombre de processus pour le modèle en îles (défaut : min(islands, nb CPU))
+        seed: graine du générateur aléatoire ; l'état global de `random` est restauré
+              après l'exécution (None : on utilise l'état global courant)
+        cache_size: nombre max. de fitness mémorisées (cache LRU par génome, 0 : désactivé)
+        incremental: évaluation delta des descendants en O(gènes modifiés) (algorithms/delta.py) ;
+                     le cache n'est alors pas utilisé
+        tolerance: arrêt dès que le meilleur individu atteint la borne inférieure de la fitness
+                   (algorithms/bounds.py) à cette tolérance relative près (None : jamais)
+        stall_generations: arrêt si la meilleure fitness ne s'améliore plus pendant ce nombre
+                           de générations (None : désactivé)
+        warm_start: fraction de la population initiale construite à partir des heuristiques
+                    et de variantes perturbées (algorithms/warm_start.py) ; la population
+                    initiale est alors évaluée avant la première sélection (0 : départ à froid)
+        repair: répare chaque génome avant son évaluation en déplaçant les services qui
+                surchargent une VM vers des VMs qui ont la place (algorithms/repair.py)
+        repair_write_back: le génome réparé remplace celui de l'individu (True) ou ne sert
+                           qu'au calcul de sa fitness (False ; l'évaluation incrémentale
+                           n'est alors pas utilisée)
+        time_budget: durée maximale en secondes (horloge murale) ; l'AG s'arrête à la fin de
+                     la génération qui dépasse l'échéance, `generations` reste un plafond
+                     (None : pas de limite)
+        cancel: jeton d'annulation (CancelToken) ; l'AG s'arrête à la fin de la génération
+                en cours et renvoie la meilleure solution de la population
+        stats: dictionnaire optionnel rempli avec les statistiques du run
+               ("cache" : succès/échecs du cache par génération, "cache_hits", "cache_misses" ;
+               "lower_bound", "best_fitness", "gap" : écart relatif à la borne,
+               "generations_run", "generations_saved", "stop_reason" (bound, stall,
+               time_budget, cancelled ou max_generations) ;
+               "repair" : génomes examinés/réparés/restés infaisables, services déplacés ;
+               "rejected" : services non placés dans la solution renvoyée)
+    """
+    stopper = None
+    if (tolerance is not None or stall_generations is not None
+            or time_budget is not None or cancel is not None):
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        stopper = EarlyStopping(fitness_lower_bound(services, vms_template, objective),
+                                tolerance, stall_generations, deadline, cancel)
+
+    if islands > 1:
+        from algorithms.island import island_genetic_algorithm
+        return island_genetic_algorithm(services, vms_template, pop_size, generations, cxpb, mutpb,
+                                        objective, islands, migration_interval, migration_size,
+                                        workers, seed, cache_size, incremental, stats, stopper,
+                                        warm_start, repair, repair_write_back)
+
+    saved_state = None
+    if seed is not None:
+        saved_state = random.getstate()
+        random.seed(seed)
+    try:
+        pop, toolbox, evaluator, cache, delta, repairer = _init_population(
+            services, vms_template, pop_size, objective, cache_size, incremental,
+            warm_start, repair, repair_write_back)
+        # Évolution
+        _evolve(pop, toolbox, evaluator, generations, cxpb, mutpb, cache, delta, stopper, repairer)
+
+        # Meilleur individu
+        best = _deap()[2].selBest(pop, 1)[0]
+    finally:
+        if saved_state is not None:
+            random.setstate(saved_state)
+
+    if stats is not None and cache is not None:
+        stats["cache"] = cache.history
+        stats["cache_hits"] = cache.hits
+        stats["cache_misses"] = cache.misses
+    if stats is not None and stopper is not None:
+        stats.update(stopper.report(generations))
+    if stats is not None and repairer is not None:
+        stats["repair"] = repairer.stats()
+
+    # ON RECONSTRUIT LES VRAIES VMs AVEC LA MEILLEURE SOLUTION
+    with instrumentation.phase("ga.rebuild"):
+        return _build_solution(best, services, vms_template, stats,
+                               _final_repair(services, vms_template, objective, evaluator))
+
+
+def iter_genetic_algorithm(services: List[Service], vms_template: List[VM],
+                           pop_size=100, generations=200, cxpb=0.7, mutpb=0.3,
+                           objective: str = "makespan",
+                           seed: Optional[int] = None,
+                           cache_size: int = 10_000,
+                           incremental: bool = False,
+                           tolerance: Optional[float] = 0.0,
+                           stall_generations: Optional[int] = None,
+                           warm_start: float = 0.0,
+                           repair: bool = False,
+                           repair_write_back: bool = True,
+                           time_budget: Optional[float] = None,
+                           cancel: Optional[CancelToken] = None,
+                           stats: Optional[dict] = None) -> Iterator[Dict]:
+    """
+    Version « anytime » de `genetic_algorithm` (mêmes paramètres, modèle séquentiel
+    uniquement) : générateur qui produit un état après chaque génération.
+
+    Chaque état est un dictionnaire :
+        generation: nombre de générations effectuées
+        elapsed_s: temps écoulé depuis l'appel
+        population_best: meilleure fitness de la population courante
+        best_fitness: meilleure fitness rencontrée depuis le début
+        improved: True si best_fitness vient de s'améliorer
+        assignment, vms: meilleure solution rencontrée (reconstruite comme dans
+                         genetic_algorithm, seulement quand elle s'améliore)
+        stop_reason: None tant que l'AG continue ; sinon "bound", "stall", "time_budget",
+                     "cancelled" ou "max_generations" (dernier état produit)
+
+    L'appelant peut arrêter la boucle à tout moment et garder la dernière solution, ou
+    annuler `cancel` depuis un autre thread : un dernier état (stop_reason="cancelled")
+    est alors produit sans nouvelle génération. Avec `seed`, l'AG utilise son propre état
+    de `random`, échangé avec celui de l'appelant autour de chaque génération : le run ne
+    dépend pas de ce que fait l'appelant entre deux états, et pour une même graine la
+    population finale est celle de genetic_algorithm.
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget if time_budget is not None else None
+    stopper = EarlyStopping(fitness_lower_bound(services, vms_template, objective),
+                            tolerance, stall_generations, deadline, cancel)
+
+    ga_state = None
+    if seed is not None:
+        caller_state = random.getstate()
+        random.seed(seed)
+    try:
+        pop, toolbox, evaluator, cache, delta, repairer = _init_population(
+            services, vms_template, pop_size, objective, cache_size, incremental,
+            warm_start, repair, repair_write_back)
+    finally:
+        if seed is not None:
+            ga_state = random.getstate()
+            random.setstate(caller_state)
+
+    final_repair = _final_repair(services, vms_template, objective, evaluator)
+    done = 0
+    best_genome, state = None, None
+    while done < generations:
+        if state is not None and cancel is not None and cancel.cancelled:
+            # Annulé entre deux états : on rend la meilleure solution sans nouvelle génération
+            stopper.stop_reason = "cancelled"
+            state = dict(state, elapsed_s=time.perf_counter() - start, improved=False,
+                         stop_reason="cancelled")
+            break
+
+        if ga_state is not None:
+            caller_state = random.getstate()
+            random.setstate(ga_state)
+        try:
+            _evolve(pop, toolbox, evaluator, 1, cxpb, mutpb, cache, delta, stopper, repairer,
+                    first_generation=done)
+        finally:
+            if ga_state is not None:
+                ga_state = random.getstate()
+                random.setstate(caller_state)
+        done += 1
+
+        population_best = min(ind.fitness.values[0] for ind in pop)
+        improved = best_genome is None or population_best < state["best_fitness"]
+        if improved:
+            best_genome = list(_deap()[2].selBest(pop, 1)[0])
+            with instrumentation.phase("ga.rebuild"):
+                assignment, vms = _build_solution(best_genome, services, vms_template, stats, final_repair)
+        else:
+            assignment, vms = state["assignment"], state["vms"]
+        stop_reason = stopper.stop_reason or ("max_generations" if done >= generations else None)
+        state = {
+            "generation": done,
+            "elapsed_s": time.perf_counter() - start,
+            "population_best": population_best,
+            "best_fitness": population_best if improved else state["best_fitness"],
+            "improved": improved,
+            "assignment": assignment,
+            "vms": vms,
+            "stop_reason": stop_reason,
+        }
+        if stop_reason is not None:
+            break
+        yield state
+
+    if stats is not None and cache is not None:
+        stats["cache"] = cache.history
+        stats["cache_hits"] = cache.hits
+        stats["cache_misses"] = cache.misses
+    if stats is not None:
+        stats.update(stopper.report(generations))
+    if stats is not None and repairer is not None:
+        stats["repair"] = repairer.stats()
+    if state is not None:
+        yield state
@@ -0,0 +1,223 @@
+# algorithms/island.py
+# Modèle en îles : plusieurs sous-populations évoluent en parallèle (un processus par île)
+# et échangent périodiquement leurs meilleurs individus (migration en anneau).
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Tuple, Optional
+from models.entities import Service, VM
+from algorithms.fitness import PopulationEvaluator, FitnessCache
+from algorithms.delta import DeltaEvaluator
+from algorithms.bounds import EarlyStopping
+from algorithms.warm_start import seed_genomes
+from algorithms.repair import GenomeRepair
+from algorithms.genetic import _deap, _make_toolbox, _evolve, _build_solution, _final_repair
+from utils import instrumentation
+
+# Contexte d'évaluation de chaque processus (initialisé une fois par processus)
+_context = {}
+
+
+def _init_context(services: List[Service], vms_template: List[VM], objective: str,
+                  cxpb: float, mutpb: float, cache_size: int, incremental: bool,
+                  repair: bool, repair_write_back: bool):
+    evaluator = PopulationEvaluator(services, vms_template, objective)
+    delta = DeltaEvaluator(evaluator) if incremental else None
+    _context["evaluator"] = evaluator
+    _context["delta"] = delta
+    _context["repair"] = (GenomeRepair(services, vms_template, objective, repair_write_back, evaluator)
+                          if repair else None)
+    _context["toolbox"] = _make_toolbox(len(services), len(vms_template), evaluator, delta)
+    _context["cxpb"] = cxpb
+    _context["mutpb"] = mutpb
+    # Un cache par processus : il est partagé par les îles exécutées dans ce processus
+    _context["cache"] = FitnessCache(cache_size) if cache_size > 0 and delta is None else None
+
+
+def _run_epoch(task):
+    """
+    Fait évoluer une île pendant quelques générations.
+
+    task = (génomes, fitness (None si non évalué), état du générateur, générations).
+    Chaque île a son propre état `random` transmis d'une époque à l'autre : le
+    résultat ne dépend donc pas du processus qui exécute l'île. On renvoie aussi
+    les statistiques du cache pour les générations de l'époque.
+    """
+    genomes, fitnesses, rng_state, generations = task
+    creator = _deap()[1]
+    pop = []
+    for genome, fit in zip(genomes, fitnesses):
+        ind = creator.Individual(genome)
+        if fit is not None:
+            ind.fitness.values = (fit,)
+        pop.append(ind)
+
+    cache = _context["cache"]
+    history_start = len(cache.history) if cache is not None else 0
+
+    random.setstate(rng_state)
+    _evolve(pop, _context["toolbox"], _context["evaluator"], generations,
+            _context["cxpb"], _context["mutpb"], cache, _context["delta"],
+            repair=_context["repair"], record_generations=False)
+    return ([list(ind) for ind in pop],
+            [ind.fitness.values[0] if ind.fitness.valid else None for ind in pop],
+            random.getstate(),
+            cache.history[history_start:] if cache is not None else [])
+
+
+@contextmanager
+def _epoch_runner(workers: int, context_args: tuple):
+    """Renvoie une fonction qui exécute une époque sur toutes les îles."""
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_context,
+                                 initargs=context_args) as executor:
+            yield lambda tasks: list(executor.map(_run_epoch, tasks))
+    else:
+        # Exécution dans le processus courant : on préserve l'état global de `random`
+        saved_state = random.getstate()
+        _init_context(*context_args)
+        try:
+            yield lambda tasks: [_run_epoch(task) for task in tasks]
+        finally:
+            random.setstate(saved_state)
+
+
+def _migrate(states: list, migration_size: int):
+    """Migration en anneau : les élites de l'île i remplacent les pires de l'île i+1."""
+    emigrants = []
+    for genomes, fitnesses, _, _ in states:
+        order = sorted(range(len(genomes)), key=lambda i: fitnesses[i])
+        emigrants.append([(list(genomes[i]), fitnesses[i]) for i in order[:migration_size]])
+
+    for i, (genomes, fitnesses, _, _) in enumerate(states):
+        incoming = emigrants[i - 1]
+        worst = sorted(range(len(genomes)), key=lambda j: fitnesses[j], reverse=True)
+        for j, (genome, fit) in zip(worst, incoming):
+            genomes[j] = genome
+            fitnesses[j] = fit
+
+
+def island_genetic_algorithm(services: List[Service], vms_template: List[VM],
+                             pop_size=100, generations=200, cxpb=0.7, mutpb=0.3,
+                             objective: str = "makespan",
+                             islands: int = 4, migration_interval: int = 20, migration_size: int = 2,
+                             workers: Optional[int] = None,
+                             seed: Optional[int] = None,
+                             cache_size: int = 10_000,
+                             incremental: bool = False,
+                             stats: Optional[dict] = None,
+                             stopper: Optional[EarlyStopping] = None,
+                             warm_start: float = 0.0,
+                             repair: bool = False,
+                             repair_write_back: bool = True) -> Tuple[Dict[int, int], List[VM]]:
+    """
+    AG en îles : `islands` sous-populations qui se partagent les pop_size individus (les
+    pop_size % islands premières îles en ont un de plus ; au plus pop_size // 2 îles,
+    pour qu'une île ait au moins deux individus).
+
+    Le budget d'évaluations est le même que celui de `genetic_algorithm` avec les
+    mêmes pop_size et generations. Pour une graine donnée, le résultat est identique
+    quel que soit le nombre de workers (les migrations sont faites dans le processus
+    principal, dans un ordre fixe). Le critère d'arrêt `stopper` est évalué à la fin de
+    chaque époque, sur le meilleur individu de toutes les îles. Avec `warm_start`, chaque
+    île reçoit sa part de génomes issus des heuristiques, évalués avant la première époque.
+    Avec `repair`, chaque processus répare les génomes avant de les évaluer (les
+    statistiques de réparation ne sont pas remontées).
+    """
+    n_services = len(services)
+    n_vms = len(vms_template)
+    islands = max(1, min(islands, pop_size // 2))
+    sizes = [pop_size // islands + (1 if k < pop_size % islands else 0) for k in range(islands)]
+    migration_size = min(migration_size, sizes[-1] - 1)
+    migration_interval = max(1, migration_interval)
+    if workers is None:
+        workers = min(islands, os.cpu_count() or 1)
+
+    # Une graine par île, dérivée de la graine maître
+    master = random.Random(seed if seed is not None else random.getrandbits(64))
+    states = []
+    for size in sizes:
+        rng = random.Random(master.getrandbits(64))
+        genomes = [[rng.randint(0, n_vms - 1) for _ in range(n_services)] for _ in range(size)]
+        states.append((genomes, [None] * size, rng.getstate(), []))
+
+    evaluator = PopulationEvaluator(services, vms_template, objective)
+    repairer = GenomeRepair(services, vms_template, objective, repair_write_back, evaluator) if repair else None
+
+    def score(genomes: list) -> List[float]:
+        """Fitness des génomes (réparés au préalable, et réécrits si repair_write_back)."""
+        if repairer is None:
+            return [float(fit) for fit in evaluator.evaluate(genomes)]
+        repaired = repairer.repair_all(genomes)
+        if repair_write_back:
+            genomes[:] = repaired
+        return [float(fit) for fit in evaluator.evaluate(repaired)]
+
+    if warm_start > 0:
+        per_island = [round(warm_start * size) for size in sizes]
+        seeded = seed_genomes(services, vms_template, sum(per_island), master)
+        for k, (genomes, fitnesses, _, _) in enumerate(states):
+            # Répartition entrelacée : chaque île reçoit des solutions de base différentes
+            # (les îles les plus grandes, en tête, en reçoivent au plus une de plus)
+            genomes[:per_island[k]] = seeded[k::islands]
+            fitnesses[:] = score(genomes)
+
+    context_args = (services, vms_template, objective, cxpb, mutpb, cache_size, incremental,
+                    repair, repair_write_back)
+    profiler = instrumentation.current()
+    cache_history = []
+    done = 0
+    with _epoch_runner(workers, context_args) as run_epoch:
+        while done < generations:
+            step = min(migration_interval, generations - done)
+            start = time.perf_counter()
+            with instrumentation.phase("ga.island.epoch"):
+                states = run_epoch([(g, f, s, step) for g, f, s, _ in states])
+            # Statistiques du cache cumulées sur toutes les îles, génération par génération
+            for offset in range(step):
+                entries = [history[offset] for _, _, _, history in states if offset < len(history)]
+                if entries:
+                    cache_history.append({
+                        "generation": done + offset,
+                        "hits": sum(e["hits"] for e in entries),
+                        "misses": sum(e["misses"] for e in entries),
+                    })
+            done += step
+            best = None
+            if stopper is not None or profiler is not None:
+                best = min(fit for _, fitnesses, _, _ in states for fit in fitnesses if fit is not None)
+            if profiler is not None:
+                # Une entrée par époque (toutes les îles) : generation = dernière génération de l'époque
+                profiler.generation(generation=done - 1, time_s=time.perf_counter() - start,
+                                    generations=step, best_fitness=best)
+            if stopper is not None and stopper.update(best, step):
+                break
+            if done < generations and migration_size > 0:
+                with instrumentation.phase("ga.island.migration"):
+                    _migrate(states, migration_size)
+
+    # Meilleur individu global (les individus jamais évalués le sont ici)
+    best_genome, best_fit = None, None
+    for genomes, fitnesses, _, _ in states:
+        missing = [i for i, fit in enumerate(fitnesses) if fit is None]
+        if missing:
+            pending = [genomes[i] for i in missing]
+            for i, genome, fit in zip(missing, pending, score(pending)):
+                genomes[i] = genome
+                fitnesses[i] = fit
+        for genome, fit in zip(genomes, fitnesses):
+            if best_fit is None or fit < best_fit:
+                best_genome, best_fit = genome, fit
+
+    if stats is not None and cache_size > 0 and not incremental:
+        stats["cache"] = cache_history
+        stats["cache_hits"] = sum(e["hits"] for e in cache_history)
+        stats["cache_misses"] = sum(e["misses"] for e in cache_history)
+    if stats is not None and stopper is not None:
+        stats.update(stopper.report(generations))
+
+    with instrumentation.phase("ga.rebuild"):
+        return _build_solution(best_genome, services, vms_template, stats,
+                               _final_repair(services, vms_template, objective, evaluator))
@@ -0,0 +1,273 @@
+# algorithms/local_search.py
+# Post-optimisation par recherche locale d'une affectation existante (sortie de n'importe
+# quel algorithme) : voisinages « déplacement » et « échange » autour de la VM critique
+# (celle qui fixe le makespan), en descente, recherche tabou ou recuit simulé.
+import heapq
+import math
+import random
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from models.entities import Service, VM
+
+STRATEGIES = ("descent", "tabu", "annealing")
+
+# Les charges sont tenues à jour par additions / soustractions : cette marge garantit que
+# VM.assign accepte toujours les services lors de la reconstruction des VMs
+CAPACITY_EPS = 1e-9
+
+# Nombre de services tirés au hasard comme partenaires d'échange à chaque itération
+SWAP_CANDIDATES = 512
+
+
+class _SearchState:
+    """
+    État de la recherche : VM de chaque service, CPU/RAM libres et fin d'exécution de
+    chaque VM (tableaux NumPy), services de chaque VM et tas des VMs par fin décroissante
+    (entrées périmées ignorées) pour retrouver la VM critique.
+
+    Un déplacement ou un échange ne modifie que deux VMs : sa valeur (fin la plus tardive
+    des deux VMs après le mouvement, à comparer à la fin de la VM critique) et sa
+    faisabilité se calculent en O(1) ; tous les déplacements d'un service (une cible par
+    VM) ou tous ses échanges candidats sont évalués d'une seule passe vectorisée.
+    """
+
+    def __init__(self, services: List[Service], vms: List[VM], assignment: Dict[int, int]):
+        self.services = services
+        self.vms = vms
+        position = {vm.id: i for i, vm in enumerate(vms)}
+        index = {s.id: k for k, s in enumerate(services)}
+        self.cpu = np.array([s.cpu for s in services], dtype=np.float64)
+        self.ram = np.array([s.ram for s in services], dtype=np.float64)
+        self.exec_time = np.array([s.exec_time for s in services], dtype=np.float64)
+        self.speed = np.array([vm.speed for vm in vms], dtype=np.float64)
+        self.cpu_free = np.array([vm.cpu_free for vm in vms], dtype=np.float64)
+        self.ram_free = np.array([vm.ram_free for vm in vms], dtype=np.float64)
+        self.completion = np.array([vm.completion_time for vm in vms], dtype=np.float64)
+        self.vm_of = np.full(len(services), -1, dtype=np.intp)
+        self.members: List[set] = [set() for _ in vms]
+        for sid, vid in assignment.items():
+            k, p = index[sid], position[vid]
+            self.vm_of[k] = p
+            self.members[p].add(k)
+        self.initial = self.vm_of.copy()
+        self._heap = [(-c, p) for p, c in enumerate(self.completion.tolist())]
+        heapq.heapify(self._heap)
+
+    def critical(self) -> int:
+        """VM qui fixe le makespan."""
+        heap = self._heap
+        while -heap[0][0] != self.completion[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def makespan(self) -> float:
+        return float(self.completion[self.critical()]) if self.vms else 0.0
+
+    def place(self, k: int, v: int):
+        """Place le service k sur la VM v (en le retirant de sa VM actuelle)."""
+        c = self.vm_of[k]
+        if c >= 0:
+            self.cpu_free[c] += self.cpu[k]
+            self.ram_free[c] += self.ram[k]
+            self.completion[c] -= self.exec_time[k] / self.speed[c]
+            self.members[c].discard(k)
+            heapq.heappush(self._heap, (-self.completion[c], c))
+        self.cpu_free[v] -= self.cpu[k]
+        self.ram_free[v] -= self.ram[k]
+        self.completion[v] += self.exec_time[k] / self.speed[v]
+        self.members[v].add(k)
+        self.vm_of[k] = v
+        heapq.heappush(self._heap, (-self.completion[v], v))
+
+    def moves(self, k: int) -> np.ndarray:
+        """Valeur du déplacement de k vers chaque VM (inf : impossible ou VM actuelle)."""
+        c = self.vm_of[k]
+        fits = ((self.cpu_free - self.cpu[k] >= CAPACITY_EPS)
+                & (self.ram_free - self.ram[k] >= CAPACITY_EPS))
+        target = self.completion + self.exec_time[k] / self.speed
+        if c >= 0:
+            fits[c] = False
+            target = np.maximum(target, self.completion[c] - self.exec_time[k] / self.speed[c])
+        return np.where(fits, target, np.inf)
+
+    def swaps(self, k: int, partners: np.ndarray) -> np.ndarray:
+        """Valeur de l'échange de k avec chaque service de `partners` (inf : impossible)."""
+        c = self.vm_of[k]
+        v = self.vm_of[partners]
+        valid = (v >= 0) & (v != c)
+        v = np.where(valid, v, c)
+        cpu_delta = self.cpu[k] - self.cpu[partners]
+        ram_delta = self.ram[k] - self.ram[partners]
+        fits = (valid
+                & (self.cpu_free[c] + cpu_delta >= CAPACITY_EPS) & (self.ram_free[c] + ram_delta >= CAPACITY_EPS)
+                & (self.cpu_free[v] - cpu_delta >= CAPACITY_EPS) & (self.ram_free[v] - ram_delta >= CAPACITY_EPS))
+        new_c = self.completion[c] - self.exec_time[k] / self.speed[c] + self.exec_time[partners] / self.speed[c]
+        new_v = (self.completion[v] - self.exec_time[partners] / self.speed[v]
+                 + self.exec_time[k] / self.speed[v])
+        return np.where(fits, np.maximum(new_c, new_v), np.inf)
+
+    def rebuild(self, vm_of: np.ndarray) -> Dict[int, int]:
+        """Reconstruit les VMs dont les services ont changé ; renvoie la nouvelle affectation."""
+        changed = vm_of != self.initial
+        touched = np.union1d(vm_of[changed], self.initial[changed])
+        touched = touched[touched >= 0]
+        for p in touched.tolist():
+            self.vms[p].reset()
+        for k in np.flatnonzero(np.isin(vm_of, touched)).tolist():
+            self.vms[vm_of[k]].assign(self.services[k])
+        return {self.services[k].id: self.vms[p].id for k, p in enumerate(vm_of.tolist()) if p >= 0}
+
+
+def local_search(services: List[Service], vms: List[VM], assignment: Dict[int, int],
+                 strategy: str = "descent",
+                 max_iterations: Optional[int] = 100_000,
+                 time_budget: Optional[float] = None,
+                 tabu_tenure: int = 10,
+                 initial_temperature: Optional[float] = None,
+                 cooling: float = 0.999,
+                 seed: Optional[int] = None,
+                 stats: Optional[dict] = None) -> Dict[int, int]:
+    """
+    Améliore le makespan d'une affectation existante ; `vms` (les VMs remplies par
+    l'algorithme) est modifié en place et la nouvelle affectation est renvoyée.
+
+    Les services de `services` absents de l'affectation (rejetés) sont d'abord placés,
+    du plus long au plus court, sur la VM qui a la place et les terminerait le plus tôt.
+    Puis, à chaque itération, on cherche à soulager la VM critique :
+      - déplacement d'un de ses services vers une autre VM ;
+      - échange d'un de ses services avec un service d'une autre VM (partenaires tirés
+        au hasard, SWAP_CANDIDATES par itération).
+    Un mouvement est améliorant si les deux VMs concernées finissent avant l'ancienne
+    fin de la VM critique.
+
+    Args:
+        strategy: "descent" (meilleur mouvement améliorant, arrêt à l'optimum local),
+                  "tabu" (meilleur mouvement non tabou même s'il dégrade ; un service
+                  ne peut pas revenir sur une VM quittée pendant `tabu_tenure` itérations,
+                  sauf s'il améliore la meilleure solution) ou "annealing" (mouvement
+                  aléatoire accepté avec la probabilité exp(-dégradation / température),
+                  température initiale `initial_temperature`, défaut 5 % du makespan,
+                  multipliée par `cooling` à chaque itération)
+        max_iterations, time_budget: budget en itérations et en secondes (None : pas de limite)
+        seed: graine du générateur aléatoire propre à la recherche (l'état global de
+              `random` n'est pas utilisé)
+        stats: dictionnaire optionnel rempli avec "strategy", "iterations", "moves",
+               "swaps", "inserted", "initial_makespan", "makespan", "elapsed_s", "stop_reason"
+
+    tabou et recuit renvoient la meilleure solution rencontrée.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Stratégie inconnue : {strategy} (attendu : {', '.join(STRATEGIES)})")
+    start = time.perf_counter()
+    deadline = start + time_budget if time_budget is not None else None
+    rng = random.Random(seed)
+    if not vms or not services:
+        return dict(assignment)
+    state = _SearchState(services, vms, assignment)
+    initial_makespan = state.makespan()
+
+    # Services rejetés par l'algorithme : placés sur la VM qui les termine le plus tôt
+    inserted = 0
+    for k in sorted(np.flatnonzero(state.vm_of < 0).tolist(), key=lambda k: -state.exec_time[k]):
+        scores = state.moves(k)
+        v = int(np.argmin(scores))
+        if scores[v] < np.inf:
+            state.place(k, v)
+            inserted += 1
+
+    best_makespan, best_vm_of = state.makespan(), state.vm_of.copy()
+    temperature = initial_temperature if initial_temperature is not None else 0.05 * best_makespan
+    tabu: Dict[Tuple[int, int], int] = {}   # (service, VM quittée) -> fin de l'interdiction
+    moves = swaps = iterations = 0
+    stop_reason = "max_iterations"
+    n = len(services)
+    while max_iterations is None or iterations < max_iterations:
+        if deadline is not None and time.perf_counter() >= deadline:
+            stop_reason = "time_budget"
+            break
+        c = state.critical()
+        current = state.completion[c]
+        if not state.members[c]:
+            stop_reason = "local_optimum"
+            break
+        iterations += 1
+
+        if strategy == "annealing":
+            k = rng.choice(tuple(state.members[c]))
+            if rng.random() < 0.5:
+                scores, partner = state.moves(k), None
+                choice = rng.randrange(len(vms))
+            else:
+                partner = np.array([rng.randrange(n)])
+                scores, choice = state.swaps(k, partner), 0
+            value = scores[choice]
+            if value == np.inf:
+                continue
+            degradation = value - current
+            temperature *= cooling
+            if degradation >= 0 and (temperature <= 0 or rng.random() >= math.exp(-degradation / temperature)):
+                continue
+            moves_to = [(k, choice)] if partner is None else [(k, state.vm_of[partner[0]]), (int(partner[0]), c)]
+        else:
+            partners = np.array(rng.sample(range(n), min(n, SWAP_CANDIDATES)), dtype=np.intp)
+            best_value, moves_to = np.inf, None
+            for k in state.members[c]:
+                scores = state.moves(k)
+                swap_scores = state.swaps(k, partners)
+                if strategy == "tabu":
+                    aspiration = best_makespan
+                    for (service, vm), until in tabu.items():
+                        if until <= iterations:
+                            continue
+                        if service == k:
+                            # k ne revient pas sur une VM quittée récemment
+                            if scores[vm] >= aspiration:
+                                scores[vm] = np.inf
+                            swap_scores[(state.vm_of[partners] == vm) & (swap_scores >= aspiration)] = np.inf
+                        elif vm == c:
+                            # un partenaire ne revient pas sur la VM critique s'il l'a quittée
+                            swap_scores[(partners == service) & (swap_scores >= aspiration)] = np.inf
+                v = int(np.argmin(scores))
+                if scores[v] < best_value:
+                    best_value, moves_to = scores[v], [(k, v)]
+                j = int(np.argmin(swap_scores))
+                if swap_scores[j] < best_value:
+                    t = int(partners[j])
+                    best_value, moves_to = swap_scores[j], [(k, state.vm_of[t]), (t, c)]
+            if moves_to is None or (strategy == "descent" and best_value >= current):
+                stop_reason = "local_optimum"
+                break
+
+        for k, v in moves_to:
+            if strategy == "tabu":
+                tabu[(k, int(state.vm_of[k]))] = iterations + tabu_tenure
+            state.place(k, int(v))
+        if len(moves_to) == 1:
+            moves += 1
+        else:
+            swaps += 1
+        if strategy == "tabu" and len(tabu) > 4 * tabu_tenure:
+            tabu = {key: until for key, until in tabu.items() if until > iterations}
+
+        makespan = state.makespan()
+        if makespan < best_makespan:
+            best_makespan = makespan
+            if strategy != "descent":
+                best_vm_of = state.vm_of.copy()
+
+    final = state.vm_of if strategy == "descent" else best_vm_of
+    result = state.rebuild(final)
+    if stats is not None:
+        stats.update({
+            "strategy": strategy,
+            "iterations": iterations,
+            "moves": moves,
+            "swaps": swaps,
+            "inserted": inserted,
+            "initial_makespan": initial_makespan,
+            "makespan": max((vm.completion_time for vm in vms), default=0.0),
+            "elapsed_s": time.perf_counter() - start,
+            "stop_reason": stop_reason,
+        })
+    return result
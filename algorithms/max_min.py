@@ -1,26 +1,16 @@
 # algorithms/max_min.py
 # Identique à min_min mais on prend le temps MAXIMUM
 from models.entities import Service, VM
-from typing import List, Dict
+from algorithms.min_min import _assign_by_completion
+from typing import List, Dict, Optional
 
-def max_min(services: List[Service], vms: List[VM]) -> Dict[int, int]:
-    assignment = {}
-    remaining = services[:]
-    while remaining:
-        best_service = None
-        best_vm = None
-        best_time = -float('inf')
 
-        for service in remaining:
-            for vm in vms:
-                if vm.can_host(service):
-                    if service.exec_time > best_time:
-                        best_time = service.exec_time
-                        best_service = service
-                        best_vm = vm
-
-        if best_vm and best_service:
-            best_vm.assign(best_service)
-            assignment[best_service.id] = best_vm.id
-            remaining.remove(best_service)
-    return assignment
\ No newline at end of file
+def max_min(services: List[Service], vms: List[VM], etc=None, indexed: Optional[bool] = None) -> Dict[int, int]:
+    """
+    Max-Min sur VMs hétérogènes : le service dont le meilleur temps de complétion est le
+    plus grand est placé en premier, sur la VM qui le termine le plus tôt. Même argument
+    que pour min_min : c'est le plus long des services restants, d'où la file de priorité
+    (-temps d'exécution, position) ; à égalité, le premier service de la liste.
+    """
+    heap = [(-service.exec_time, i) for i, service in enumerate(services)]
+    return _assign_by_completion(services, vms, heap, etc, indexed)
@@ -1,27 +1,123 @@
 # algorithms/min_min.py
+import heapq
 from models.entities import Service, VM
-from typing import List, Dict
+from algorithms.vm_index import CompletionIndex, INDEX_MIN_VMS
+from typing import List, Dict, Tuple, Optional
+
+# Nœuds explorés dans CompletionIndex, par niveau de l'arbre, avant de revenir à l'argmin NumPy
+INDEX_MAX_NODES = 8
+
+
+def _assign_by_completion(services: List[Service], vms: List[VM], heap: List[Tuple[float, int]],
+                          etc=None, indexed: Optional[bool] = None) -> Dict[int, int]:
+    """
+    Place les services dans l'ordre de la file de priorité `heap` (clé, position), chacun
+    sur la VM qui peut l'héberger et qui le terminerait le plus tôt :
+    argmin sur v de completion_time[v] + etc[s, v], masqué par la faisabilité CPU/RAM
+    (à égalité, la première VM de la liste).
+
+    etc: matrice ETC (models/etc.py). Si elle n'est pas fournie, chaque ligne est calculée
+         au moment du placement (mêmes valeurs, sans la matrice n x m en mémoire).
+    indexed: None : index CompletionIndex (arbre de segments, O(log m) par placement
+             quand les VMs les moins chargées ont la place) à partir de INDEX_MIN_VMS VMs
+             et sans matrice `etc` ; sinon argmin NumPy sur toute la flotte (O(m) par
+             placement). Les deux donnent les mêmes affectations.
+    """
+    if not services or not vms:
+        return {}
+    if indexed is None:
+        indexed = etc is None and len(vms) >= INDEX_MIN_VMS
+    if indexed:
+        return _assign_indexed(services, vms, heap)
+    import numpy as np                   # NumPy n'est chargé qu'à l'exécution
+    from models.etc import vm_speeds
+    speeds = vm_speeds(vms)
+    cpu_free = np.array([vm.cpu_free for vm in vms], dtype=np.float64)
+    ram_free = np.array([vm.ram_free for vm in vms], dtype=np.float64)
+    completion = np.array([vm.completion_time for vm in vms], dtype=np.float64)
+
+    assignment = {}
+    heapq.heapify(heap)
+    while heap:
+        _, i = heapq.heappop(heap)
+        service = services[i]
+        feasible = (cpu_free >= service.cpu) & (ram_free >= service.ram)
+        if not feasible.any():
+            # Les ressources libres ne font que diminuer : ce service ne tiendra jamais
+            continue
+        row = etc[i] if etc is not None else service.exec_time / speeds
+        position = int(np.argmin(np.where(feasible, completion + row, np.inf)))
+        best_vm = vms[position]
+        best_vm.assign(service)
+        cpu_free[position] = best_vm.cpu_free
+        ram_free[position] = best_vm.ram_free
+        completion[position] = best_vm.completion_time
+        assignment[service.id] = best_vm.id
+    return assignment
+
+
+def _assign_indexed(services: List[Service], vms: List[VM], heap: List[Tuple[float, int]]) -> Dict[int, int]:
+    """
+    Même placement que `_assign_by_completion`, la VM étant trouvée par CompletionIndex
+    en O(log m) tant que les bornes de capacité élaguent l'arbre.
+
+    Sur une flotte presque pleine, les VMs les moins chargées n'ont souvent plus la
+    place et la recherche visiterait presque tout l'arbre : au-delà de INDEX_MAX_NODES
+    nœuds par niveau, la VM est choisie par l'argmin NumPy sur toute la flotte (O(m)
+    vectorisé), et l'index n'est réessayé qu'après un nombre de services qui double à
+    chaque nouvel échec. Un placement ne coûte donc jamais beaucoup plus que le parcours
+    complet.
+    """
+    import numpy as np
+    from models.etc import vm_speeds
+    index = CompletionIndex(vms, services)
+    max_nodes = INDEX_MAX_NODES * index.size.bit_length()
+    speeds = vm_speeds(vms)
+    cpu_free = np.array([vm.cpu_free for vm in vms], dtype=np.float64)
+    ram_free = np.array([vm.ram_free for vm in vms], dtype=np.float64)
+    completion = np.array([vm.completion_time for vm in vms], dtype=np.float64)
 
-def min_min(services: List[Service], vms: List[VM]) -> Dict[int, int]:
     assignment = {}
-    remaining = services[:]
-    while remaining:
-        best_service = None
-        best_vm = None
-        best_time = float('inf')
-
-        for service in remaining:
-            for vm in vms:
-                if vm.can_host(service):
-                    # ici on suppose temps constant (VMs homogènes pour simplifier)
-                    # tu peux remplacer par service.exec_time / vm.speed si tu ajoutes une vitesse
-                    if service.exec_time < best_time:
-                        best_time = service.exec_time
-                        best_service = service
-                        best_vm = vm
-
-        if best_vm and best_service:
-            best_vm.assign(best_service)
-            assignment[best_service.id] = best_vm.id
-            remaining.remove(best_service)
-    return assignment
\ No newline at end of file
+    skip, backoff = 0, 1   # services à placer sans l'index, et prochaine durée de mise à l'écart
+    heapq.heapify(heap)
+    while heap:
+        _, i = heapq.heappop(heap)
+        service = services[i]
+        position = None
+        if skip:
+            skip -= 1
+        else:
+            position = index.find_earliest(service.cpu, service.ram, service.exec_time, max_nodes)
+            if position is None:
+                skip, backoff = backoff, 2 * backoff
+            else:
+                backoff = 1
+        if position is None:
+            feasible = (cpu_free >= service.cpu) & (ram_free >= service.ram)
+            position = (int(np.argmin(np.where(feasible, completion + service.exec_time / speeds, np.inf)))
+                        if feasible.any() else -1)
+        if position < 0:
+            continue
+        best_vm = vms[position]
+        best_vm.assign(service)
+        index.update(position)
+        cpu_free[position] = best_vm.cpu_free
+        ram_free[position] = best_vm.ram_free
+        completion[position] = best_vm.completion_time
+        assignment[service.id] = best_vm.id
+    return assignment
+
+
+def min_min(services: List[Service], vms: List[VM], etc=None, indexed: Optional[bool] = None) -> Dict[int, int]:
+    """
+    Min-Min sur VMs hétérogènes : le service dont le meilleur temps de complétion est le
+    plus petit est placé sur la VM qui réalise ce temps, et ainsi de suite.
+
+    min sur v de (completion_time[v] + exec_time / speed[v]) croît avec exec_time : le
+    service choisi est toujours le plus court des services restants. La file de priorité
+    (temps d'exécution, position) donne donc l'ordre de Min-Min (à égalité, le premier
+    service de la liste) ; seule la contrainte de capacité peut s'en écarter, quand le
+    service le plus court n'a plus accès aux VMs les moins chargées.
+    """
+    heap = [(service.exec_time, i) for i, service in enumerate(services)]
+    return _assign_by_completion(services, vms, heap, etc, indexed)
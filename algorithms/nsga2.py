@@ -0,0 +1,292 @@
+# algorithms/nsga2.py
+# NSGA-II : front de Pareto (makespan, VMs utilisées, services rejetés) en une seule
+# exécution, au lieu d'un run de l'AG par objectif. Tri non dominé par insertion dans
+# les fronts, par blocs de points comparés en NumPy, et distance de crowding vectorisée.
+import random
+import numpy as np
+from typing import List, Dict, Optional, Tuple
+from models.entities import Service, VM
+from algorithms.fitness import PopulationEvaluator
+from algorithms.repair import GenomeRepair
+from algorithms.warm_start import seed_genomes
+from utils import instrumentation
+
+OBJECTIVES = ("makespan", "vms_used", "rejected")
+# Points traités ensemble par non_dominated_sort
+SORT_BLOCK_SIZE = 128
+
+def non_dominated_sort(objectives: np.ndarray, block_size: int = SORT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Rang de Pareto de chaque point (0 : non dominé) d'une matrice (n_points, n_objectifs)
+    à minimiser, par tri puis insertion dans les fronts (« efficient non-dominated sort »,
+    recherche dichotomique du front) : mémoire en O(n_points + block_size * taille d'un
+    front), sans matrice de dominance.
+
+    Les points identiques sont regroupés (ils ont le même rang). Dans l'ordre
+    lexicographique, un point ne peut être dominé que par un point qui le précède : chaque
+    point est placé dans le premier front dont aucun membre ne le domine. Si un front
+    domine le point, tous les fronts précédents le dominent aussi, d'où la dichotomie.
+
+    Les points sont traités par blocs de `block_size` : la dichotomie avance pour tout le
+    bloc à la fois, chaque étape comparant en NumPy les membres d'un front à tous les
+    points du bloc qui le testent. Le rang d'un point est aussi 1 + le plus grand rang de
+    ses dominants : ceux du bloc (qui le précèdent) sont pris en compte ensuite, avant
+    d'ajouter le bloc aux fronts.
+    """
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)   # tri lexicographique
+    n, m = unique.shape
+    # Le premier objectif d'un point déjà classé est inférieur ou égal : seuls les autres
+    # sont comparés (un point distinct inférieur ou égal partout le domine)
+    rest = unique[:, 1:]
+    fronts: List[np.ndarray] = []   # membres de chaque front (lignes de `rest`), capacité doublée au besoin
+    sizes: List[int] = []
+    ranks = np.empty(n, dtype=np.intp)
+    for start in range(0, n, block_size):
+        block = rest[start:start + block_size]
+        b = len(block)
+        # Dichotomie de tous les points du bloc dans les fronts existants : [low, high)
+        low = np.zeros(b, dtype=np.intp)
+        high = np.full(b, len(fronts), dtype=np.intp)
+        active = np.flatnonzero(low < high)
+        while active.size:
+            mid = (low[active] + high[active]) // 2
+            for f in np.unique(mid):
+                tested = active[mid == f]
+                dominated = _covers(fronts[f][:sizes[f]], block[tested]).any(axis=0)
+                low[tested[dominated]] = f + 1
+                high[tested[~dominated]] = f
+            active = active[low[active] < high[active]]
+
+        # Dominants à l'intérieur du bloc : inside[j, i] pour j < i
+        inside = _covers(block, block) & np.triu(np.ones((b, b), dtype=bool), 1)
+        block_ranks = low
+        for i in np.flatnonzero(inside.any(axis=0)):
+            block_ranks[i] = max(low[i], block_ranks[:i][inside[:i, i]].max() + 1)
+        ranks[start:start + b] = block_ranks
+
+        for f in np.unique(block_ranks):   # croissants : un rang r suppose un front r - 1
+            points = block[block_ranks == f]
+            if f == len(fronts):
+                fronts.append(np.empty((max(4, len(points)), m - 1), dtype=rest.dtype))
+                sizes.append(0)
+            size = sizes[f]
+            if size + len(points) > len(fronts[f]):
+                grown = np.empty((max(2 * len(fronts[f]), size + len(points)), m - 1), dtype=rest.dtype)
+                grown[:size] = fronts[f][:size]
+                fronts[f] = grown
+            fronts[f][size:size + len(points)] = points
+            sizes[f] = size + len(points)
+    return ranks[inverse.ravel()]
+
+
+def _covers(members: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """covers[j, i] : members[j] <= points[i] sur chaque colonne (colonne par colonne, sans tableau 3D)."""
+    covers = np.ones((len(members), len(points)), dtype=bool)
+    for c in range(members.shape[1]):
+        covers &= members[:, None, c] <= points[None, :, c]
+    return covers
+
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    Distance de crowding de chaque point au sein de son front, pour tous les fronts à la
+    fois : pour chaque objectif, les points sont triés par (rang, valeur) et chacun reçoit
+    l'écart normalisé entre ses deux voisins du même front (infini aux extrémités).
+    """
+    n, m = objectives.shape
+    distance = np.zeros(n)
+    for k in range(m):
+        order = np.lexsort((objectives[:, k], ranks))
+        values = objectives[order, k]
+        sorted_ranks = ranks[order]
+        first = np.r_[True, sorted_ranks[1:] != sorted_ranks[:-1]]
+        last = np.r_[sorted_ranks[1:] != sorted_ranks[:-1], True]
+        starts, ends = np.flatnonzero(first), np.flatnonzero(last)
+        span = (values[ends] - values[starts])[np.cumsum(first) - 1]
+        gap = np.zeros(n)
+        gap[1:-1] = values[2:] - values[:-2]
+        contribution = np.where(first | last, np.inf, gap / np.where(span > 0, span, 1.0))
+        distance[order] += contribution
+    return distance
+
+
+class ParetoObjectives:
+    """
+    Objectifs (makespan, VMs utilisées, services rejetés) d'un lot de génomes, calculés
+    sur la solution que donne chaque génome : les services sont placés dans l'ordre et
+    un service qui ne tient plus sur sa VM est rejeté (comme la reconstruction de l'AG).
+    Avec `repair`, les génomes sont réparés (et réécrits) avant l'évaluation.
+
+    Les génomes sans VM surchargée (tous les services placés) sont évalués en une passe
+    vectorisée (`PopulationEvaluator.vm_state`) ; seuls les autres sont décodés un à un.
+    """
+
+    def __init__(self, services: List[Service], vms_template: List[VM], repair: bool = True):
+        self.evaluator = PopulationEvaluator(services, vms_template)
+        self.repairer = GenomeRepair(services, vms_template, evaluator=self.evaluator) if repair else None
+        self.cpu = [s.cpu for s in services]
+        self.ram = [s.ram for s in services]
+        self.exec_time = [s.exec_time for s in services]
+        self.speed = [vm.speed for vm in vms_template]
+        self.cpu_capacity = [vm.cpu_capacity for vm in vms_template]
+        self.ram_capacity = [vm.ram_capacity for vm in vms_template]
+
+    def evaluate(self, genomes: List[List[int]]) -> np.ndarray:
+        """Matrice (n_génomes, 3) des objectifs ; `genomes` réparés en place si repair."""
+        if self.repairer is not None:
+            genomes[:] = self.repairer.repair_all(genomes)
+        state = self.evaluator.vm_state(genomes)
+        overloaded = ((state["cpu_free"] < 0) | (state["ram_free"] < 0)).any(axis=1)
+        result = np.column_stack((state["completion_time"].max(axis=1, initial=0.0),
+                                  (state["count"] > 0).sum(axis=1),
+                                  np.zeros(len(genomes))))
+        for row in np.flatnonzero(overloaded):
+            result[row] = self._decode(genomes[row])
+        return result
+
+    def _decode(self, genome: List[int]) -> Tuple[float, int, int]:
+        # Mêmes soustractions successives que VM.assign : mêmes valeurs flottantes
+        cpu_free = list(self.cpu_capacity)
+        ram_free = list(self.ram_capacity)
+        completion = [0.0] * len(cpu_free)
+        count = [0] * len(cpu_free)
+        rejected = 0
+        for i, v in enumerate(genome):
+            if cpu_free[v] >= self.cpu[i] and ram_free[v] >= self.ram[i]:
+                cpu_free[v] -= self.cpu[i]
+                ram_free[v] -= self.ram[i]
+                completion[v] += self.exec_time[i] / self.speed[v]
+                count[v] += 1
+            else:
+                rejected += 1
+        return max(completion, default=0.0), sum(1 for c in count if c), rejected
+
+
+def _tournament(ranks: np.ndarray, crowding: np.ndarray, k: int) -> List[int]:
+    """Tournoi binaire : rang le plus faible, puis distance de crowding la plus grande."""
+    chosen = []
+    n = len(ranks)
+    for _ in range(k):
+        a, b = random.randrange(n), random.randrange(n)
+        if ranks[b] < ranks[a] or (ranks[b] == ranks[a] and crowding[b] > crowding[a]):
+            a = b
+        chosen.append(a)
+    return chosen
+
+
+def nsga2(services: List[Service], vms_template: List[VM],
+          pop_size=100, generations=200, cxpb=0.7, mutpb=0.3,
+          seed: Optional[int] = None,
+          repair: bool = True,
+          warm_start: float = 0.0,
+          stats: Optional[dict] = None) -> List[Dict]:
+    """
+    NSGA-II sur les objectifs (makespan, VMs utilisées, services rejetés), tous minimisés.
+    Mêmes opérateurs que l'AG (croisement deux points, mutation uniforme) ; la sélection
+    de survie garde les pop_size meilleurs parents + descendants par (rang, crowding).
+
+    Renvoie le front de Pareto final : une entrée par point distinct, triée par makespan,
+    {"makespan", "vms_used", "rejected", "genome"}. `pareto_solution` reconstruit la
+    solution (affectation, VMs) d'un point sans relancer l'algorithme.
+
+    Args:
+        seed: graine du générateur aléatoire ; l'état global de `random` est restauré
+              après l'exécution (None : on utilise l'état global courant)
+        repair: réparation des génomes avant l'évaluation (algorithms/repair.py)
+        warm_start: fraction de la population initiale issue des heuristiques
+                    (algorithms/warm_start.py)
+        stats: dictionnaire optionnel rempli avec "front_sizes" (taille du front à chaque
+               génération), "front_size" et "repair"
+    """
+    from deap import tools
+
+    n_services, n_vms = len(services), len(vms_template)
+    if n_services == 0 or n_vms == 0:
+        return []
+    saved_state = None
+    if seed is not None:
+        saved_state = random.getstate()
+        random.seed(seed)
+    try:
+        with instrumentation.phase("nsga2.setup"):
+            objectives = ParetoObjectives(services, vms_template, repair)
+        with instrumentation.phase("nsga2.initial_population"):
+            pop = [[random.randint(0, n_vms - 1) for _ in range(n_services)] for _ in range(pop_size)]
+            if warm_start > 0:
+                pop[:round(warm_start * pop_size)] = seed_genomes(services, vms_template,
+                                                                 round(warm_start * pop_size))
+            values = objectives.evaluate(pop)
+            ranks = non_dominated_sort(values)
+            crowding = crowding_distance(values, ranks)
+
+        front_sizes = []
+        for _ in range(generations):
+            with instrumentation.phase("nsga2.variation"):
+                offspring = [list(pop[i]) for i in _tournament(ranks, crowding, pop_size)]
+                for child1, child2 in zip(offspring[::2], offspring[1::2]):
+                    # Croisement deux points : impossible avec moins de deux gènes
+                    if random.random() < cxpb and n_services >= 2:
+                        tools.cxTwoPoint(child1, child2)
+                for mutant in offspring:
+                    if random.random() < mutpb:
+                        tools.mutUniformInt(mutant, low=0, up=n_vms - 1, indpb=0.2)
+
+            with instrumentation.phase("nsga2.evaluation"):
+                offspring_values = objectives.evaluate(offspring)
+
+            # Sélection de survie sur parents + descendants
+            with instrumentation.phase("nsga2.selection"):
+                union = pop + offspring
+                union_values = np.vstack((values, offspring_values))
+                union_ranks = non_dominated_sort(union_values)
+                union_crowding = crowding_distance(union_values, union_ranks)
+                survivors = np.lexsort((-union_crowding, union_ranks))[:pop_size]
+                pop = [union[i] for i in survivors]
+                values = union_values[survivors]
+                ranks = union_ranks[survivors]
+                crowding = crowding_distance(values, ranks)
+            front_sizes.append(int((ranks == 0).sum()))
+    finally:
+        if saved_state is not None:
+            random.setstate(saved_state)
+
+    # Front final : un génome par point distinct
+    front = {}
+    for i in np.flatnonzero(ranks == 0):
+        point = tuple(values[i])
+        if point not in front:
+            front[point] = {"makespan": float(point[0]), "vms_used": int(point[1]),
+                            "rejected": int(point[2]), "genome": pop[i]}
+    front = sorted(front.values(), key=lambda p: (p["makespan"], p["vms_used"], p["rejected"]))
+
+    if stats is not None:
+        stats["front_sizes"] = front_sizes
+        stats["front_size"] = len(front)
+        if objectives.repairer is not None:
+            stats["repair"] = objectives.repairer.stats()
+    return front
+
+
+def pareto_solution(point: Dict, services: List[Service],
+                    vms_template: List[VM]) -> Tuple[Dict[int, int], List[VM]]:
+    """Affectation et VMs remplies d'un point du front (génome déjà réparé par nsga2)."""
+    vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+    assignment = {}
+    for service, v in zip(services, point["genome"]):
+        if vms[v].can_host(service):
+            vms[v].assign(service)
+            assignment[service.id] = vms[v].id
+    return assignment, vms
+
+
+def select_tradeoff(front: List[Dict], weights: Dict[str, float]) -> Dict:
+    """
+    Point du front qui minimise la somme pondérée des objectifs normalisés sur le front
+    (0 : meilleure valeur du front, 1 : pire), par ex. {"makespan": 0.7, "vms_used": 0.3}
+    pour le compromis de l'objectif "hybrid" de l'AG.
+    """
+    values = np.array([[p[name] for name in OBJECTIVES] for p in front], dtype=np.float64)
+    low, high = values.min(axis=0), values.max(axis=0)
+    normalized = (values - low) / np.where(high > low, high - low, 1.0)
+    scores = normalized @ np.array([weights.get(name, 0.0) for name in OBJECTIVES])
+    return front[int(np.argmin(scores))]
@@ -0,0 +1,168 @@
+# algorithms/online.py
+# Ordonnancement en ligne (streaming) : les services arrivent au fil de l'eau, sont placés
+# dès leur arrivée et libèrent leur CPU/RAM quand leur exécution se termine.
+import heapq
+import itertools
+import json
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
+from models.entities import Service, VM
+from algorithms.vm_index import FirstFitIndex, BestFitIndex
+
+# Un élément du flux : (date d'arrivée, service)
+Arrival = Tuple[float, Service]
+
+POLICIES = ("first-fit", "best-fit", "min-completion")
+
+
+def read_jsonl_stream(path: str) -> Iterator[Arrival]:
+    """
+    Lit un flux de services JSONL, une ligne par service :
+    {"id": 0, "cpu": 3.2, "ram": 8.0, "exec_time": 18.5, "arrival": 0.0}
+    Le fichier est lu ligne par ligne (mémoire constante).
+    """
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            data = json.loads(line)
+            arrival = data.pop("arrival", 0.0)
+            yield arrival, Service(**data)
+
+
+class OnlineScheduler:
+    """
+    Place chaque service à son arrivée avec une politique au choix :
+      - "first-fit" : première VM avec assez de ressources libres
+      - "best-fit" : VM où il reste le moins de ressources libres
+      - "min-completion" : VM (avec assez de ressources) qui termine le service le plus tôt
+
+    Comme dans les algorithmes hors ligne, les services d'une VM s'exécutent l'un
+    après l'autre : un service démarre quand la VM a fini les précédents et réserve
+    ses ressources de son arrivée à sa fin. Les fins d'exécution sont gérées par un
+    tas d'événements de départ ; la mémoire ne dépend que du nombre de services
+    présents, pas de la longueur du flux. Un service qui ne tient sur aucune VM à
+    son arrivée est rejeté.
+    """
+
+    def __init__(self, vms: List[VM], policy: str = "first-fit"):
+        if policy not in POLICIES:
+            raise ValueError(f"Politique inconnue : {policy} (attendu : {', '.join(POLICIES)})")
+        self.vms = vms
+        self.policy = policy
+        self.now = 0.0
+        self.busy_until = [0.0] * len(vms)   # fin d'exécution de la file de chaque VM
+        self.horizon = 0.0                   # fin du dernier service planifié (makespan)
+        self._departures: List[tuple] = []   # tas (fin, n° d'ordre, position VM, service)
+        self._order = itertools.count()
+
+        self.placed = 0
+        self.rejected = 0
+        self.departed = 0
+        # Somme des taux d'utilisation par VM (moyenne comme dans compute_metrics), et sa
+        # valeur initiale, retrouvée exactement quand tous les services sont partis
+        self._cpu_ratio = sum(vm.cpu_used() / vm.cpu_capacity for vm in vms)
+        self._ram_ratio = sum(vm.ram_used() / vm.ram_capacity for vm in vms)
+        self._idle_ratios = (self._cpu_ratio, self._ram_ratio)
+
+        self._index = None
+        if policy == "first-fit":
+            self._index = FirstFitIndex(vms)
+        elif policy == "best-fit":
+            self._index = BestFitIndex(vms)
+
+    @property
+    def active(self) -> int:
+        """Nombre de services présents (en attente ou en exécution)."""
+        return len(self._departures)
+
+    def _choose(self, service: Service) -> int:
+        if self._index is not None:
+            return self._index.find(service.cpu, service.ram)
+        best, best_finish = -1, float('inf')
+        for position, vm in enumerate(self.vms):
+            if vm.can_host(service):
+                finish = max(self.busy_until[position], self.now) + vm.exec_time_of(service)
+                if finish < best_finish:
+                    best, best_finish = position, finish
+        return best
+
+    def _update_ratios(self, vm: VM, cpu_before: float, ram_before: float):
+        """
+        Répercute sur les sommes l'écart entre les taux d'utilisation de la VM (exacts,
+        voir VM.release) et leurs valeurs précédentes ; sans service présent, les sommes
+        reprennent leur valeur initiale, sans résidu d'arrondi.
+        """
+        if not self._departures:
+            self._cpu_ratio, self._ram_ratio = self._idle_ratios
+            return
+        self._cpu_ratio += vm.cpu_used() / vm.cpu_capacity - cpu_before
+        self._ram_ratio += vm.ram_used() / vm.ram_capacity - ram_before
+
+    def _event(self, kind: str, service: Service, vm: Optional[VM]) -> Dict:
+        n_vms = len(self.vms)
+        return {
+            "time": self.now,
+            "event": kind,
+            "service": service.id,
+            "vm": vm.id if vm is not None else None,
+            "active": self.active,
+            "placed": self.placed,
+            "rejected": self.rejected,
+            "departed": self.departed,
+            "makespan": round(self.horizon, 2),
+            "cpu_util_%": round(self._cpu_ratio / n_vms * 100, 2),
+            "ram_util_%": round(self._ram_ratio / n_vms * 100, 2),
+        }
+
+    def advance(self, until: float) -> Iterator[Dict]:
+        """Traite les départs jusqu'à la date `until` incluse."""
+        while self._departures and self._departures[0][0] <= until:
+            finish, _, position, service = heapq.heappop(self._departures)
+            self.now = finish
+            vm = self.vms[position]
+            cpu_before, ram_before = vm.cpu_used() / vm.cpu_capacity, vm.ram_used() / vm.ram_capacity
+            vm.release(service)
+            self._update_ratios(vm, cpu_before, ram_before)
+            if self._index is not None:
+                self._index.update(position)
+            self.departed += 1
+            yield self._event("departure", service, vm)
+        if until > self.now:
+            self.now = until
+
+    def submit(self, arrival: float, service: Service) -> Dict:
+        """Place un service arrivé à la date `arrival` (les départs antérieurs doivent être traités)."""
+        if arrival < self.now:
+            raise ValueError(f"Arrivée de {service} à t={arrival} antérieure à t={self.now} (flux non trié)")
+        self.now = arrival
+        position = self._choose(service)
+        if position < 0:
+            self.rejected += 1
+            return self._event("rejected", service, None)
+
+        vm = self.vms[position]
+        cpu_before, ram_before = vm.cpu_used() / vm.cpu_capacity, vm.ram_used() / vm.ram_capacity
+        vm.assign(service)
+        finish = max(self.busy_until[position], arrival) + vm.exec_time_of(service)
+        self.busy_until[position] = finish
+        self.horizon = max(self.horizon, finish)
+        heapq.heappush(self._departures, (finish, next(self._order), position, service))
+        self._update_ratios(vm, cpu_before, ram_before)
+        if self._index is not None:
+            self._index.update(position)
+        self.placed += 1
+        return self._event("arrival", service, vm)
+
+    def run(self, stream: Iterable[Arrival], drain: bool = True) -> Iterator[Dict]:
+        """Consomme le flux et produit un événement (dict de métriques) par arrivée/départ."""
+        for arrival, service in stream:
+            yield from self.advance(arrival)
+            yield self.submit(arrival, service)
+        if drain:
+            yield from self.advance(float('inf'))
+
+
+def stream_schedule(stream: Iterable[Arrival], vms: List[VM], policy: str = "first-fit") -> Iterator[Dict]:
+    """Raccourci : OnlineScheduler(vms, policy).run(stream)."""
+    return OnlineScheduler(vms, policy).run(stream)
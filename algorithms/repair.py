@@ -0,0 +1,116 @@
+# algorithms/repair.py
+# Réparation des génomes de l'AG : les services qui surchargent une VM sont déplacés
+# vers des VMs qui ont encore la place, avant l'évaluation de la fitness.
+import numpy as np
+from typing import List, Dict
+from models.entities import Service, VM
+from algorithms.fitness import PopulationEvaluator
+
+
+class GenomeRepair:
+    """
+    Opérateur de réparation pour une instance donnée.
+
+    Pour chaque VM surchargée, ses services sont examinés du plus gros au plus petit
+    (part de la capacité de la VM) et déplacés tant qu'elle reste surchargée, vers la
+    VM qui peut les accueillir et qui les terminerait le plus tôt (temps exec_time / speed)
+    (objectif "vms" : d'abord les VMs déjà utilisées). Un service qui ne tient nulle part reste en place :
+    le génome reste alors infaisable. La réparation est déterministe.
+
+    Les charges sont calculées en une passe vectorisée pour tout le lot (voir
+    `PopulationEvaluator.vm_state`) : seuls les génomes infaisables sont parcourus.
+
+    write_back: True pour réécrire le génome réparé dans l'individu (lamarckien),
+                False pour ne l'utiliser que pour le calcul de la fitness (baldwinien)
+    """
+
+    def __init__(self, services: List[Service], vms_template: List[VM], objective: str = "makespan",
+                 write_back: bool = True, evaluator: PopulationEvaluator = None):
+        self.evaluator = evaluator or PopulationEvaluator(services, vms_template, objective)
+        self.objective = objective
+        self.write_back = write_back
+        self.n_vms = len(vms_template)
+        self.cpu = [s.cpu for s in services]
+        self.ram = [s.ram for s in services]
+        # Temps d'exécution etc[i, v] = exec_time[i] / speed[v], calculés à la demande
+        self.exec_time = [s.exec_time for s in services]
+        self.speed = [vm.speed for vm in vms_template]
+        self.cpu_capacity = [vm.cpu_capacity for vm in vms_template]
+        self.ram_capacity = [vm.ram_capacity for vm in vms_template]
+        # Statistiques cumulées
+        self.checked = 0       # génomes examinés
+        self.repaired = 0      # génomes modifiés
+        self.unrepaired = 0    # génomes restés infaisables
+        self.moves = 0         # services déplacés
+
+    def repair_all(self, genomes) -> List[List[int]]:
+        """Génomes réparés (les génomes déjà réalisables sont renvoyés tels quels)."""
+        genomes = [list(genome) for genome in genomes]
+        if not genomes:
+            return genomes
+        state = self.evaluator.vm_state(genomes)
+        overloaded = (state["cpu_free"] < 0) | (state["ram_free"] < 0)
+        self.checked += len(genomes)
+        for row in np.flatnonzero(overloaded.any(axis=1)):
+            genomes[row] = self._repair(genomes[row],
+                                        state["cpu_free"][row].tolist(),
+                                        state["ram_free"][row].tolist(),
+                                        state["completion_time"][row].tolist(),
+                                        state["count"][row].tolist())
+        return genomes
+
+    def repair(self, genome) -> List[int]:
+        """Génome réparé (voir `repair_all`)."""
+        return self.repair_all([genome])[0]
+
+    def _repair(self, genome: List[int], cpu_free: List[float], ram_free: List[float],
+                completion: List[float], count: List[int]) -> List[int]:
+        members: Dict[int, List[int]] = {}
+        for i, v in enumerate(genome):
+            if cpu_free[v] < 0 or ram_free[v] < 0:
+                members.setdefault(v, []).append(i)
+
+        moved = 0
+        for v, indices in members.items():
+            # Les plus gros services d'abord : moins de déplacements
+            indices.sort(key=lambda i: -max(self.cpu[i] / self.cpu_capacity[v],
+                                            self.ram[i] / self.ram_capacity[v]))
+            for i in indices:
+                if cpu_free[v] >= 0 and ram_free[v] >= 0:
+                    break
+                target = self._target(i, v, cpu_free, ram_free, completion, count)
+                if target < 0:
+                    continue
+                cpu_free[v] += self.cpu[i]
+                ram_free[v] += self.ram[i]
+                completion[v] -= self.exec_time[i] / self.speed[v]
+                count[v] -= 1
+                cpu_free[target] -= self.cpu[i]
+                ram_free[target] -= self.ram[i]
+                completion[target] += self.exec_time[i] / self.speed[target]
+                count[target] += 1
+                genome[i] = target
+                moved += 1
+
+        self.moves += moved
+        self.repaired += moved > 0
+        self.unrepaired += any(c < 0 for c in cpu_free) or any(r < 0 for r in ram_free)
+        return genome
+
+    def _target(self, i: int, source: int, cpu_free: List[float], ram_free: List[float],
+                completion: List[float], count: List[int]) -> int:
+        """VM qui peut accueillir le service i et le terminerait le plus tôt (-1 : aucune)."""
+        best, best_key = -1, None
+        exec_time = self.exec_time[i]
+        for v in range(self.n_vms):
+            if v == source or cpu_free[v] < self.cpu[i] or ram_free[v] < self.ram[i]:
+                continue
+            finish = completion[v] + exec_time / self.speed[v]
+            key = (count[v] == 0, finish) if self.objective == "vms" else (finish,)
+            if best_key is None or key < best_key:
+                best, best_key = v, key
+        return best
+
+    def stats(self) -> Dict[str, int]:
+        return {"checked": self.checked, "repaired": self.repaired,
+                "unrepaired": self.unrepaired, "moves": self.moves}
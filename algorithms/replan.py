@@ -0,0 +1,238 @@
+# algorithms/replan.py
+# Re-planification incrémentale : à partir d'une affectation existante (VMs remplies),
+# applique un delta de services ajoutés, retirés et redimensionnés en ne touchant que
+# les VMs concernées, avec un nombre plafonné de migrations.
+import heapq
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.entities import Service, VM
+from algorithms.min_min import INDEX_MAX_NODES
+from algorithms.vm_index import INDEX_MIN_VMS, CompletionIndex
+
+
+class Replanner:
+    """
+    État d'un plan (VMs remplies + affectation) auquel on applique des deltas successifs.
+
+    La construction parcourt une fois les services placés (index service -> VM) et
+    copie l'état des VMs dans des tableaux NumPy (CPU/RAM libres, fin d'exécution,
+    vitesse) et, à partir de INDEX_MIN_VMS VMs, dans un CompletionIndex, tenus à jour à
+    chaque modification. Ensuite, `apply` ne parcourt que le delta et les VMs
+    concernées : chaque placement ou migration est une recherche dans l'index en
+    O(log m) tant que les VMs les moins chargées ont la place, jamais une boucle Python
+    sur les VMs ou les services du plan. Comme dans Min-Min (_assign_indexed), au-delà
+    de INDEX_MAX_NODES nœuds par niveau la VM est choisie par une passe vectorisée sur
+    les tableaux, et l'index n'est réessayé qu'après un nombre de recherches qui double
+    à chaque nouvel échec : sur un plan saturé, une recherche ne coûte pas beaucoup plus
+    que cette passe. Les VMs de `vms` sont modifiées en place. `indexed=False` force la passe vectorisée (mêmes
+    décisions, pour comparaison).
+    """
+
+    def __init__(self, vms: List[VM], assignment: Optional[Dict[int, int]] = None,
+                 indexed: Optional[bool] = None):
+        self.vms = vms
+        self.services: Dict[int, Service] = {}   # services placés, par id
+        self.location: Dict[int, int] = {}       # id du service -> position de sa VM
+        for position, vm in enumerate(vms):
+            for service in vm.services:
+                self.services[service.id] = service
+                self.location[service.id] = position
+        if assignment is not None and len(assignment) != len(self.location):
+            raise ValueError(f"L'affectation ({len(assignment)} services) ne correspond pas aux "
+                             f"services hébergés par les VMs ({len(self.location)})")
+        self.assignment = {sid: vms[position].id for sid, position in self.location.items()}
+        # Mêmes valeurs que les attributs des VMs : mêmes décisions que can_host
+        self.cpu_free = np.array([vm.cpu_free for vm in vms], dtype=np.float64)
+        self.ram_free = np.array([vm.ram_free for vm in vms], dtype=np.float64)
+        self.completion = np.array([vm.completion_time for vm in vms], dtype=np.float64)
+        self.speed = np.array([vm.speed for vm in vms], dtype=np.float64)
+        if indexed is None:
+            indexed = len(vms) >= INDEX_MIN_VMS
+        self.index = CompletionIndex(vms, list(self.services.values())) if indexed and vms else None
+        self.max_nodes = INDEX_MAX_NODES * self.index.size.bit_length() if self.index else None
+        self._skip, self._backoff = 0, 1   # recherches sans l'index, prochaine mise à l'écart
+
+    def makespan(self) -> float:
+        return float(self.completion.max(initial=0.0))
+
+    def find(self, service: Service, exclude: int = -1, limit: float = np.inf) -> int:
+        """
+        Position de la VM, autre que `exclude`, qui peut héberger le service et le
+        terminerait le plus tôt (la première en cas d'égalité), -1 si aucune n'a la place
+        ou ne le terminerait strictement avant `limit`.
+        """
+        if not self.vms:
+            return -1
+        if self._skip:
+            self._skip -= 1
+        elif self.index is not None:
+            position = self.index.find_earliest(service.cpu, service.ram, service.exec_time,
+                                                self.max_nodes, exclude, limit)
+            if position is not None:
+                self._backoff = 1
+                return position
+            self._skip, self._backoff = self._backoff, 2 * self._backoff
+        fits = (self.cpu_free >= service.cpu) & (self.ram_free >= service.ram)
+        if exclude >= 0:
+            fits[exclude] = False
+        # exec_time / speed : même valeur que VM.exec_time_of
+        ends = np.where(fits, self.completion + service.exec_time / self.speed, np.inf)
+        position = int(np.argmin(ends))
+        return position if fits[position] and ends[position] < limit else -1
+
+    def apply(self, added: Iterable[Service] = (), removed: Iterable[int] = (),
+              resized: Iterable[Service] = (), max_migrations: int = 0) -> Dict:
+        """
+        Applique un delta au plan :
+          1. les services `removed` (ids) libèrent leurs ressources ;
+          2. un service `resized` (même id, nouvelles demandes) reste sur sa VM s'il y
+             tient encore, sinon il est déplacé (déplacement forcé) ;
+          3. les services ajoutés et déplacés sont placés, du plus long au plus court,
+             sur la VM qui a la place et les terminerait le plus tôt (rejetés si aucune) ;
+          4. ré-optimisation locale : tant qu'il reste des migrations (`max_migrations`),
+             la VM la plus chargée parmi les VMs concernées (et la VM qui fixe le makespan)
+             cède un service à une VM qui le terminerait avant elle.
+
+        Renvoie un rapport : nombre de services retirés / redimensionnés / placés, ids des
+        services rejetés, déplacements forcés, migrations, VMs concernées et makespan.
+
+        Le delta est validé en entier avant toute modification (ValueError pour un id
+        retiré ou redimensionné inconnu ou cité deux fois, un service ajouté déjà placé
+        ou ajouté deux fois) : en cas d'erreur, le plan et les VMs sont inchangés.
+        """
+        added, removed, resized = list(added), list(removed), list(resized)
+        self._validate(added, removed, resized)
+        affected = set()
+        pending: List[Service] = []
+        forced = {}   # id d'un service redimensionné à déplacer -> position d'origine
+        report = {"removed": 0, "resized": 0, "placed": 0, "rejected": [],
+                  "forced_moves": 0, "migrations": 0}
+
+        for sid in removed:
+            affected.add(self._release(self.services[sid]))
+            report["removed"] += 1
+        for service in resized:
+            position = self._release(self.services[service.id])
+            report["resized"] += 1
+            if self.vms[position].can_host(service):
+                self._assign(service, position)
+            else:
+                forced[service.id] = position
+                pending.append(service)
+            affected.add(position)
+        pending += added
+
+        for service in sorted(pending, key=lambda s: -s.exec_time):
+            position = self.find(service)
+            if position < 0:
+                report["rejected"].append(service.id)
+                continue
+            self._assign(service, position)
+            affected.add(position)
+            if service.id in forced:
+                report["forced_moves"] += position != forced[service.id]
+            else:
+                report["placed"] += 1
+
+        report["migrations"] = self._rebalance(affected, max_migrations)
+        report["affected_vms"] = len(affected)
+        report["makespan"] = self.makespan()
+        return report
+
+    def _validate(self, added: List[Service], removed: List[int], resized: List[Service]):
+        """Vérifie le delta sans rien modifier (voir `apply`)."""
+        changed = set()
+        for sid in removed + [service.id for service in resized]:
+            if sid not in self.location:
+                raise ValueError(f"Service inconnu : {sid}")
+            if sid in changed:
+                raise ValueError(f"Service retiré ou redimensionné deux fois : {sid}")
+            changed.add(sid)
+        gone = set(removed)
+        new = set()
+        for service in added:
+            if service.id in self.location and service.id not in gone:
+                raise ValueError(f"Service déjà placé : {service.id}")
+            if service.id in new:
+                raise ValueError(f"Service ajouté deux fois : {service.id}")
+            new.add(service.id)
+
+    def _release(self, service: Service) -> int:
+        position = self.location.pop(service.id)
+        del self.services[service.id], self.assignment[service.id]
+        self.vms[position].release(service)
+        self._sync(position)
+        return position
+
+    def _assign(self, service: Service, position: int):
+        self.vms[position].assign(service)
+        self._sync(position)
+        self.services[service.id] = service
+        self.location[service.id] = position
+        self.assignment[service.id] = self.vms[position].id
+
+    def _sync(self, position: int):
+        vm = self.vms[position]
+        self.cpu_free[position] = vm.cpu_free
+        self.ram_free[position] = vm.ram_free
+        self.completion[position] = vm.completion_time
+        if self.index is not None:
+            self.index.update(position)
+
+    def _rebalance(self, affected: set, max_migrations: int) -> int:
+        """Migrations de la ré-optimisation locale ; `affected` reçoit les VMs cibles."""
+        if max_migrations <= 0 or not self.vms:
+            return 0
+        # Tas (-fin, position) des VMs candidates ; les entrées périmées sont ignorées
+        sources = affected | {int(np.argmax(self.completion))}
+        heap = [(-self.vms[p].completion_time, p) for p in sources]
+        heapq.heapify(heap)
+        migrations = 0
+        while heap and migrations < max_migrations:
+            completion, position = heapq.heappop(heap)
+            vm = self.vms[position]
+            if -completion != vm.completion_time:
+                continue
+            move = self._best_move(position)
+            if move is None:
+                break   # la VM la plus chargée ne peut plus céder de service
+            service, target = move
+            self._release(service)
+            self._assign(service, target)
+            affected.add(target)
+            migrations += 1
+            heapq.heappush(heap, (-vm.completion_time, position))
+            heapq.heappush(heap, (-self.vms[target].completion_time, target))
+        return migrations
+
+    def _best_move(self, position: int) -> Optional[Tuple[Service, int]]:
+        """Plus long service de la VM qu'une autre VM terminerait avant elle (None : aucun)."""
+        vm = self.vms[position]
+        for service in sorted(vm.services, key=lambda s: -s.exec_time):
+            # Seules les VMs qui finiraient le service avant `vm` comptent : l'index
+            # élague les autres au lieu de chercher la meilleure pour la rejeter
+            target = self.find(service, exclude=position, limit=vm.completion_time)
+            if target >= 0:
+                return service, target
+        return None
+
+
+def replan(assignment: Dict[int, int], vms: List[VM], added: Iterable[Service] = (),
+           removed: Iterable[int] = (), resized: Iterable[Service] = (),
+           max_migrations: int = 0, planner: Optional[Replanner] = None) -> Tuple[Dict[int, int], Dict]:
+    """
+    Re-planifie une affectation existante après un delta de services (voir
+    Replanner.apply) ; `vms` (les VMs remplies du plan précédent) est modifié en place.
+    Renvoie (nouvelle affectation, rapport).
+
+    Sans `planner`, chaque appel construit un Replanner, en O(taille du plan) : le coût
+    ne dépend de la taille du delta que pour un appel isolé. Pour des deltas successifs
+    sur un même plan, passer le Replanner construit une fois sur `vms` (ou appeler
+    directement planner.apply) : l'appel ne parcourt alors que le delta.
+    """
+    if planner is None:
+        planner = Replanner(vms, assignment)
+    elif planner.vms is not vms:
+        raise ValueError("Le Replanner fourni ne porte pas sur ces VMs")
+    report = planner.apply(added, removed, resized, max_migrations)
+    return planner.assignment, report
@@ -0,0 +1,274 @@
+# algorithms/sharded.py
+# Ordonnancement partitionné pour les très grandes flottes : les VMs sont découpées en
+# zones, les services répartis entre les zones, chaque zone est résolue indépendamment
+# (en parallèle, avec n'importe quel algorithme du registre), puis les affectations sont
+# fusionnées et rééquilibrées entre zones.
+import heapq
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Hashable, List, Optional, Tuple
+from models.entities import Service, VM
+from algorithms import get_algorithm, METAHEURISTICS
+from utils import instrumentation
+
+PARTITIONS = ("stratified", "capacity")
+
+# Nombre de VMs visé par zone quand n_zones n'est pas donné
+ZONE_SIZE = 500
+
+# Services rejetés présentés à la fois à l'étape inter-zones, entre deux filtrages
+REBALANCE_CHUNK = 1024
+
+# Zones essayées au plus par service lors de la répartition (les moins chargées d'abord)
+SPLIT_ATTEMPTS = 8
+
+
+def partition_vms(vms: List[VM], n_zones: Optional[int] = None, partition: str = "stratified",
+                  zones: Optional[Dict[int, Hashable]] = None) -> List[List[int]]:
+    """
+    Positions des VMs de chaque zone.
+
+    Args:
+        n_zones: nombre de zones (défaut : une zone par ZONE_SIZE VMs)
+        partition: "stratified" (VMs triées par capacité puis distribuées à tour de rôle :
+                   chaque zone a le même profil de capacités que la flotte) ou "capacity"
+                   (tranches consécutives de la liste triée : une zone par classe de capacité)
+        zones: zone explicite de chaque VM (id de VM -> identifiant de zone) ; remplace
+               n_zones et partition
+    """
+    if zones is not None:
+        missing = [vm.id for vm in vms if vm.id not in zones]
+        if missing:
+            raise ValueError(f"VMs sans zone : {missing[:10]}")
+        groups: Dict[Hashable, List[int]] = {}
+        for position, vm in enumerate(vms):
+            groups.setdefault(zones[vm.id], []).append(position)
+        return list(groups.values())
+    if partition not in PARTITIONS:
+        raise ValueError(f"Partition inconnue : {partition} (attendu : {', '.join(PARTITIONS)})")
+    if n_zones is None:
+        n_zones = -(-len(vms) // ZONE_SIZE)
+    n_zones = max(1, min(n_zones, len(vms)))
+    order = sorted(range(len(vms)), key=lambda p: (vms[p].cpu_capacity, vms[p].ram_capacity, vms[p].speed))
+    if partition == "stratified":
+        return [sorted(order[z::n_zones]) for z in range(n_zones)]
+    size = -(-len(order) // n_zones)
+    return [sorted(order[start:start + size]) for start in range(0, len(order), size)]
+
+
+def split_services(services: List[Service], vms: List[VM],
+                   zones: List[List[int]]) -> Tuple[List[List[int]], List[int]]:
+    """
+    Répartition rapide des services entre les zones : du plus long au plus court, chaque
+    service va à la zone la moins chargée (travail reçu / somme des vitesses de ses VMs)
+    qui a encore assez de CPU et de RAM au total et dont une VM au moins est assez grande
+    (parmi les SPLIT_ATTEMPTS zones les moins chargées).
+
+    Renvoie (indices des services de chaque zone, dans l'ordre de la liste ; indices des
+    services qu'aucune zone ne peut plus recevoir).
+    """
+    cpu_left = [sum(vms[p].cpu_capacity for p in zone) for zone in zones]
+    ram_left = [sum(vms[p].ram_capacity for p in zone) for zone in zones]
+    max_cpu = [max(vms[p].cpu_capacity for p in zone) for zone in zones]
+    max_ram = [max(vms[p].ram_capacity for p in zone) for zone in zones]
+    speed = [sum(vms[p].speed for p in zone) for zone in zones]
+    min_cpu = min((s.cpu for s in services), default=0.0)
+    min_ram = min((s.ram for s in services), default=0.0)
+
+    members: List[List[int]] = [[] for _ in zones]
+    overflow = []
+    heap = [(0.0, z) for z in range(len(zones))]   # (charge, zone)
+    for i in sorted(range(len(services)), key=lambda i: -services[i].exec_time):
+        service = services[i]
+        skipped, chosen = [], None
+        while heap and len(skipped) < SPLIT_ATTEMPTS:
+            load, z = heapq.heappop(heap)
+            if (cpu_left[z] >= service.cpu and ram_left[z] >= service.ram
+                    and max_cpu[z] >= service.cpu and max_ram[z] >= service.ram):
+                chosen = (load, z)
+                break
+            # Zone pleine pour tous les services : elle n'est pas remise dans le tas
+            if cpu_left[z] >= min_cpu and ram_left[z] >= min_ram:
+                skipped.append((load, z))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        if chosen is None:
+            overflow.append(i)
+            continue
+        load, z = chosen
+        members[z].append(i)
+        cpu_left[z] -= service.cpu
+        ram_left[z] -= service.ram
+        heapq.heappush(heap, (load + service.exec_time / speed[z], z))
+    return [sorted(zone) for zone in members], sorted(overflow)
+
+
+def _fits_somewhere(cpu: np.ndarray, ram: np.ndarray, cpu_free: np.ndarray, ram_free: np.ndarray) -> np.ndarray:
+    """
+    Pour chaque demande (cpu, ram), existe-t-il une VM avec assez de CPU et de RAM libres ?
+    Escalier des VMs triées par CPU libre décroissant (RAM libre maximale cumulée), sans
+    comparer chaque demande à chaque VM.
+    """
+    order = np.argsort(-cpu_free, kind="stable")
+    best_ram = np.maximum.accumulate(ram_free[order])
+    # Nombre de VMs avec cpu_free >= cpu (cpu_free trié par ordre décroissant)
+    count = np.searchsorted(-cpu_free[order], -cpu, side="right")
+    return (count > 0) & (best_ram[np.maximum(count - 1, 0)] >= ram)
+
+
+def _solve_zone(name: str, services: List[Service], vms_template: List[VM],
+                params: Dict) -> Tuple[List[List[int]], List[tuple], float]:
+    """
+    Résout une zone. Renvoie, pour chaque VM de la zone, les indices (dans la liste de la
+    zone) de ses services dans l'ordre où ils ont été placés et son état final
+    (VM.snapshot) : la fusion reconstruit les VMs sans rejouer les affectations. Renvoie
+    aussi la durée de la résolution.
+    """
+    start = time.perf_counter()
+    if not services:
+        return [[] for _ in vms_template], [vm.snapshot() for vm in vms_template], 0.0
+    algo = get_algorithm(name)
+    if name in METAHEURISTICS:
+        _, vms = algo(services, vms_template, **params)
+    else:
+        vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+        algo(services.copy(), vms)
+    index = {service.id: i for i, service in enumerate(services)}
+    placements = [[index[service.id] for service in vm.services] for vm in vms]
+    return placements, [vm.snapshot() for vm in vms], time.perf_counter() - start
+
+
+def _solve_zone_columns(task) -> Tuple[List[List[int]], List[tuple], float]:
+    """
+    _solve_zone dans un processus du pool. La zone arrive en colonnes NumPy (ids, CPU,
+    RAM, durées des services ; ids, capacités, vitesses des VMs) : les envoyer coûte bien
+    moins cher que de sérialiser un objet par service, et les objets sont reconstruits
+    ici, en parallèle.
+    """
+    name, service_columns, vm_columns, params = task
+    services = [Service(*values) for values in zip(*(column.tolist() for column in service_columns))]
+    vms_template = [VM(*values) for values in zip(*(column.tolist() for column in vm_columns))]
+    return _solve_zone(name, services, vms_template, params)
+
+
+def sharded_schedule(services: List[Service], vms_template: List[VM],
+                     algorithm: str = "min-min",
+                     n_zones: Optional[int] = None,
+                     partition: str = "stratified",
+                     zones: Optional[Dict[int, Hashable]] = None,
+                     workers: Optional[int] = None,
+                     max_migrations: int = 1000,
+                     params: Optional[Dict] = None,
+                     stats: Optional[dict] = None) -> Tuple[Dict[int, int], List[VM]]:
+    """
+    Ordonnancement partitionné : le coût de chaque algorithme dépend du produit
+    services x VMs de chaque zone, pas de celui de la flotte entière.
+
+      1. partition des VMs en zones (`partition_vms`) ;
+      2. répartition des services entre les zones (`split_services`) ;
+      3. résolution de chaque zone avec `algorithm` (nom du registre, `params` transmis
+         aux métaheuristiques), dans `workers` processus (défaut : un par CPU ; 1 : dans
+         le processus courant) ;
+      4. fusion des affectations, puis étape inter-zones (algorithms/replan.py) : les
+         services rejetés par leur zone ou par la répartition sont placés sur la VM de
+         toute la flotte qui les terminerait le plus tôt, et la VM qui fixe le makespan
+         cède jusqu'à `max_migrations` services à n'importe quelle VM de la flotte (de
+         sa zone ou d'une autre) qui les terminerait avant elle.
+
+    Renvoie (affectation, VMs remplies) comme les métaheuristiques ; `vms_template`
+    n'est pas modifié. `stats` reçoit "zones", "zone_services", "zone_vms", "overflow",
+    "rejected_by_zones", "replan" (rapport de Replanner.apply) et les durées des étapes
+    "partition_s", "solve_s", "merge_s", "rebalance_s", ainsi que "zone_solve_s" (durée de
+    résolution de chaque zone, mesurée dans son processus).
+    """
+    from algorithms.replan import Replanner
+
+    params = params or {}
+    vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+    if not services or not vms:
+        return {}, vms
+
+    start = time.perf_counter()
+    with instrumentation.phase("sharded.partition"):
+        zone_vms = partition_vms(vms, n_zones, partition, zones)
+        zone_services, overflow = split_services(services, vms, zone_vms)
+    partition_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with instrumentation.phase("sharded.solve"):
+        if workers is None:
+            workers = min(len(zone_vms), os.cpu_count() or 1)
+        if workers > 1:
+            columns = [np.array(values) for values in
+                       zip(*((s.id, s.cpu, s.ram, s.exec_time) for s in services))]
+            vm_columns = [np.array(values) for values in
+                          zip(*((vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms))]
+            tasks = [(algorithm, [column[members] for column in columns],
+                      [column[positions] for column in vm_columns], params)
+                     for members, positions in zip(zone_services, zone_vms)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_solve_zone_columns, tasks))
+        else:
+            results = [_solve_zone(algorithm, [services[i] for i in members], [vms[p] for p in positions], params)
+                       for members, positions in zip(zone_services, zone_vms)]
+    solve_time = time.perf_counter() - start
+
+    # Fusion : chaque VM de la flotte reprend les services et l'état final de sa VM de zone
+    start = time.perf_counter()
+    with instrumentation.phase("sharded.merge"):
+        assignment = {}
+        placed = [False] * len(services)
+        for members, positions, (placements, snapshots, _) in zip(zone_services, zone_vms, results):
+            for position, indices, snapshot in zip(positions, placements, snapshots):
+                vm = vms[position]
+                hosted = [members[i] for i in indices]
+                vm.restore([services[i] for i in hosted], snapshot)
+                for i in hosted:
+                    assignment[services[i].id] = vm.id
+                    placed[i] = True
+        rejected = [service for service, ok in zip(services, placed) if not ok]
+    merge_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with instrumentation.phase("sharded.rebalance"):
+        planner = Replanner(vms, assignment)
+        # Les ressources libres ne font que diminuer pendant les placements : un service
+        # qu'aucune VM ne peut héberger maintenant ne sera placé nulle part. Les rejetés
+        # (du plus long au plus court) sont placés par paquets, chacun précédé d'un
+        # filtrage vectorisé : sur une flotte saturée, seuls les services qui ont encore
+        # une chance coûtent une recherche sur toute la flotte
+        rejected.sort(key=lambda s: -s.exec_time)
+        cpu = np.array([s.cpu for s in rejected], dtype=np.float64)
+        ram = np.array([s.ram for s in rejected], dtype=np.float64)
+        remaining = np.arange(len(rejected))
+        placed_count, still_rejected = 0, []
+        while remaining.size:
+            fits = _fits_somewhere(cpu[remaining], ram[remaining], planner.cpu_free, planner.ram_free)
+            still_rejected += [rejected[i].id for i in remaining[~fits].tolist()]
+            remaining = remaining[fits]
+            chunk, remaining = remaining[:REBALANCE_CHUNK], remaining[REBALANCE_CHUNK:]
+            chunk_report = planner.apply(added=[rejected[i] for i in chunk.tolist()])
+            placed_count += chunk_report["placed"]
+            still_rejected += chunk_report["rejected"]
+        report = planner.apply(max_migrations=max_migrations)
+        report["placed"] = placed_count
+        report["rejected"] = still_rejected
+    rebalance_time = time.perf_counter() - start
+
+    if stats is not None:
+        stats.update({
+            "zones": len(zone_vms),
+            "zone_services": [len(members) for members in zone_services],
+            "zone_vms": [len(positions) for positions in zone_vms],
+            "overflow": len(overflow),
+            "rejected_by_zones": len(rejected) - len(overflow),
+            "replan": report,
+            "partition_s": partition_time,
+            "solve_s": solve_time,
+            "zone_solve_s": [elapsed for _, _, elapsed in results],
+            "merge_s": merge_time,
+            "rebalance_s": rebalance_time,
+        })
+    return planner.assignment, vms
@@ -0,0 +1,300 @@
+# algorithms/vm_index.py
+# Index de faisabilité sur les VMs : « première VM qui convient » et « VM qui convient et
+# termine le service le plus tôt » (arbres de segments), « VM la plus serrée qui convient »
+# (liste triée par blocs avec élagage par capacité)
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Optional
+from models.entities import Service, VM
+
+# En dessous de ce nombre de VMs, le parcours linéaire reste le plus rapide
+INDEX_MIN_VMS = 64
+
+
+def _scale(values) -> float:
+    values = list(values)
+    mean = sum(values) / len(values) if values else 0
+    return 1.0 / mean if mean > 0 else 1.0
+
+
+class FirstFitIndex:
+    """
+    Répond à « première VM (dans l'ordre de la liste) qui peut héberger ce service ».
+
+    Chaque nœud de l'arbre garde, pour son intervalle de VMs, le CPU libre max, la
+    RAM libre max et le max de min(cpu_free * a, ram_free * b) (marge « équilibrée »,
+    a et b normalisant par la demande moyenne). Une VM qui peut héberger le service
+    vérifie les trois bornes ; un sous-arbre qui en viole une est élagué. La troisième
+    borne évite d'explorer les VMs presque pleines dont il reste du CPU *ou* de la RAM.
+
+    La recherche descend à gauche d'abord : la VM trouvée est la même que celle d'un
+    parcours linéaire avec `can_host`. Après `vm.assign(...)`, appeler
+    `update(position)` pour propager les nouvelles capacités libres.
+    """
+
+    def __init__(self, vms: List[VM], services: Optional[List[Service]] = None):
+        self.vms = vms
+        if services:
+            self.cpu_scale = _scale(s.cpu for s in services)
+            self.ram_scale = _scale(s.ram for s in services)
+        else:
+            self.cpu_scale = _scale(vm.cpu_capacity for vm in vms)
+            self.ram_scale = _scale(vm.ram_capacity for vm in vms)
+
+        size = 1
+        while size < len(vms):
+            size *= 2
+        self.size = size
+        self._allocate()
+        for i in range(len(vms)):
+            self._set_leaf(i)
+        for node in range(size - 1, 0, -1):
+            self._pull(node)
+
+    def _allocate(self):
+        self.max_cpu = [float('-inf')] * (2 * self.size)
+        self.max_ram = [float('-inf')] * (2 * self.size)
+        self.max_balance = [float('-inf')] * (2 * self.size)
+
+    def _set_leaf(self, position: int):
+        vm = self.vms[position]
+        node = self.size + position
+        self.max_cpu[node] = vm.cpu_free
+        self.max_ram[node] = vm.ram_free
+        self.max_balance[node] = min(vm.cpu_free * self.cpu_scale, vm.ram_free * self.ram_scale)
+
+    def _pull(self, node: int):
+        left, right = 2 * node, 2 * node + 1
+        for values in (self.max_cpu, self.max_ram, self.max_balance):
+            values[node] = values[left] if values[left] > values[right] else values[right]
+
+    def update(self, position: int):
+        """Met à jour l'index après une modification des ressources libres de vms[position]."""
+        self._set_leaf(position)
+        node = (self.size + position) // 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def find(self, cpu: float, ram: float) -> int:
+        """Position de la première VM avec cpu_free >= cpu et ram_free >= ram (-1 si aucune)."""
+        max_cpu, max_ram, max_balance, size = self.max_cpu, self.max_ram, self.max_balance, self.size
+        # La multiplication par un facteur positif est monotone (y compris en flottant) :
+        # cpu_free >= cpu et ram_free >= ram impliquent balance(VM) >= balance(service)
+        balance = min(cpu * self.cpu_scale, ram * self.ram_scale)
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if max_cpu[node] < cpu or max_ram[node] < ram or max_balance[node] < balance:
+                continue
+            if node >= size:
+                return node - size
+            stack.append(2 * node + 1)
+            stack.append(2 * node)  # le fils gauche est exploré en premier
+        return -1
+
+
+class CompletionIndex(FirstFitIndex):
+    """
+    Répond à « VM qui peut héberger ce service et le terminerait le plus tôt » au sens de
+    Min-Min / Max-Min : plus petite valeur de completion_time + exec_time / speed (mêmes
+    opérations flottantes que la ligne ETC), la première dans l'ordre de la liste en cas
+    d'égalité.
+
+    En plus des bornes de capacité de FirstFitIndex, chaque nœud garde la plus petite
+    fin d'exécution et la plus grande vitesse de son intervalle. completion_min +
+    exec_time / speed_max minore (en flottant aussi : addition et division sont
+    monotones) la fin du service sur chaque VM du nœud. La recherche explore les nœuds
+    par (minorant, première position) croissants : la première feuille atteinte est
+    celle de l'argmin NumPy masqué par la faisabilité, égalités comprises. Avec des
+    vitesses identiques, le minorant est exact et la recherche suit un seul chemin tant
+    que les VMs les moins chargées ont la place ; sur une flotte presque pleine, les
+    bornes de capacité n'élaguent plus et la recherche peut visiter presque tout l'arbre,
+    d'où le plafond `max_nodes`. Après `vm.assign(...)`, appeler `update(position)`.
+    """
+
+    def _allocate(self):
+        super()._allocate()
+        self.min_completion = [float('inf')] * (2 * self.size)
+        self.max_speed = [1.0] * (2 * self.size)
+
+    def _set_leaf(self, position: int):
+        super()._set_leaf(position)
+        vm = self.vms[position]
+        self.min_completion[self.size + position] = vm.completion_time
+        self.max_speed[self.size + position] = vm.speed
+
+    def _pull(self, node: int):
+        super()._pull(node)
+        left, right = 2 * node, 2 * node + 1
+        completion, speed = self.min_completion, self.max_speed
+        completion[node] = completion[left] if completion[left] < completion[right] else completion[right]
+        speed[node] = speed[left] if speed[left] > speed[right] else speed[right]
+
+    def update(self, position: int):
+        # Même remontée que FirstFitIndex.update, les cinq valeurs par nœud en une boucle
+        # (appelée après chaque placement ou retrait)
+        self._set_leaf(position)
+        max_cpu, max_ram, max_balance = self.max_cpu, self.max_ram, self.max_balance
+        completion, speed = self.min_completion, self.max_speed
+        node = (self.size + position) // 2
+        while node:
+            left = 2 * node
+            right = left + 1
+            a, b = max_cpu[left], max_cpu[right]
+            max_cpu[node] = a if a > b else b
+            a, b = max_ram[left], max_ram[right]
+            max_ram[node] = a if a > b else b
+            a, b = max_balance[left], max_balance[right]
+            max_balance[node] = a if a > b else b
+            a, b = completion[left], completion[right]
+            completion[node] = a if a < b else b
+            a, b = speed[left], speed[right]
+            speed[node] = a if a > b else b
+            node //= 2
+
+    def find_earliest(self, cpu: float, ram: float, exec_time: float,
+                      max_nodes: Optional[int] = None, exclude: int = -1,
+                      limit: float = float('inf')) -> Optional[int]:
+        """
+        Position de la VM avec cpu_free >= cpu et ram_free >= ram qui minimise
+        completion_time + exec_time / speed (la première à égalité ; -1 si aucune).
+        La VM `exclude` est ignorée, et -1 est renvoyé si la meilleure fin n'est pas
+        strictement inférieure à `limit` (les nœuds au-delà sont élagués).
+        None si la recherche a dû explorer plus de `max_nodes` nœuds sans conclure.
+        """
+        max_cpu, max_ram, max_balance, size = self.max_cpu, self.max_ram, self.max_balance, self.size
+        completion, speed = self.min_completion, self.max_speed
+        balance = min(cpu * self.cpu_scale, ram * self.ram_scale)
+        if max_cpu[1] < cpu or max_ram[1] < ram or max_balance[1] < balance:
+            return -1
+        # (minorant de la fin d'exécution, première position du nœud, largeur, nœud)
+        heap = [(completion[1] + exec_time / speed[1], 0, size, 1)]
+        visited = 0
+        while heap:
+            bound, start, width, node = heapq.heappop(heap)
+            if bound >= limit:
+                return -1
+            visited += 1
+            if max_nodes is not None and visited > max_nodes:
+                return None
+            if node >= size:
+                if start == exclude:
+                    continue
+                return start
+            width //= 2
+            for child, child_start in ((2 * node, start), (2 * node + 1, start + width)):
+                if max_cpu[child] < cpu or max_ram[child] < ram or max_balance[child] < balance:
+                    continue
+                heapq.heappush(heap, (completion[child] + exec_time / speed[child], child_start, width, child))
+        return -1
+
+
+class BestFitIndex:
+    """
+    Répond à « VM la plus serrée qui peut héberger ce service » au sens de `best_fit` :
+    plus petite valeur de cpu_free + ram_free, la première dans l'ordre de la liste
+    en cas d'égalité.
+
+    Les VMs sont triées par (cpu_free + ram_free, position) dans une liste découpée
+    en blocs. Une VM qui peut héberger le service a forcément une clé >= cpu + ram :
+    la recherche commence à cette borne et parcourt les clés croissantes. Chaque
+    bloc garde le CPU libre max, la RAM libre max et la marge équilibrée max de ses
+    VMs, ce qui permet de sauter les blocs entiers qui ne peuvent pas convenir.
+    Après `vm.assign(...)`, appeler `update(position)`.
+    """
+
+    BLOCK_SIZE = 64
+
+    def __init__(self, vms: List[VM], services: Optional[List[Service]] = None):
+        self.vms = vms
+        if services:
+            self.cpu_scale = _scale(s.cpu for s in services)
+            self.ram_scale = _scale(s.ram for s in services)
+        else:
+            self.cpu_scale = _scale(vm.cpu_capacity for vm in vms)
+            self.ram_scale = _scale(vm.ram_capacity for vm in vms)
+
+        # Valeurs indexées de chaque VM (clé de tri, CPU libre, RAM libre, marge équilibrée)
+        self.keys = [0.0] * len(vms)
+        self.cpu_free = [0.0] * len(vms)
+        self.ram_free = [0.0] * len(vms)
+        self.balance = [0.0] * len(vms)
+        for i in range(len(vms)):
+            self._read(i)
+        entries = sorted((key, i) for i, key in enumerate(self.keys))
+        self.blocks = [entries[j:j + self.BLOCK_SIZE] for j in range(0, len(entries), self.BLOCK_SIZE)]
+        self.firsts = [block[0] for block in self.blocks]
+        self.summaries = [self._summary(block) for block in self.blocks]
+
+    def _read(self, position: int):
+        vm = self.vms[position]
+        self.keys[position] = vm.cpu_free + vm.ram_free
+        self.cpu_free[position] = vm.cpu_free
+        self.ram_free[position] = vm.ram_free
+        self.balance[position] = min(vm.cpu_free * self.cpu_scale, vm.ram_free * self.ram_scale)
+
+    def _summary(self, block) -> list:
+        positions = [position for _, position in block]
+        return [max(map(self.cpu_free.__getitem__, positions)),
+                max(map(self.ram_free.__getitem__, positions)),
+                max(map(self.balance.__getitem__, positions))]
+
+    def _block_of(self, entry) -> int:
+        return max(0, bisect_right(self.firsts, entry) - 1)
+
+    def update(self, position: int):
+        """Repositionne vms[position] après une modification de ses ressources libres."""
+        old = (self.keys[position], position)
+        b = self._block_of(old)
+        block = self.blocks[b]
+        del block[bisect_left(block, old)]
+        if block:
+            self.firsts[b] = block[0]
+            summary = self.summaries[b]
+            # Le résumé du bloc n'est recalculé que si la VM retirée en portait un maximum
+            if (self.cpu_free[position] >= summary[0] or self.ram_free[position] >= summary[1]
+                    or self.balance[position] >= summary[2]):
+                self.summaries[b] = self._summary(block)
+        else:
+            del self.blocks[b], self.firsts[b], self.summaries[b]
+
+        self._read(position)
+        new = (self.keys[position], position)
+        if not self.blocks:
+            self.blocks.append([new])
+            self.firsts.append(new)
+            self.summaries.append(self._summary([new]))
+            return
+        b = self._block_of(new)
+        block = self.blocks[b]
+        insort(block, new)
+        self.firsts[b] = block[0]
+        if len(block) > 2 * self.BLOCK_SIZE:
+            half = len(block) // 2
+            self.blocks[b:b + 1] = [block[:half], block[half:]]
+            self.firsts[b:b + 1] = [block[0], block[half]]
+            self.summaries[b:b + 1] = [self._summary(block[:half]), self._summary(block[half:])]
+        else:
+            summary = self.summaries[b]
+            summary[0] = max(summary[0], self.cpu_free[position])
+            summary[1] = max(summary[1], self.ram_free[position])
+            summary[2] = max(summary[2], self.balance[position])
+
+    def find(self, cpu: float, ram: float) -> int:
+        """Position de la VM la plus serrée avec cpu_free >= cpu et ram_free >= ram (-1 si aucune)."""
+        lower = (cpu + ram, -1)
+        balance = min(cpu * self.cpu_scale, ram * self.ram_scale)
+        cpu_free, ram_free = self.cpu_free, self.ram_free
+        first_block = self._block_of(lower)
+        for b in range(first_block, len(self.blocks)):
+            max_cpu, max_ram, max_balance = self.summaries[b]
+            if max_cpu < cpu or max_ram < ram or max_balance < balance:
+                continue
+            block = self.blocks[b]
+            start = bisect_left(block, lower) if b == first_block else 0
+            for k in range(start, len(block)):
+                position = block[k][1]
+                if cpu_free[position] >= cpu and ram_free[position] >= ram:
+                    return position
+        return -1
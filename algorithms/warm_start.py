@@ -0,0 +1,135 @@
+# algorithms/warm_start.py
+# Démarrage à chaud de l'AG : génomes construits à partir des heuristiques (First-Fit,
+# Best-Fit, Min-Min, Max-Min) et variantes perturbées de ceux-ci.
+import random
+from typing import List, Optional
+from models.entities import Service, VM
+from algorithms import get_algorithm
+
+WARM_START_HEURISTICS = ("first-fit", "best-fit", "min-min", "max-min")
+
+# Probabilité de déplacer chaque service dans une variante perturbée
+PERTURBATION_RATE = 0.05
+
+
+def heuristic_genome(name: str, services: List[Service], vms_template: List[VM], rng=random) -> List[int]:
+    """
+    Génome (position de VM par service) correspondant à la solution d'une heuristique.
+    Les services rejetés par l'heuristique sont placés sur une VM tirée au hasard.
+    """
+    vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+    assignment = get_algorithm(name)(services.copy(), vms)
+    position = {vm.id: i for i, vm in enumerate(vms_template)}
+    n_vms = len(vms_template)
+    return [position[assignment[s.id]] if s.id in assignment else rng.randint(0, n_vms - 1)
+            for s in services]
+
+
+def perturb(genome: List[int], services: List[Service], vms_template: List[VM],
+            rng=random, rate: float = PERTURBATION_RATE) -> List[int]:
+    """
+    Variante d'un génome : chaque service est déplacé avec la probabilité `rate` vers une
+    VM tirée au hasard parmi celles qui ont encore la place de l'accueillir. Une
+    variante d'un génome réalisable reste donc réalisable.
+    """
+    cpu_free = [vm.cpu_capacity for vm in vms_template]
+    ram_free = [vm.ram_capacity for vm in vms_template]
+    for s, v in zip(services, genome):
+        cpu_free[v] -= s.cpu
+        ram_free[v] -= s.ram
+
+    variant = list(genome)
+    n_vms = len(vms_template)
+    for i, s in enumerate(services):
+        if rng.random() >= rate:
+            continue
+        target = rng.randrange(n_vms)
+        # Première VM (en partant d'une position aléatoire) qui peut accueillir le service
+        for offset in range(n_vms):
+            v = (target + offset) % n_vms
+            if v != variant[i] and cpu_free[v] >= s.cpu and ram_free[v] >= s.ram:
+                old = variant[i]
+                cpu_free[old] += s.cpu
+                ram_free[old] += s.ram
+                cpu_free[v] -= s.cpu
+                ram_free[v] -= s.ram
+                variant[i] = v
+                break
+    return variant
+
+
+def rebalance(genome: List[int], services: List[Service], vms_template: List[VM],
+              rng=random, max_moves: Optional[int] = None) -> List[int]:
+    """
+    Rééquilibrage glouton d'un génome réalisable : tant que c'est possible, un service
+    (tiré au hasard) de la VM la plus chargée est déplacé vers la VM qui peut l'accueillir
+    et qui le terminerait le plus tôt, si cela termine avant la VM la plus chargée.
+    Les heuristiques remplissent les VMs dans l'ordre : cela ramène leur makespan
+    vers celui d'une répartition équilibrée sans perdre la réalisabilité.
+    """
+    n_vms = len(vms_template)
+    speed = [vm.speed for vm in vms_template]
+    cpu_free = [vm.cpu_capacity for vm in vms_template]
+    ram_free = [vm.ram_capacity for vm in vms_template]
+    completion = [0.0] * n_vms
+    members: List[List[int]] = [[] for _ in range(n_vms)]
+    for i, (s, v) in enumerate(zip(services, genome)):
+        cpu_free[v] -= s.cpu
+        ram_free[v] -= s.ram
+        completion[v] += s.exec_time / speed[v]
+        members[v].append(i)
+
+    variant = list(genome)
+    for _ in range(len(services) if max_moves is None else max_moves):
+        busiest = max(range(n_vms), key=completion.__getitem__)
+        candidates = members[busiest][:]
+        rng.shuffle(candidates)
+        moved = False
+        for i in candidates:
+            s = services[i]
+            best, best_finish = -1, completion[busiest]
+            for v in range(n_vms):
+                if v != busiest and cpu_free[v] >= s.cpu and ram_free[v] >= s.ram \
+                        and completion[v] + s.exec_time / speed[v] < best_finish:
+                    best, best_finish = v, completion[v] + s.exec_time / speed[v]
+            if best >= 0:
+                members[busiest].remove(i)
+                members[best].append(i)
+                cpu_free[busiest] += s.cpu
+                ram_free[busiest] += s.ram
+                completion[busiest] -= s.exec_time / speed[busiest]
+                cpu_free[best] -= s.cpu
+                ram_free[best] -= s.ram
+                completion[best] += s.exec_time / speed[best]
+                variant[i] = best
+                moved = True
+                break
+        if not moved:
+            break
+    return variant
+
+
+def seed_genomes(services: List[Service], vms_template: List[VM], count: int,
+                 rng=random, perturbation: float = PERTURBATION_RATE) -> List[List[int]]:
+    """
+    `count` génomes de départ : d'abord les solutions distinctes des heuristiques, puis des
+    variantes prises tour à tour sur chaque heuristique, une sur deux perturbée (voir
+    `perturb`) et l'autre perturbée puis rééquilibrée (voir `rebalance`).
+    """
+    if count <= 0 or not services:
+        return []
+    bases: List[List[int]] = []
+    for name in WARM_START_HEURISTICS:
+        genome = heuristic_genome(name, services, vms_template, rng)
+        if genome not in bases:
+            bases.append(genome)
+
+    genomes = [list(genome) for genome in bases[:count]]
+    k = 0
+    while len(genomes) < count:
+        variant = perturb(bases[k % len(bases)], services, vms_template, rng, perturbation)
+        if k % 2 == 0:
+            variant = rebalance(variant, services, vms_template, rng)
+        genomes.append(variant)
+        k += 1
+    return genomes
@@ -1,16 +1,27 @@
 import streamlit as st
-import time
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+import time
+
+from utils.helpers import load_data, compute_metrics, run_algorithm, run_algorithms_concurrently
+from utils import instrumentation
+from utils.instrumentation import profiling
+from utils.cache import SolveCache, MISSING
+from algorithms import METAHEURISTICS
+from algorithms.bounds import makespan_lower_bound, CancelToken
+from algorithms.fitness import INFEASIBLE_FITNESS
+from algorithms.nsga2 import pareto_solution, select_tradeoff
+from algorithms.local_search import local_search as improve
+
+
+@st.cache_resource
+def get_solve_cache() -> SolveCache:
+    """Cache des instances et des résultats, partagé par toutes les sessions et ré-exécutions."""
+    return SolveCache(max_instances=16, max_results=64)
+
 
-from utils.helpers import load_data, generate_random_data, compute_metrics
-from algorithms.first_fit import first_fit
-from algorithms.best_fit import best_fit
-from algorithms.min_min import min_min
-from algorithms.max_min import max_min
-from algorithms.genetic import genetic_algorithm
-from models.entities import VM
+solve_cache = get_solve_cache()
 
 # Configuration de la page
 st.set_page_config(page_title="Cloud Scheduling Algorithms", layout="wide")
@@ -23,15 +34,15 @@ with st.sidebar:
     algo_choice = st.selectbox(
         "Choisissez un algorithme",
         options=[
-            ("First-Fit", "first-fit", first_fit),
-            ("Best-Fit", "best-fit", best_fit),
-            ("Min-Min", "min-min", min_min),
-            ("Max-Min", "max-min", max_min),
-            ("Genetic Algorithm (GA)", "genetic algorithm", genetic_algorithm),
+            ("First-Fit", "first-fit"),
+            ("Best-Fit", "best-fit"),
+            ("Min-Min", "min-min"),
+            ("Max-Min", "max-min"),
+            ("Genetic Algorithm (GA)", "genetic algorithm"),
         ],
         format_func=lambda x: x[0]
     )
-    algo_display_name, algo_name, algo_function = algo_choice
+    algo_display_name, algo_name = algo_choice
 
     st.markdown("---")
     st.subheader("Données d'entrée")
@@ -55,6 +66,7 @@ with st.sidebar:
                 ("Minimiser le Makespan (temps)", "makespan"),
                 ("Minimiser les VMs utilisées", "vms"),
                 ("Hybride (70% temps + 30% VMs)", "hybrid"),
+                ("Front de Pareto (NSGA-II)", "pareto"),
             ],
             format_func=lambda x: x[0],
             help="Choisissez ce que vous voulez optimiser"
@@ -65,50 +77,243 @@ with st.sidebar:
             ga_pop_size = st.slider("Taille population", min_value=20, max_value=200, value=100, step=10)
         with col2:
             ga_generations = st.slider("Générations", min_value=50, max_value=500, value=200, step=50)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            ga_tolerance = st.slider("Tolérance / borne (%)", min_value=0.0, max_value=10.0, value=0.0, step=0.5,
+                                     help="Arrêt dès que le meilleur individu est à moins de ce pourcentage "
+                                          "de la borne inférieure")
+        with col2:
+            ga_stall = st.number_input("Arrêt sans amélioration (générations)", min_value=0, value=0, step=10,
+                                       help="0 : désactivé")
+        ga_warm_start = st.slider("Démarrage à chaud (% de la population)", min_value=0, max_value=50, value=0, step=5,
+                                  help="Part de la population initiale construite à partir des heuristiques "
+                                       "(First-Fit, Best-Fit, Min-Min, Max-Min) et de variantes perturbées")
+        ga_repair = st.checkbox("Réparer les génomes infaisables", value=True,
+                                help="Avant l'évaluation, les services qui surchargent une VM sont déplacés "
+                                     "vers des VMs qui ont la place")
+        ga_time_budget = st.number_input("Budget de temps (s)", min_value=0.0, value=0.0, step=1.0,
+                                         help="0 : pas de limite ; l'AG s'arrête à la fin de la génération "
+                                              "qui dépasse le budget et garde sa meilleure solution")
     else:
         # Valeurs par défaut si pas GA
         ga_pop_size = 100
         ga_generations = 200
         ga_objective = ("Minimiser le Makespan (temps)", "makespan")
+        ga_tolerance = 0.0
+        ga_stall = 0
+        ga_warm_start = 0
+        ga_repair = True
+        ga_time_budget = 0.0
     
     st.markdown("---")
+    local_search = st.selectbox(
+        "Recherche locale après l'algorithme",
+        options=[("Aucune", None), ("Descente", "descent"), ("Tabou", "tabu"), ("Recuit simulé", "annealing")],
+        format_func=lambda x: x[0],
+        help="Améliore le makespan de la solution en déplaçant ou en échangeant des services de la VM "
+             "la plus chargée (les services rejetés sont d'abord placés s'il reste de la place)"
+    )[1]
+    local_search_budget = st.number_input("Budget de la recherche locale (s)", min_value=0.1, value=1.0, step=0.5,
+                                          disabled=local_search is None)
+    profile_run = st.checkbox("⏱️ Profiler l'exécution", value=False,
+                              help="Compte les appels (can_host, assign, évaluations de l'AG, cache...) et "
+                                   "chronomètre les phases ; l'algorithme est alors ré-exécuté sans lire le cache")
     run_button = st.button("🚀 Lancer l'algorithme", type="primary", use_container_width=True)
     
     st.markdown("---")
     st.subheader("📊 Comparaison")
+    algo_timeout = st.number_input("Délai max. par algorithme (s)", min_value=1, value=60, step=10)
     comparison_button = st.button("🔄 Comparer tous les algos", type="secondary", use_container_width=True)
 
+# Paramètres transmis aux métaheuristiques (ils font partie de la clé du cache). La graine de
+# l'instance est aussi celle de l'AG : la génération de l'instance ne touche plus à l'état
+# global de `random`. Le front de Pareto n'est calculé que par « Lancer l'algorithme » : la
+# comparaison exécute alors l'AG sur le makespan
+pareto_mode = algo_name == "genetic algorithm" and ga_objective[1] == "pareto"
+ga_params = {"pop_size": ga_pop_size, "generations": ga_generations,
+             "objective": "makespan" if ga_objective[1] == "pareto" else ga_objective[1],
+             "tolerance": ga_tolerance / 100, "stall_generations": int(ga_stall) or None,
+             "warm_start": ga_warm_start / 100, "repair": ga_repair,
+             "time_budget": float(ga_time_budget) or None, "seed": int(seed)}
+# Recherche locale : appliquée à tous les algorithmes (hors front de Pareto)
+ls_params = {"local_search": local_search, "local_search_budget": float(local_search_budget)} if local_search else {}
+pareto_params = {"pop_size": ga_pop_size, "generations": ga_generations,
+                 "warm_start": ga_warm_start / 100, "repair": ga_repair, "seed": int(seed)}
+
+
+
+def render_profile(profiler):
+    """Panneau du profil d'exécution : compteurs, phases, temps par génération, exports."""
+    report = profiler.report()
+    with st.expander("⏱️ Profil d'exécution", expanded=True):
+        st.caption(f"Durée totale profilée : {report['elapsed_s']:.4f} s")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Compteurs**")
+            st.dataframe(pd.DataFrame([{"Compteur": name, "Valeur": value}
+                                       for name, value in report["counters"].items()]),
+                         hide_index=True, use_container_width=True)
+        with col2:
+            st.markdown("**Phases** (les phases imbriquées sont incluses dans leur parente)")
+            st.dataframe(pd.DataFrame([
+                {"Phase": name, "Appels": stats["calls"], "Total (s)": round(stats["total_s"], 4),
+                 "Max (s)": round(stats["max_s"], 4),
+                 "Part (%)": round(stats["total_s"] / report["elapsed_s"] * 100, 1) if report["elapsed_s"] else 0.0}
+                for name, stats in report["phases"].items()]), hide_index=True, use_container_width=True)
+
+        if report["generations"]:
+            st.markdown("**Temps par génération (ms)**")
+            df_gen = pd.DataFrame(report["generations"]).set_index("generation")
+            st.line_chart(df_gen["time_s"] * 1000)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("📥 Profil (JSON)", profiler.to_json(), file_name="profil.json",
+                               mime="application/json")
+        with col2:
+            st.download_button("📥 Profil (CSV)", profiler.to_csv(), file_name="profil.csv", mime="text/csv")
+
+
+def render_convergence(placeholder, history):
+    """Courbe de convergence de l'AG (les fitness des solutions infaisables sont masquées)."""
+    df_conv = pd.DataFrame(history).set_index("Génération")
+    placeholder.line_chart(df_conv.where(df_conv < INFEASIBLE_FITNESS))
+
+
+def stop_ga(token: CancelToken):
+    """Bouton d'arrêt : annule l'AG ; la ré-exécution affiche sa meilleure solution courante."""
+    token.cancel()
+    st.session_state["ga_stopped"] = True
+
+
+def run_ga_live(services, vms_template, params):
+    """
+    Exécute l'AG génération par génération (iter_genetic_algorithm) avec une courbe de
+    convergence en direct et un bouton d'arrêt. La meilleure solution courante est gardée
+    dans la session : un clic sur le bouton relance le script, qui l'affiche.
+    """
+    from algorithms.genetic import iter_genetic_algorithm
+
+    params = dict(params)
+    strategy = params.pop("local_search", None)
+    budget = params.pop("local_search_budget", 1.0)
+    token = CancelToken()
+    stop_slot = st.empty()
+    stop_slot.button("⏹️ Arrêter l'AG (garder la meilleure solution)", on_click=stop_ga, args=(token,))
+    status = st.empty()
+    chart = st.empty()
+    history, last_draw = [], 0.0
+    for state in iter_genetic_algorithm(services, vms_template, cancel=token, **params):
+        history.append({"Génération": state["generation"], "Meilleure fitness": state["best_fitness"],
+                        "Population": state["population_best"]})
+        st.session_state["ga_live"] = {"result": (state["assignment"], state["vms"], state["elapsed_s"]),
+                                       "generation": state["generation"], "history": history}
+        # Rafraîchissement limité : le tracé ne doit pas ralentir l'AG
+        if state["stop_reason"] is not None or state["elapsed_s"] - last_draw >= 0.25:
+            last_draw = state["elapsed_s"]
+            status.caption(f"Génération {state['generation']} / {params['generations']} — "
+                           f"meilleure fitness : {state['best_fitness']:.2f}")
+            render_convergence(chart, history)
+    stop_slot.empty()
+    del st.session_state["ga_live"]
+    assignment, vms_result, elapsed = state["assignment"], state["vms"], state["elapsed_s"]
+    if strategy is not None and state["stop_reason"] != "cancelled":
+        start = time.perf_counter()
+        assignment = improve(services, vms_result, assignment, strategy=strategy, time_budget=budget,
+                             seed=params.get("seed"))
+        elapsed += time.perf_counter() - start
+    return assignment, vms_result, elapsed
+
+
+def render_pareto(front, key: str):
+    """Front de Pareto (tableau + nuage de points) et choix du point à afficher."""
+    df_front = pd.DataFrame([{"Makespan": round(p["makespan"], 2), "VMs utilisées": p["vms_used"],
+                              "Services rejetés": p["rejected"]} for p in front])
+    col1, col2 = st.columns(2)
+    with col1:
+        st.scatter_chart(df_front, x="Makespan", y="VMs utilisées", color="Services rejetés")
+    with col2:
+        st.dataframe(df_front, use_container_width=True)
+    # Par défaut : le compromis de l'objectif hybride parmi les points qui rejettent le moins
+    fewest = min(p["rejected"] for p in front)
+    default = front.index(select_tradeoff([p for p in front if p["rejected"] == fewest],
+                                          {"makespan": 0.7, "vms_used": 0.3}))
+    index = st.select_slider(
+        "Compromis affiché", options=list(range(len(front))), value=default, key=key,
+        format_func=lambda i: (f"#{i} : makespan {front[i]['makespan']:.2f}s · {front[i]['vms_used']} VMs · "
+                               f"{front[i]['rejected']} rejetés"))
+    return front[index]
+
+
 # Contenu principal
-if run_button:
+# Après un clic sur « Arrêter l'AG », on affiche la meilleure solution de l'exécution interrompue
+ga_live = st.session_state.pop("ga_live", None) if st.session_state.pop("ga_stopped", False) else None
+# Le front de Pareto reste affiché (choix d'un autre compromis) tant que ses paramètres ne changent pas
+pareto_key = f"pareto_{nb_services}_{nb_vms}_{seed}_{sorted(pareto_params.items())}"
+if run_button and pareto_mode:
+    st.session_state["pareto_key"] = pareto_key
+show_pareto = pareto_mode and st.session_state.get("pareto_key") == pareto_key
+if run_button or ga_live is not None or show_pareto:
+    profiler = None
     with st.spinner(f"Exécution de {algo_display_name} en cours..."):
-        start_time = time.time()
-        
-        # Génération des données
-        services, vms_template = generate_random_data(nb_services, nb_vms, seed)
-        
-        # Copie propre des VMs
-        vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity) for vm in vms_template]
-        
-        # Exécution de l'algorithme
-        if algo_name == "genetic algorithm":
-            assignment, vms_result = algo_function(
-                services, 
-                vms_template,
-                pop_size=ga_pop_size,
-                generations=ga_generations,
-                objective=ga_objective[1]  # Récupère le code (2ème élément du tuple)
-            )
+        # Instance et résultat réutilisés s'ils ont déjà été calculés avec les mêmes paramètres
+        (services, vms_template), _ = solve_cache.instance(nb_services, nb_vms, seed)
+        params = {**(ga_params if algo_name in METAHEURISTICS else {}), **ls_params}
+        if show_pareto:
+            # Un seul run NSGA-II (en cache) : changer de compromis ne relance pas le calcul
+            (front, elapsed), cache_hit = solve_cache.pareto_front(nb_services, nb_vms, seed, pareto_params)
+            point = render_pareto(front, pareto_key)
+            assignment, vms_result = pareto_solution(point, services, vms_template)
+        elif ga_live is not None:
+            # Résultat partiel : il n'est pas mis en cache
+            assignment, vms_result, elapsed = ga_live["result"]
+            render_convergence(st.empty(), ga_live["history"])
+            cache_hit = False
+        elif profile_run:
+            # Exécution instrumentée : le résultat remplace celui du cache. Si un profilage est
+            # déjà en cours dans ce contexte, l'exécution a lieu sans profil plutôt que d'échouer.
+            if instrumentation.current() is None:
+                with profiling() as profiler:
+                    assignment, vms_result, elapsed = run_algorithm(algo_name, services, vms_template, **params)
+            else:
+                st.warning("⏱️ Un profilage est déjà en cours : exécution sans profil")
+                assignment, vms_result, elapsed = run_algorithm(algo_name, services, vms_template, **params)
+            solve_cache.store_result(algo_name, nb_services, nb_vms, seed, params,
+                                     (assignment, vms_result, elapsed))
+            cache_hit = False
+        elif algo_name in METAHEURISTICS:
+            # AG : exécution suivie en direct, sauf si le résultat est déjà en cache
+            cached = solve_cache.cached_result(algo_name, nb_services, nb_vms, seed, params)
+            cache_hit = cached is not MISSING
+            if cache_hit:
+                assignment, vms_result, elapsed = cached
+            else:
+                assignment, vms_result, elapsed = run_ga_live(services, vms_template, params)
+                solve_cache.store_result(algo_name, nb_services, nb_vms, seed, params,
+                                         (assignment, vms_result, elapsed))
         else:
-            assignment = algo_function(services.copy(), vms)
-            vms_result = vms
-        
-        elapsed = time.time() - start_time
+            (assignment, vms_result, elapsed), cache_hit = solve_cache.solve(
+                algo_name, nb_services, nb_vms, seed, params)
         
         # Calcul des métriques
         metrics = compute_metrics(vms_result, services)
 
     # === Affichage des résultats ===
-    st.success(f"✅ {algo_display_name} terminé en {elapsed:.4f} secondes !")
+    if show_pareto:
+        st.success(f"{'♻️' if cache_hit else '✅'} NSGA-II : front de Pareto de {len(front)} point(s) "
+                   f"calculé en {elapsed:.4f} secondes{' (en cache)' if cache_hit else ''}")
+    elif ga_live is not None:
+        st.warning(f"⏹️ {algo_display_name} arrêté à la génération {ga_live['generation']} "
+                   f"({elapsed:.4f} secondes) : meilleure solution trouvée jusque-là")
+    elif cache_hit:
+        st.success(f"♻️ {algo_display_name} : résultat en cache (calculé en {elapsed:.4f} secondes)")
+    else:
+        st.success(f"✅ {algo_display_name} terminé en {elapsed:.4f} secondes !")
+    if metrics["rejected"] == 0:
+        lower_bound = makespan_lower_bound(services, vms_template)
+        gap = (metrics["makespan"] - lower_bound) / lower_bound * 100 if lower_bound > 0 else 0.0
+        st.caption(f"📐 Borne inférieure du makespan : {lower_bound:.2f}s — écart : {max(gap, 0.0):.1f}%")
 
     col1, col2, col3, col4 , col5 = st.columns(5)
     with col1:
@@ -194,6 +399,9 @@ Répartition par VM :
             ids = [s.id for s in vm.services]
             st.code(f"  VM{vm.id:2d} : {len(ids)} services → [{', '.join(map(str, sorted(ids)))}]  (makespan={vm.completion_time:.1f})")
 
+    if profiler is not None:
+        render_profile(profiler)
+
 else:
     st.info("👈 Configurez les paramètres à gauche et cliquez sur **Lancer l'algorithme** pour commencer.")
     st.markdown("""
@@ -306,141 +514,172 @@ else:
         """, unsafe_allow_html=True)
 
 # === SECTION COMPARAISON ===
+def render_comparison(results, execution_times, failures):
+    """Graphiques et tableau comparatifs des algorithmes terminés jusqu'ici."""
+    for algo_display, error in failures.items():
+        st.warning(f"Erreur avec {algo_display}: {error}")
+    if not results:
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.subheader("⏱️ Temps d'exécution")
+        fig, ax = plt.subplots(figsize=(8, 5))
+        algos = list(execution_times.keys())
+        times = list(execution_times.values())
+        colors = sns.color_palette("husl", len(algos))
+        ax.barh(algos, times, color=colors)
+        ax.set_xlabel("Temps (secondes)")
+        ax.set_title("Temps d'exécution")
+        st.pyplot(fig)
+        plt.close()
+    
+    with col2:
+        st.subheader("⏱️ Makespan")
+        fig, ax = plt.subplots(figsize=(8, 5))
+        algos = list(results.keys())
+        makespans = [results[a]["metrics"]["makespan"] for a in algos]
+        colors = sns.color_palette("husl", len(algos))
+        bars = ax.barh(algos, makespans, color=colors)
+        ax.set_xlabel("Makespan (secondes)")
+        ax.set_title("Temps total d'exécution")
+        # Colorier le meilleur en vert
+        best_idx = makespans.index(min(makespans))
+        bars[best_idx].set_color('green')
+        st.pyplot(fig)
+        plt.close()
+    
+    with col3:
+        st.subheader("🖥️ VMs utilisées")
+        fig, ax = plt.subplots(figsize=(8, 5))
+        algos = list(results.keys())
+        vms_used = [results[a]["metrics"]["vms_used"] for a in algos]
+        colors = sns.color_palette("husl", len(algos))
+        bars = ax.barh(algos, vms_used, color=colors)
+        ax.set_xlabel("Nombre de VMs utilisées")
+        ax.set_title("Utilisation des VMs")
+        # Colorier le meilleur (min) en vert
+        best_idx = vms_used.index(min(vms_used))
+        bars[best_idx].set_color('green')
+        st.pyplot(fig)
+        plt.close()
+    
+    with col4:
+        st.subheader("📦 Services placés")
+        fig, ax = plt.subplots(figsize=(8, 5))
+        algos = list(results.keys())
+        assigned = [results[a]["metrics"]["assigned"] for a in algos]
+        colors = sns.color_palette("husl", len(algos))
+        bars = ax.barh(algos, assigned, color=colors)
+        ax.set_xlabel("Nombre de services")
+        ax.set_title("Services placés / Total")
+        # Colorier le meilleur (max) en vert
+        best_idx = assigned.index(max(assigned))
+        bars[best_idx].set_color('green')
+        st.pyplot(fig)
+        plt.close()
+    
+    # === Tableau récapitulatif ===
+    st.markdown("---")
+    st.subheader("📋 Tableau récapitulatif")
+    
+    comparison_data = []
+    for algo_name in results.keys():
+        m = results[algo_name]["metrics"]
+        comparison_data.append({
+            "Algorithme": algo_name,
+            "Temps exécution (s)": f"{execution_times[algo_name]:.4f}",
+            "Makespan (s)": m["makespan"],
+            "Services placés": f"{m['assigned']}/{m['assigned'] + m['rejected']}",
+            "VMs utilisées": m["vms_used"],
+            "CPU util. (%)": f"{m['cpu_util_%']:.1f}%",
+            "RAM util. (%)": f"{m['ram_util_%']:.1f}%",
+        })
+    
+    df_comparison = pd.DataFrame(comparison_data)
+    st.dataframe(df_comparison, use_container_width=True, hide_index=True)
+
+
 if comparison_button:
     st.markdown("---")
     st.header("📊 Comparaison de tous les algorithmes")
     
-    with st.spinner("Exécution de tous les algorithmes en cours..."):
-        # Génération des données une seule fois
-        services, vms_template = generate_random_data(nb_services, nb_vms, seed)
-        
-        # Résultats de tous les algos
-        results = {}
-        execution_times = {}
-        
-        algos_to_compare = [
-            ("First-Fit", "first-fit", first_fit),
-            ("Best-Fit", "best-fit", best_fit),
-            ("Min-Min", "min-min", min_min),
-            ("Max-Min", "max-min", max_min),
-            ("Genetic Algorithm", "genetic algorithm", genetic_algorithm),
-        ]
-        
-        for algo_display, algo_name, algo_func in algos_to_compare:
-            start = time.time()
-            
-            # Copie propre des VMs
-            vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity) for vm in vms_template]
-            
-            # Exécution
-            try:
-                if algo_name == "genetic algorithm":
-                    assignment, vms_result = algo_func(
-                        services, 
-                        vms_template,
-                        pop_size=ga_pop_size,
-                        generations=ga_generations,
-                        objective=ga_objective[1]
-                    )
-                else:
-                    assignment = algo_func(services.copy(), vms)
-                    vms_result = vms
-                
-                elapsed = time.time() - start
-                metrics = compute_metrics(vms_result, services)
-                
-                results[algo_display] = {
-                    "metrics": metrics,
-                    "vms": vms_result,
-                    "assignment": assignment
-                }
-                execution_times[algo_display] = elapsed
-            except Exception as e:
-                st.warning(f"Erreur avec {algo_display}: {str(e)}")
-        
-        # === Affichage comparatif ===
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.subheader("⏱️ Temps d'exécution")
-            fig, ax = plt.subplots(figsize=(8, 5))
-            algos = list(execution_times.keys())
-            times = list(execution_times.values())
-            colors = sns.color_palette("husl", len(algos))
-            ax.barh(algos, times, color=colors)
-            ax.set_xlabel("Temps (secondes)")
-            ax.set_title("Temps d'exécution")
-            st.pyplot(fig)
-            plt.close()
-        
-        with col2:
-            st.subheader("⏱️ Makespan")
-            fig, ax = plt.subplots(figsize=(8, 5))
-            algos = list(results.keys())
-            makespans = [results[a]["metrics"]["makespan"] for a in algos]
-            colors = sns.color_palette("husl", len(algos))
-            bars = ax.barh(algos, makespans, color=colors)
-            ax.set_xlabel("Makespan (secondes)")
-            ax.set_title("Temps total d'exécution")
-            # Colorier le meilleur en vert
-            best_idx = makespans.index(min(makespans))
-            bars[best_idx].set_color('green')
-            st.pyplot(fig)
-            plt.close()
-        
-        with col3:
-            st.subheader("🖥️ VMs utilisées")
-            fig, ax = plt.subplots(figsize=(8, 5))
-            algos = list(results.keys())
-            vms_used = []
-            for a in algos:
-                num_vms = sum(1 for vm in results[a]["vms"] if vm.services)
-                vms_used.append(num_vms)
-            colors = sns.color_palette("husl", len(algos))
-            bars = ax.barh(algos, vms_used, color=colors)
-            ax.set_xlabel("Nombre de VMs utilisées")
-            ax.set_title("Utilisation des VMs")
-            # Colorier le meilleur (min) en vert
-            best_idx = vms_used.index(min(vms_used))
-            bars[best_idx].set_color('green')
-            st.pyplot(fig)
-            plt.close()
-        
-        with col4:
-            st.subheader("📦 Services placés")
-            fig, ax = plt.subplots(figsize=(8, 5))
-            algos = list(results.keys())
-            assigned = [results[a]["metrics"]["assigned"] for a in algos]
-            colors = sns.color_palette("husl", len(algos))
-            bars = ax.barh(algos, assigned, color=colors)
-            ax.set_xlabel("Nombre de services")
-            ax.set_title("Services placés / Total")
-            # Colorier le meilleur (max) en vert
-            best_idx = assigned.index(max(assigned))
-            bars[best_idx].set_color('green')
-            st.pyplot(fig)
-            plt.close()
-        
-        # === Tableau récapitulatif ===
-        st.markdown("---")
-        st.subheader("📋 Tableau récapitulatif")
-        
-        comparison_data = []
-        for algo_name in results.keys():
-            m = results[algo_name]["metrics"]
-            num_vms = sum(1 for vm in results[algo_name]["vms"] if vm.services)
-            comparison_data.append({
-                "Algorithme": algo_name,
-                "Temps exécution (s)": f"{execution_times[algo_name]:.4f}",
-                "Makespan (s)": m["makespan"],
-                "Services placés": f"{m['assigned']}/{m['assigned'] + m['rejected']}",
-                "VMs utilisées": num_vms,
-                "CPU util. (%)": f"{m['cpu_util_%']:.1f}%",
-                "RAM util. (%)": f"{m['ram_util_%']:.1f}%",
-            })
-        
-        df_comparison = pd.DataFrame(comparison_data)
-        st.dataframe(df_comparison, use_container_width=True, hide_index=True)
+    # Génération des données une seule fois (ou instance en cache)
+    (services, vms_template), _ = solve_cache.instance(nb_services, nb_vms, seed)
+    
+    # Résultats de tous les algos
+    results = {}
+    execution_times = {}
+    failures = {}
+    
+    algos_to_compare = [
+        ("First-Fit", "first-fit"),
+        ("Best-Fit", "best-fit"),
+        ("Min-Min", "min-min"),
+        ("Max-Min", "max-min"),
+        ("Genetic Algorithm", "genetic algorithm"),
+    ]
+    display_names = dict((name, display) for display, name in algos_to_compare)
+    
+    # Tous les algorithmes tournent en parallèle (un processus chacun, copies indépendantes
+    # des VMs) ; la page est mise à jour dès qu'un algorithme se termine
+    status = st.empty()
+    comparison = st.empty()
+    
+    def algo_params(name):
+        return {**(ga_params if name in METAHEURISTICS else {}), **ls_params}
+    
+    def record(name, assignment, vms_result, elapsed):
+        results[display_names[name]] = {
+            "metrics": compute_metrics(vms_result, services),
+            "vms": vms_result,
+            "assignment": assignment
+        }
+        execution_times[display_names[name]] = elapsed
+    
+    # Les résultats déjà en cache sont affichés tout de suite ; seuls les autres sont calculés
+    to_run = []
+    for name in display_names:
+        cached = solve_cache.cached_result(name, nb_services, nb_vms, seed, algo_params(name))
+        if cached is MISSING:
+            to_run.append(name)
+        else:
+            record(name, *cached)
+    if results:
+        with comparison.container():
+            render_comparison(results, execution_times, failures)
+    
+    if to_run:
+        status.info(f"⏳ En cours : {', '.join(display_names[n] for n in to_run)}")
+        for outcome in run_algorithms_concurrently(to_run, services, vms_template,
+                                                   {**ga_params, **ls_params}, timeout=algo_timeout):
+            name = outcome["name"]
+            if outcome["error"] is None:
+                record(name, outcome["assignment"], outcome["vms"], outcome["elapsed"])
+                solve_cache.store_result(name, nb_services, nb_vms, seed, algo_params(name),
+                                         (outcome["assignment"], outcome["vms"], outcome["elapsed"]))
+            else:
+                failures[display_names[name]] = outcome["error"]
         
-        st.success("✅ Comparaison complète !")
+            running = [display_names[n] for n in to_run
+                       if display_names[n] not in results and display_names[n] not in failures]
+            if running:
+                status.info(f"⏳ En cours : {', '.join(running)}")
+            with comparison.container():
+                render_comparison(results, execution_times, failures)
+    
+    reused = len(display_names) - len(to_run)
+    status.success(f"✅ Comparaison complète ! ({reused} résultat(s) réutilisé(s) depuis le cache)")
 
+# === Indicateur du cache (succès / échecs) ===
+with st.sidebar:
+    st.markdown("---")
+    cache_stats = solve_cache.stats()
+    st.caption(
+        f"🗄️ Cache — instances : {cache_stats['instances']['hits']} succès / "
+        f"{cache_stats['instances']['misses']} échecs ({cache_stats['instances']['size']}/"
+        f"{cache_stats['instances']['max_entries']}) · résultats : {cache_stats['results']['hits']} succès / "
+        f"{cache_stats['results']['misses']} échecs ({cache_stats['results']['size']}/"
+        f"{cache_stats['results']['max_entries']})"
+    )
@@ -0,0 +1,44 @@
+# benchmarks/bench_anytime.py
+# AG à budget de temps : qualité de la solution (makespan, écart à la borne) en fonction
+# de l'échéance donnée à l'AG, à la place d'un nombre de générations.
+# Usage : python -m benchmarks.bench_anytime --services 500 --vms 100 --budgets 0.5 1 2 5
+import argparse
+import time
+
+from utils.helpers import generate_random_data, compute_metrics
+from algorithms.bounds import makespan_lower_bound
+from algorithms.genetic import genetic_algorithm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AG : qualité en fonction du budget de temps")
+    parser.add_argument("--services", type=int, default=500)
+    parser.add_argument("--vms", type=int, default=100)
+    parser.add_argument("--budgets", nargs="+", type=float, default=[0.5, 1.0, 2.0, 5.0],
+                        help="budgets de temps (s)")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1, 2, 3])
+    parser.add_argument("--max-generations", type=int, default=100_000)
+    parser.add_argument("--repair", action="store_true", help="réparation des génomes infaisables")
+    args = parser.parse_args()
+
+    print(f"{args.services} services x {args.vms} VMs")
+    print(f"{'budget (s)':>10} {'seed':>5} | {'temps (s)':>9} | {'générations':>11} | {'makespan':>9} | "
+          f"{'écart':>7} | {'rejetés':>7} | arrêt")
+    for budget in args.budgets:
+        for seed in args.seeds:
+            services, vms_template = generate_random_data(args.services, args.vms, seed)
+            bound = makespan_lower_bound(services, vms_template)
+            stats = {}
+            start = time.perf_counter()
+            _, vms = genetic_algorithm(services, vms_template, generations=args.max_generations, seed=seed,
+                                       tolerance=None, repair=args.repair, time_budget=budget, stats=stats)
+            elapsed = time.perf_counter() - start
+            metrics = compute_metrics(vms, services)
+            gap = f"{(metrics['makespan'] - bound) / bound:.1%}" if metrics["rejected"] == 0 else "-"
+            print(f"{budget:>10.2f} {seed:>5} | {elapsed:>9.3f} | {stats['generations_run']:>11} | "
+                  f"{metrics['makespan']:>9.1f} | {gap:>7} | {metrics['rejected']:>7} | {stats['stop_reason']}",
+                  flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_columnar.py
+# Chargement d'une instance : JSON (load_data) vs format colonnes projeté en mémoire.
+# Usage : python -m benchmarks.bench_columnar --sizes 10000 1000000 10000000 --json-max 1000000
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from utils.helpers import load_data
+from utils.columnar import save_columns, load_instance, load_data_columnar, iter_service_chunks, convert_json
+
+N_VMS = 1000
+
+
+def write_instance(directory: str, n_services: int, with_json: bool, seed: int = 0):
+    """Instance aléatoire au format colonnes (et au format JSON si demandé)."""
+    rng = np.random.default_rng(seed)
+    services = {"cpu": np.round(rng.uniform(1, 5, n_services), 2),
+                "ram": np.round(rng.uniform(2, 12, n_services), 2),
+                "exec_time": np.round(rng.uniform(5, 40, n_services), 2)}
+    vms = {"cpu_capacity": np.round(rng.uniform(12, 28, N_VMS), 2),
+           "ram_capacity": np.round(rng.uniform(24, 64, N_VMS), 2)}
+    save_columns(os.path.join(directory, "instance"), services, vms)
+    if not with_json:
+        return
+    # Écriture ligne à ligne : pas de liste de dicts en mémoire
+    with open(os.path.join(directory, "services.json"), "w") as f:
+        f.write("[\n")
+        for i, (cpu, ram, t) in enumerate(zip(services["cpu"].tolist(), services["ram"].tolist(),
+                                              services["exec_time"].tolist())):
+            sep = ",\n" if i < n_services - 1 else "\n"
+            f.write(f'{{"id": {i}, "cpu": {cpu}, "ram": {ram}, "exec_time": {t}}}{sep}')
+        f.write("]\n")
+    with open(os.path.join(directory, "vms.json"), "w") as f:
+        f.write("[\n" + ",\n".join(
+            f'{{"id": {i}, "cpu_capacity": {c}, "ram_capacity": {r}}}'
+            for i, (c, r) in enumerate(zip(vms["cpu_capacity"].tolist(), vms["ram_capacity"].tolist()))) + "\n]\n")
+
+
+def measure(function):
+    """(durée en s, pic mémoire Python en Mo, résultat)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def scan_chunks(path: str) -> float:
+    """Parcours complet par tranches (somme des demandes CPU)."""
+    return sum(float(chunk.cpu.sum()) for chunk in iter_service_chunks(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chargement d'instance : JSON vs colonnes projetées en mémoire")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--json-max", type=int, default=1_000_000,
+                        help="taille max. pour laquelle le chargeur JSON est mesuré (mémoire)")
+    args = parser.parse_args()
+
+    print(f"{'services':>10} | {'chargeur':<34} | {'temps (s)':>9} | {'pic mém. (Mo)':>13}")
+    for n_services in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            with_json = n_services <= args.json_max
+            write_instance(directory, n_services, with_json)
+            path = os.path.join(directory, "instance")
+            services_file = os.path.join(directory, "services.json")
+            vms_file = os.path.join(directory, "vms.json")
+
+            rows = []
+            if with_json:
+                rows.append(("JSON -> objets (load_data)", measure(lambda: load_data(vms_file, services_file))))
+                rows.append(("conversion JSON -> colonnes", measure(lambda: convert_json(
+                    services_file, vms_file, os.path.join(directory, "converted")))))
+            rows.append(("colonnes, mmap (load_instance)", measure(lambda: load_instance(path))))
+            rows.append(("colonnes, parcours par tranches", measure(lambda: scan_chunks(path))))
+            rows.append(("colonnes, lecture complète", measure(lambda: load_instance(path, mmap=False))))
+            if with_json:
+                rows.append(("colonnes -> objets", measure(lambda: load_data_columnar(path))))
+
+            for label, (elapsed, peak, _) in rows:
+                print(f"{n_services:>10} | {label:<34} | {elapsed:>9.4f} | {peak:>13.1f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_heterogeneous.py
+# Min-Min / Max-Min sur flotte hétérogène : placement au plus tôt d'après la matrice ETC
+# vs ancienne hypothèse de VMs homogènes (première VM qui a la place).
+# Usage : python -m benchmarks.bench_heterogeneous --instances 40x10 100x25 1000x250 20000x5000 --speeds 0.5 1 2
+import argparse
+import heapq
+import time
+
+from models.entities import VM
+from utils.helpers import generate_random_data, compute_metrics
+from algorithms.bounds import makespan_lower_bound
+from algorithms.min_min import min_min
+from algorithms.max_min import max_min
+
+
+def first_vm_in_order(services, vms, sign: int):
+    """Ancienne stratégie : même ordre des services, première VM qui peut les héberger."""
+    heap = [(sign * service.exec_time, i) for i, service in enumerate(services)]
+    heapq.heapify(heap)
+    while heap:
+        _, i = heapq.heappop(heap)
+        for vm in vms:
+            if vm.can_host(services[i]):
+                vm.assign(services[i])
+                break
+
+
+def parse_instance(text: str):
+    services, vms = text.lower().split("x")
+    return int(services), int(vms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Min-Min / Max-Min : matrice ETC vs hypothèse homogène")
+    parser.add_argument("--instances", nargs="+", default=["40x10", "100x25", "1000x250", "20000x5000"],
+                        help="instances generate_random_data, au format SERVICESxVMS")
+    parser.add_argument("--speeds", nargs="+", type=float, default=[0.5, 1.0, 1.5, 2.0],
+                        help="vitesses possibles des VMs")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1, 2, 3])
+    args = parser.parse_args()
+
+    strategies = (
+        ("min-min, 1re VM", lambda s, v: first_vm_in_order(s, v, 1)),
+        ("min-min, ETC", min_min),
+        ("max-min, 1re VM", lambda s, v: first_vm_in_order(s, v, -1)),
+        ("max-min, ETC", max_min),
+    )
+    print(f"Vitesses des VMs : {args.speeds}")
+    print(f"{'instance':>11} {'seed':>5} | {'stratégie':<16} | {'temps (s)':>9} | {'makespan':>9} | {'écart':>7} | {'rejetés':>7}")
+    for text in args.instances:
+        n_services, n_vms = parse_instance(text)
+        for seed in args.seeds:
+            services, vms_template = generate_random_data(n_services, n_vms, seed, tuple(args.speeds))
+            bound = makespan_lower_bound(services, vms_template)
+            for label, algorithm in strategies:
+                # L'ancienne stratégie parcourt les VMs une à une : on la saute sur les grandes instances
+                if "1re VM" in label and n_services * n_vms > 10_000_000:
+                    continue
+                vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+                start = time.perf_counter()
+                algorithm(services.copy(), vms)
+                elapsed = time.perf_counter() - start
+                metrics = compute_metrics(vms, services)
+                gap = f"{(metrics['makespan'] - bound) / bound:.1%}" if metrics["rejected"] == 0 else "-"
+                print(f"{text:>11} {seed:>5} | {label:<16} | {elapsed:>9.4f} | {metrics['makespan']:>9.1f} | "
+                      f"{gap:>7} | {metrics['rejected']:>7}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_import.py
+# Temps d'import à froid du cœur d'ordonnancement (heuristiques, modèles, chargement des
+# données, métriques), mesuré dans un interpréteur neuf à chaque essai.
+# Échoue (code de sortie 1) si le budget est dépassé ou si une dépendance lourde est chargée.
+# Usage : python -m benchmarks.bench_import --budget-ms 50 --runs 7
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Modules du cœur « léger » : ils ne doivent charger aucune dépendance lourde
+LEAN_MODULES = (
+    "models.entities",
+    "algorithms",
+    "algorithms.first_fit",
+    "algorithms.best_fit",
+    "algorithms.min_min",
+    "algorithms.max_min",
+    "algorithms.online",
+    "utils.helpers",
+)
+HEAVY_MODULES = ("streamlit", "deap", "numpy", "pandas", "matplotlib", "seaborn")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def cold_import(modules, runs: int):
+    """Durées d'import (s) sur `runs` interpréteurs neufs et dépendances lourdes chargées."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = PROBE.format(modules=tuple(modules), heavy=HEAVY_MODULES)
+    times, heavy = [], set()
+    for _ in range(runs):
+        # -B : pas d'écriture de .pyc, pour que tous les essais partent du même état
+        out = subprocess.run([sys.executable, "-B", "-c", code], cwd=root, check=True,
+                             capture_output=True, text=True).stdout
+        result = json.loads(out)
+        times.append(result["elapsed"])
+        heavy.update(result["heavy"])
+    return sorted(times), sorted(heavy)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps d'import à froid du cœur d'ordonnancement")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="budget pour la médiane des imports")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    times, heavy = cold_import(LEAN_MODULES, args.runs)
+    median_ms = times[len(times) // 2] * 1000
+    print(f"Cœur léger : médiane {median_ms:.1f} ms (min {times[0] * 1000:.1f} ms, "
+          f"max {times[-1] * 1000:.1f} ms) sur {args.runs} essais, budget {args.budget_ms:.0f} ms")
+
+    # À titre indicatif : l'AG (NumPy ; DEAP n'est chargé qu'à la première exécution)
+    ga_times, ga_heavy = cold_import(("algorithms.genetic",), args.runs)
+    print(f"algorithms.genetic : médiane {ga_times[len(ga_times) // 2] * 1000:.1f} ms, "
+          f"dépendances chargées : {', '.join(ga_heavy) or 'aucune'}")
+
+    ok = True
+    if heavy:
+        print(f"ÉCHEC : dépendances lourdes chargées par le cœur : {', '.join(heavy)}")
+        ok = False
+    if median_ms > args.budget_ms:
+        print(f"ÉCHEC : budget dépassé ({median_ms:.1f} ms > {args.budget_ms:.0f} ms)")
+        ok = False
+    if ok:
+        print("OK")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
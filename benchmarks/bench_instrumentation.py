@@ -0,0 +1,50 @@
+# benchmarks/bench_instrumentation.py
+# Coût de l'instrumentation (utils/instrumentation.py) : durée médiane de chaque
+# algorithme sans profileur (mode désactivé) et dans `with profiling():`.
+# Usage : python -m benchmarks.bench_instrumentation --services 1000 --vms 50 --repeats 5
+import argparse
+import time
+
+from algorithms import ALGORITHMS, METAHEURISTICS
+from utils.helpers import generate_random_data, run_algorithm
+from utils.instrumentation import profiling
+
+
+def median_time(name, services, vms_template, params, repeats: int, profiled: bool):
+    times, profiler = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if profiled:
+            with profiling() as profiler:
+                run_algorithm(name, services, vms_template, **params)
+        else:
+            run_algorithm(name, services, vms_template, **params)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2], profiler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût de l'instrumentation des algorithmes")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS),
+                        metavar="ALGO")
+    parser.add_argument("--services", type=int, default=1000)
+    parser.add_argument("--vms", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=123)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--generations", type=int, default=100)
+    args = parser.parse_args()
+
+    services, vms_template = generate_random_data(args.services, args.vms, args.seed)
+    print(f"{args.services} services x {args.vms} VMs, médiane sur {args.repeats} exécutions")
+    print(f"{'algorithme':<18} | {'désactivé (s)':>13} | {'profilé (s)':>11} | {'surcoût':>8} | compteurs")
+    for name in args.algorithms:
+        params = ({"generations": args.generations, "seed": args.seed, "tolerance": None}
+                  if name in METAHEURISTICS else {})
+        off, _ = median_time(name, services, vms_template, params, args.repeats, profiled=False)
+        on, profiler = median_time(name, services, vms_template, params, args.repeats, profiled=True)
+        counters = ", ".join(f"{k}={v}" for k, v in profiler.report()["counters"].items())
+        print(f"{name:<18} | {off:>13.4f} | {on:>11.4f} | {(on - off) / off:>8.1%} | {counters}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
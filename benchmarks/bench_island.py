@@ -0,0 +1,53 @@
+# benchmarks/bench_island.py
+# Compare l'AG séquentiel et le modèle en îles à budget d'évaluations égal.
+# Usage : python -m benchmarks.bench_island --services 1000 --vms 50 --islands 8
+import argparse
+import os
+import time
+
+from utils.helpers import generate_random_data, compute_metrics
+from algorithms.genetic import genetic_algorithm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AG séquentiel vs AG en îles (même budget d'évaluations)")
+    parser.add_argument("--services", type=int, default=1000)
+    parser.add_argument("--vms", type=int, default=50)
+    parser.add_argument("--pop-size", type=int, default=160)
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--islands", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--migration-interval", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=123)
+    args = parser.parse_args()
+
+    services, vms_template = generate_random_data(args.services, args.vms, args.seed)
+    workers = args.workers or min(args.islands, os.cpu_count() or 1)
+    print(f"{args.services} services, {args.vms} VMs, population {args.pop_size}, "
+          f"{args.generations} générations, {args.islands} îles, {workers} workers")
+
+    start = time.perf_counter()
+    _, vms_serial = genetic_algorithm(services, vms_template, pop_size=args.pop_size,
+                                      generations=args.generations, seed=args.seed)
+    serial_time = time.perf_counter() - start
+
+    runs = []
+    for _ in range(2):
+        start = time.perf_counter()
+        assignment, vms_island = genetic_algorithm(services, vms_template, pop_size=args.pop_size,
+                                                   generations=args.generations, seed=args.seed,
+                                                   islands=args.islands, workers=workers,
+                                                   migration_interval=args.migration_interval)
+        runs.append((time.perf_counter() - start, assignment, vms_island))
+    island_time = min(r[0] for r in runs)
+
+    serial_metrics = compute_metrics(vms_serial, services)
+    island_metrics = compute_metrics(runs[0][2], services)
+    print(f"Séquentiel : {serial_time:8.3f}s  makespan={serial_metrics['makespan']}")
+    print(f"Îles       : {island_time:8.3f}s  makespan={island_metrics['makespan']}")
+    print(f"Accélération : x{serial_time / island_time:.2f}")
+    print(f"Reproductible (2 exécutions identiques) : {runs[0][1] == runs[1][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bench_local_search.py
+# Heuristiques + recherche locale (descente, tabou, recuit) vs AG : durée et makespan.
+# Usage : python -m benchmarks.bench_local_search --instances 200x60 1000x300 --budget 1 --generations 200
+import argparse
+import time
+
+from models.entities import VM
+from utils.helpers import generate_random_data, compute_metrics
+from algorithms import get_algorithm
+from algorithms.genetic import genetic_algorithm
+from algorithms.local_search import local_search, STRATEGIES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Post-optimisation par recherche locale vs AG")
+    parser.add_argument("--instances", nargs="+", default=["200x60", "1000x300"],
+                        help="instances generate_random_data, au format SERVICESxVMS")
+    parser.add_argument("--heuristics", nargs="+", default=["first-fit", "min-min", "max-min"])
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument("--budget", type=float, default=1.0, help="budget de la recherche locale (s)")
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'instance':>10} {'algorithme':>22} | {'durée (s)':>9} | {'makespan':>9} | {'rejetés':>7} | "
+          f"{'itérations':>10} | arrêt")
+    for text in args.instances:
+        n_services, n_vms = (int(x) for x in text.lower().split("x"))
+        services, vms_template = generate_random_data(n_services, n_vms, args.seed)
+
+        def report(label, elapsed, vms, stats=None):
+            metrics = compute_metrics(vms, services)
+            extra = f" | {stats['iterations']:>10} | {stats['stop_reason']}" if stats else ""
+            print(f"{text:>10} {label:>22} | {elapsed:>9.3f} | {metrics['makespan']:>9.2f} | "
+                  f"{metrics['rejected']:>7}{extra}", flush=True)
+
+        for name in args.heuristics:
+            for strategy in [None] + args.strategies:
+                vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+                start = time.perf_counter()
+                assignment = get_algorithm(name)(services.copy(), vms)
+                stats = None
+                if strategy is not None:
+                    stats = {}
+                    local_search(services, vms, assignment, strategy=strategy, time_budget=args.budget,
+                                 seed=args.seed, stats=stats)
+                report(name if strategy is None else f"{name} + {strategy}",
+                       time.perf_counter() - start, vms, stats)
+
+        start = time.perf_counter()
+        _, vms = genetic_algorithm(services, vms_template, args.pop_size, args.generations,
+                                   seed=args.seed, tolerance=None)
+        report("AG", time.perf_counter() - start, vms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/bench_nsga2.py
+# Un run NSGA-II (front de Pareto complet) vs trois runs de l'AG (makespan, vms, hybrid),
+# puis coût du tri non dominé (par blocs vs insertion point par point, mêmes rangs
+# exigés : code de sortie 1 sinon) et du crowding en fonction du nombre de points et
+# d'objectifs.
+# Usage : python -m benchmarks.bench_nsga2 --services 200 --vms 20 --generations 100 --sort-sizes 1000 10000 --sort-objectives 2 3 4
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from utils.helpers import generate_random_data, compute_metrics
+from algorithms.genetic import genetic_algorithm
+from algorithms.nsga2 import nsga2, non_dominated_sort, crowding_distance
+
+
+def sort_point_by_point(objectives: np.ndarray) -> np.ndarray:
+    """Tri non dominé de référence : même insertion dichotomique, un point à la fois."""
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    n, m = unique.shape
+    rest = unique[:, 1:]
+    fronts, sizes = [], []   # membres de chaque front, capacité doublée au besoin
+    ranks = np.empty(n, dtype=np.intp)
+    for i in range(n):
+        point = rest[i]
+        low, high = 0, len(fronts)
+        while low < high:
+            mid = (low + high) // 2
+            if (fronts[mid][:sizes[mid]] <= point).all(axis=1).any():
+                low = mid + 1
+            else:
+                high = mid
+        if low == len(fronts):
+            fronts.append(np.empty((4, m - 1), dtype=rest.dtype))
+            sizes.append(0)
+        elif sizes[low] == len(fronts[low]):
+            fronts[low] = np.concatenate((fronts[low], np.empty_like(fronts[low])))
+        fronts[low][sizes[low]] = point
+        sizes[low] += 1
+        ranks[i] = low
+    return ranks[inverse.ravel()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NSGA-II vs un run de l'AG par objectif")
+    parser.add_argument("--services", type=int, default=200)
+    parser.add_argument("--vms", type=int, default=20)
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--sort-sizes", nargs="+", type=int, default=[200, 1000, 5000, 10000])
+    parser.add_argument("--sort-objectives", nargs="+", type=int, default=[3],
+                        help="nombre d'objectifs des points triés (3 : makespan, VMs, rejets réalistes)")
+    args = parser.parse_args()
+
+    services, vms_template = generate_random_data(args.services, args.vms, args.seed)
+    print(f"{args.services} services x {args.vms} VMs, population {args.pop_size}, {args.generations} générations")
+    points, total = [], 0.0
+    for objective in ("makespan", "vms", "hybrid"):
+        start = time.perf_counter()
+        _, vms = genetic_algorithm(services, vms_template, args.pop_size, args.generations, objective=objective,
+                                   seed=args.seed, tolerance=None, repair=True)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        metrics = compute_metrics(vms, services)
+        points.append((metrics["makespan"], metrics["vms_used"], metrics["rejected"]))
+        print(f"  AG {objective:<8} : {elapsed:8.3f} s  makespan {points[-1][0]:9.2f}  VMs {points[-1][1]:>4}  "
+              f"rejetés {points[-1][2]:>4}")
+    print(f"  3 runs de l'AG   : {total:8.3f} s")
+
+    start = time.perf_counter()
+    front = nsga2(services, vms_template, args.pop_size, args.generations, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"  NSGA-II          : {elapsed:8.3f} s  front de {len(front)} points")
+    for p in front:
+        print(f"    makespan {p['makespan']:9.2f}  VMs {p['vms_used']:>4}  rejetés {p['rejected']:>4}")
+    dominated = sum(1 for point in points
+                    if any(p["makespan"] <= point[0] and p["vms_used"] <= point[1] and p["rejected"] <= point[2]
+                           and (p["makespan"], p["vms_used"], p["rejected"]) != point for p in front))
+    print(f"  solutions de l'AG dominées par le front : {dominated} / {len(points)}")
+
+    print(f"\n{'points':>8} {'obj.':>4} | {'tri par blocs (s)':>17} | {'point par point (s)':>19} | "
+          f"{'crowding (s)':>12} | fronts")
+    rng = np.random.default_rng(args.seed)
+    status = 0
+    for size in args.sort_sizes:
+        for n_objectives in args.sort_objectives:
+            if n_objectives == 3:
+                # Objectifs réalistes : makespan continu, VMs et rejets entiers
+                values = np.column_stack((rng.random(size) * 100, rng.integers(1, args.vms + 1, size),
+                                          rng.integers(0, 20, size)))
+            else:
+                values = rng.random((size, n_objectives))
+            start = time.perf_counter()
+            ranks = non_dominated_sort(values)
+            block_time = time.perf_counter() - start
+            start = time.perf_counter()
+            single = sort_point_by_point(values)
+            single_time = time.perf_counter() - start
+            start = time.perf_counter()
+            crowding_distance(values, ranks)
+            crowding_time = time.perf_counter() - start
+            print(f"{size:>8} {n_objectives:>4} | {block_time:>17.4f} | {single_time:>19.4f} | "
+                  f"{crowding_time:>12.4f} | {ranks.max() + 1}", flush=True)
+            if not np.array_equal(ranks, single):
+                print(f"ÉCHEC : {size} points, {n_objectives} objectifs : rangs différents du tri point par point")
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# benchmarks/bench_repair.py
+# Réparation des génomes de l'AG : part des génomes réalisables avant/après réparation,
+# débit de l'opérateur, et qualité finale de l'AG sans réparation / lamarckien / baldwinien.
+# Usage : python -m benchmarks.bench_repair --instances 40x10 60x12 100x20 --seeds 1 2 3
+import argparse
+import random
+import time
+
+import numpy as np
+
+from utils.helpers import generate_random_data
+from algorithms.bounds import is_infeasible, makespan_lower_bound
+from algorithms.fitness import PopulationEvaluator, INFEASIBLE_FITNESS
+from algorithms.genetic import genetic_algorithm
+from algorithms.repair import GenomeRepair
+
+MODES = (("sans", {}),
+         ("lamarckien", {"repair": True}),
+         ("baldwinien", {"repair": True, "repair_write_back": False}))
+
+
+def parse_instance(text: str):
+    services, vms = text.lower().split("x")
+    return int(services), int(vms)
+
+
+def feasible_share(services, vms_template, population: int, seed: int):
+    """(part réalisable brute, part réalisable après réparation, génomes réparés par s)."""
+    rng = random.Random(seed)
+    genomes = [[rng.randrange(len(vms_template)) for _ in services] for _ in range(population)]
+    evaluator = PopulationEvaluator(services, vms_template)
+    raw = float(np.mean(evaluator.evaluate(genomes) < INFEASIBLE_FITNESS))
+    repair = GenomeRepair(services, vms_template, evaluator=evaluator)
+    start = time.perf_counter()
+    repaired = repair.repair_all(genomes)
+    elapsed = time.perf_counter() - start
+    fixed = float(np.mean(evaluator.evaluate(repaired) < INFEASIBLE_FITNESS))
+    return raw, fixed, population / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AG : réparation des génomes infaisables")
+    parser.add_argument("--instances", nargs="+", default=["40x10", "60x12", "100x20"],
+                        help="instances generate_random_data, au format SERVICESxVMS")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1, 2, 3])
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=200)
+    args = parser.parse_args()
+
+    print("Population aléatoire (population initiale de l'AG)")
+    print(f"{'instance':>9} {'seed':>5} | {'réalisables':>11} | {'après répar.':>12} | {'génomes/s':>9}")
+    for text in args.instances:
+        n_services, n_vms = parse_instance(text)
+        for seed in args.seeds:
+            services, vms_template = generate_random_data(n_services, n_vms, seed)
+            raw, fixed, rate = feasible_share(services, vms_template, args.pop_size, seed)
+            print(f"{text:>9} {seed:>5} | {raw:>11.1%} | {fixed:>12.1%} | {rate:>9.0f}", flush=True)
+
+    print(f"\nAG ({args.generations} générations, population {args.pop_size}) : écart du makespan à la borne inférieure")
+    print(f"{'instance':>9} {'seed':>5} | {'réparation':<10} | {'temps (s)':>9} | {'makespan':>8} | {'écart':>6} | {'rejetés':>7}")
+    for text in args.instances:
+        n_services, n_vms = parse_instance(text)
+        for seed in args.seeds:
+            services, vms_template = generate_random_data(n_services, n_vms, seed)
+            if is_infeasible(services, vms_template):
+                print(f"{text:>9} {seed:>5} | instance infaisable, ignorée")
+                continue
+            bound = makespan_lower_bound(services, vms_template)
+            for label, params in MODES:
+                stats = {}
+                start = time.perf_counter()
+                _, vms = genetic_algorithm(services, vms_template, pop_size=args.pop_size,
+                                           generations=args.generations, seed=seed, tolerance=None,
+                                           stats=stats, **params)
+                elapsed = time.perf_counter() - start
+                makespan = max(vm.completion_time for vm in vms)
+                print(f"{text:>9} {seed:>5} | {label:<10} | {elapsed:>9.2f} | {makespan:>8.1f} | "
+                      f"{(makespan - bound) / bound:>6.1%} | {stats['rejected']:>7}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# benchmarks/bench_replan.py
+# Re-planification incrémentale (algorithms/replan.py) vs nouveau calcul complet avec
+# Min-Min après un delta de services ajoutés, retirés et redimensionnés.
+# Vérifie d'abord qu'une VM vidée par des retraits retrouve exactement sa capacité, puis
+# que le Replanner indexé (CompletionIndex) prend les mêmes décisions que la passe
+# vectorisée (indexed=False) ; code de sortie 1 sinon.
+# Usage : python -m benchmarks.bench_replan --instances 1000x200 20000x4000 --deltas 10 100 --max-migrations 20
+import argparse
+import random
+import sys
+import time
+
+from models.entities import Service, VM
+from utils.helpers import generate_random_data
+from algorithms.min_min import min_min
+from algorithms.replan import Replanner
+
+
+def make_delta(services, assignment, size: int, rng: random.Random):
+    """Delta de `size` services de chaque sorte : retirés, redimensionnés (+/- 50 %) et ajoutés."""
+    by_id = {s.id: s for s in services}
+    placed = rng.sample(sorted(assignment), min(2 * size, len(assignment)))
+    removed = placed[:size]
+    resized = []
+    for sid in placed[size:]:
+        s, factor = by_id[sid], rng.uniform(0.5, 1.5)
+        resized.append(Service(sid, s.cpu * factor, s.ram * factor, s.exec_time * factor))
+    start = max(by_id) + 1
+    added = [Service(start + i, round(rng.uniform(1, 5), 2), round(rng.uniform(2, 12), 2),
+                     round(rng.uniform(5, 40), 2)) for i in range(size)]
+    return added, removed, resized
+
+
+def apply_to_services(services, added, removed, resized):
+    """Liste de services après le delta (pour le calcul complet)."""
+    gone = set(removed)
+    new = {s.id: s for s in resized}
+    return [new.get(s.id, s) for s in services if s.id not in gone] + list(added)
+
+
+def check_exact_release(rounds: int = 200, seed: int = 1) -> list:
+    """
+    Remplit VM(0, 10, 10) de petits services, les retire tous avec Replanner.apply puis
+    ajoute un service de 10 CPU / 10 RAM : il doit être placé (un résidu d'arrondi sur
+    la capacité libérée le ferait rejeter). Renvoie les échecs.
+    """
+    rng = random.Random(seed)
+    failures = []
+    for round_ in range(rounds):
+        vm = VM(0, 10.0, 10.0)
+        planner = Replanner([vm])
+        batch = []
+        while True:
+            service = Service(len(batch), round(rng.uniform(0.1, 3), 3), round(rng.uniform(0.1, 3), 3), 1.0)
+            if not vm.can_host(service):
+                break
+            batch.append(service)
+            planner.apply(added=[service])
+        planner.apply(removed=[s.id for s in batch])
+        report = planner.apply(added=[Service(len(batch), 10.0, 10.0, 1.0)])
+        if report["rejected"]:
+            failures.append(f"essai {round_} : VM vidée à cpu_free={vm.cpu_free!r}, ram_free={vm.ram_free!r}, "
+                            f"service 10.0 / 10.0 rejeté")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-planification incrémentale vs calcul complet")
+    parser.add_argument("--instances", nargs="+", default=["1000x200", "20000x4000"],
+                        help="instances generate_random_data, au format SERVICESxVMS")
+    parser.add_argument("--deltas", nargs="+", type=int, default=[1, 10, 100],
+                        help="nombre de services ajoutés (autant de retirés et de redimensionnés)")
+    parser.add_argument("--max-migrations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    failures = check_exact_release(seed=args.seed)
+    for failure in failures[:5]:
+        print(f"ÉCHEC : {failure}")
+    if failures:
+        return 1
+    print("OK : une VM vidée par des retraits retrouve exactement sa capacité\n")
+
+    print(f"{'instance':>11} {'delta':>6} | {'complet (s)':>11} | {'makespan':>9} | {'replan (s)':>10} | "
+          f"{'sans index':>10} | {'makespan':>9} | {'rejetés':>7} | {'forcés':>6} | {'migrations':>10}")
+    status = 0
+    for text in args.instances:
+        n_services, n_vms = (int(x) for x in text.lower().split("x"))
+        services, vms_template = generate_random_data(n_services, n_vms, args.seed)
+        for size in args.deltas:
+            rng = random.Random(args.seed)
+            vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+            assignment = min_min(services.copy(), vms)
+            added, removed, resized = make_delta(services, assignment, size, rng)
+
+            # Calcul complet sur la nouvelle liste de services, VMs remises à zéro
+            full_vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+            start = time.perf_counter()
+            min_min(apply_to_services(services, added, removed, resized), full_vms)
+            full_time = time.perf_counter() - start
+            full_makespan = max(vm.completion_time for vm in full_vms)
+
+            # Même plan, sans index : mêmes décisions attendues
+            linear_vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+            for vm, copy in zip(vms, linear_vms):
+                for service in vm.services:
+                    copy.assign(service)
+            linear = Replanner(linear_vms, assignment, indexed=False)
+            start = time.perf_counter()
+            linear_report = linear.apply(added, removed, resized, args.max_migrations)
+            linear_time = time.perf_counter() - start
+
+            planner = Replanner(vms, assignment)   # construit une fois par plan
+            start = time.perf_counter()
+            report = planner.apply(added, removed, resized, args.max_migrations)
+            replan_time = time.perf_counter() - start
+            print(f"{text:>11} {size:>6} | {full_time:>11.4f} | {full_makespan:>9.1f} | {replan_time:>10.4f} | "
+                  f"{linear_time:>10.4f} | {report['makespan']:>9.1f} | {len(report['rejected']):>7} | "
+                  f"{report['forced_moves']:>6} | {report['migrations']:>10}", flush=True)
+            if report != linear_report or planner.assignment != linear.assignment:
+                print(f"ÉCHEC : {text}, delta {size} : le Replanner indexé ne place pas comme la passe vectorisée")
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
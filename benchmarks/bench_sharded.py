@@ -0,0 +1,124 @@
+# benchmarks/bench_sharded.py
+# Ordonnancement partitionné (algorithms/sharded.py) vs algorithme sur la flotte entière,
+# puis résolution des zones dans le processus courant vs dans `--workers` processus :
+# durée par étape, makespan et services rejetés. Instances utils.workload dont les
+# capacités des VMs sont multipliées par services / (5 x VMs) (au moins 1) : la demande
+# reste celle de 5 services par VM, environ 75 % du CPU et 80 % de la RAM, et les
+# services rejetés mesurent la qualité du placement et non un manque de capacité.
+# Avec plusieurs workers, l'exécution parallèle doit être plus rapide que l'exécution
+# dans le processus courant (code de sortie 1 sinon) ; sur une machine à un seul CPU, la
+# comparaison est remplacée par une estimation.
+# Usage : python -m benchmarks.bench_sharded --instances 20000x4000 1000000x50000 --algorithm min-min --workers 4
+import argparse
+import heapq
+import os
+import sys
+import time
+
+from models.entities import VM
+from utils.helpers import compute_metrics
+from utils.workload import generate_workload, DISTRIBUTIONS
+from algorithms import get_algorithm, ALGORITHMS
+from algorithms.sharded import sharded_schedule, PARTITIONS
+
+# Services par VM dont la demande fixe la taille des VMs
+SERVICES_PER_VM = 5
+
+STEPS = ("partition_s", "solve_s", "merge_s", "rebalance_s")
+
+
+def critical_path(durations, workers: int) -> float:
+    """Durée de la résolution des zones sur `workers` processus (la plus longue d'abord, au premier libre)."""
+    loads = [0.0] * workers
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ordonnancement partitionné vs flotte entière")
+    parser.add_argument("--instances", nargs="+", default=["20000x4000", "1000000x50000"],
+                        help="instances utils.workload, au format SERVICESxVMS")
+    parser.add_argument("--distribution", default="uniform", choices=DISTRIBUTIONS)
+    parser.add_argument("--algorithm", default="min-min", choices=list(ALGORITHMS))
+    parser.add_argument("--partitions", nargs="+", default=list(PARTITIONS), choices=list(PARTITIONS))
+    parser.add_argument("--zones", type=int, help="nombre de zones (défaut : une par 500 VMs)")
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1),
+                        help="processus de l'exécution parallèle (défaut : un par CPU, au moins 2)")
+    parser.add_argument("--flat-max-services", type=int, default=100_000,
+                        help="pas d'exécution sur la flotte entière au-delà de ce nombre de services")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    if args.workers < 2:
+        parser.error("--workers : au moins 2 processus (l'exécution dans le processus courant est toujours mesurée)")
+
+    cpus = os.cpu_count() or 1
+    status = 0
+    print(f"{'instance':>14} {'mode':>16} | {'durée (s)':>9} | {'makespan':>9} | {'rejetés':>8} | "
+          f"{'zones':>5} | répartition / résolution / fusion / inter-zones (s)")
+    for text in args.instances:
+        n_services, n_vms = (int(x) for x in text.lower().split("x"))
+        batch, state = generate_workload(n_services, n_vms, args.seed, args.distribution)
+        scale = max(1.0, n_services / (SERVICES_PER_VM * n_vms))
+        services = batch.to_services()
+        vms_template = [VM(vm.id, round(vm.cpu_capacity * scale, 2), round(vm.ram_capacity * scale, 2), vm.speed)
+                        for vm in state.to_vms()]
+        print(f"{text:>14} capacités x{scale:g}, demande / capacité : "
+              f"CPU {batch.cpu.sum() / sum(vm.cpu_capacity for vm in vms_template):.0%}, "
+              f"RAM {batch.ram.sum() / sum(vm.ram_capacity for vm in vms_template):.0%}", flush=True)
+
+        if n_services <= args.flat_max_services:
+            vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+            start = time.perf_counter()
+            if args.algorithm == "genetic algorithm":
+                _, vms = get_algorithm(args.algorithm)(services, vms_template, seed=args.seed)
+            else:
+                get_algorithm(args.algorithm)(services.copy(), vms)
+            elapsed = time.perf_counter() - start
+            metrics = compute_metrics(vms, services)
+            print(f"{text:>14} {'entière':>16} | {elapsed:>9.2f} | {metrics['makespan']:>9.2f} | "
+                  f"{metrics['rejected']:>8} | {1:>5} |", flush=True)
+
+        for partition in args.partitions:
+            runs = {}
+            for workers in (1, args.workers):
+                stats = {}
+                start = time.perf_counter()
+                assignment, vms = sharded_schedule(services, vms_template, args.algorithm, n_zones=args.zones,
+                                                   partition=partition, workers=workers,
+                                                   params={"seed": args.seed}, stats=stats)
+                elapsed = time.perf_counter() - start
+                runs[workers] = (elapsed, stats, assignment)
+                metrics = compute_metrics(vms, services)
+                steps = " / ".join(f"{stats[key]:.2f}" for key in STEPS)
+                mode = f"{partition} x{workers}"
+                print(f"{text:>14} {mode:>16} | {elapsed:>9.2f} | {metrics['makespan']:>9.2f} | "
+                      f"{metrics['rejected']:>8} | {stats['zones']:>5} | {steps}", flush=True)
+
+            serial_time, serial_stats, serial_assignment = runs[1]
+            parallel_time, parallel_stats, parallel_assignment = runs[args.workers]
+            zones_time = sum(serial_stats["zone_solve_s"])
+            sequential = serial_time - zones_time
+            # Surcoût du pool (envoi des zones, démarrage des processus, retour des résultats) :
+            # durée de la résolution parallèle au-delà de celle des zones réparties sur les CPU
+            overhead = max(0.0, parallel_stats["solve_s"]
+                           - critical_path(serial_stats["zone_solve_s"], min(args.workers, cpus)))
+            print(f"{'':>14} résolution des zones : {zones_time:.2f} s parallélisables, {sequential:.2f} s "
+                  f"séquentielles (répartition, fusion, inter-zones) ; surcoût du pool ~{overhead:.2f} s")
+            if parallel_assignment != serial_assignment:
+                print(f"ÉCHEC : {text} : l'exécution parallèle ne donne pas la même affectation")
+                status = 1
+            if cpus > 1:
+                if parallel_time >= serial_time:
+                    print(f"ÉCHEC : {text} : {args.workers} processus ({parallel_time:.2f} s) ne battent pas "
+                          f"le processus courant ({serial_time:.2f} s)")
+                    status = 1
+            else:
+                estimate = sequential + critical_path(serial_stats["zone_solve_s"], args.workers) + overhead
+                print(f"{'':>14} un seul CPU : pas de comparaison ; estimation avec {args.workers} CPU : "
+                      f"~{estimate:.2f} s contre {serial_time:.2f} s")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,69 @@
+# benchmarks/bench_warm_start.py
+# Temps pour atteindre un makespan cible : AG démarré à froid vs démarrage à chaud
+# (population en partie construite à partir des heuristiques).
+# Usage : python -m benchmarks.bench_warm_start --instances 40x10 60x12 100x20 --seeds 1 2 3 4 5
+import argparse
+import time
+
+from utils.helpers import generate_random_data
+from algorithms.bounds import is_infeasible, makespan_lower_bound
+from algorithms.genetic import genetic_algorithm
+from algorithms.fitness import INFEASIBLE_FITNESS
+
+
+def parse_instance(text: str):
+    services, vms = text.lower().split("x")
+    return int(services), int(vms)
+
+
+def time_to_target(services, vms_template, target_gap: float, warm_start: float, args, seed: int):
+    """(temps en s, générations, cible atteinte, écart final à la borne) pour un run arrêté à la cible."""
+    stats = {}
+    start = time.perf_counter()
+    genetic_algorithm(services, vms_template, pop_size=args.pop_size, generations=args.generations,
+                      seed=seed, tolerance=target_gap, warm_start=warm_start, stats=stats)
+    elapsed = time.perf_counter() - start
+    # Aucun individu réalisable trouvé : l'écart n'a pas de sens
+    gap = None if stats["best_fitness"] >= INFEASIBLE_FITNESS else stats["gap"]
+    return elapsed, stats["generations_run"], stats["stop_reason"] == "bound", gap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AG : temps pour atteindre un makespan cible, à froid vs à chaud")
+    parser.add_argument("--instances", nargs="+", default=["40x10", "60x12", "100x20"],
+                        help="instances generate_random_data, au format SERVICESxVMS")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1, 2, 3, 4, 5])
+    parser.add_argument("--target-gap", type=float, default=0.15,
+                        help="cible : makespan <= borne inférieure x (1 + target_gap)")
+    parser.add_argument("--warm-start", type=float, default=0.2, help="fraction de la population amorcée")
+    parser.add_argument("--pop-size", type=int, default=100)
+    parser.add_argument("--generations", type=int, default=300, help="budget max. de générations")
+    args = parser.parse_args()
+
+    print(f"Cible : makespan <= borne inférieure x {1 + args.target_gap:.2f}, "
+          f"budget {args.generations} générations, population {args.pop_size}")
+    print(f"{'instance':>9} {'seed':>5} | {'départ':<6} | {'atteinte':>8} | {'temps (s)':>9} | {'générations':>11} | {'écart final':>11}")
+    totals = {"froid": [0, 0.0], "chaud": [0, 0.0]}
+    for text in args.instances:
+        n_services, n_vms = parse_instance(text)
+        for seed in args.seeds:
+            services, vms_template = generate_random_data(n_services, n_vms, seed)
+            if is_infeasible(services, vms_template):
+                print(f"{text:>9} {seed:>5} | instance infaisable, ignorée")
+                continue
+            for label, warm_start in (("froid", 0.0), ("chaud", args.warm_start)):
+                elapsed, generations, reached, gap = time_to_target(services, vms_template, args.target_gap,
+                                                                    warm_start, args, seed)
+                totals[label][0] += reached
+                totals[label][1] += elapsed
+                print(f"{text:>9} {seed:>5} | {label:<6} | {'oui' if reached else 'non':>8} | "
+                      f"{elapsed:>9.3f} | {generations:>11} | {'infaisable' if gap is None else f'{gap:.1%}':>11}", flush=True)
+        print(f"{'':>9} {'':>5} | borne inférieure du makespan (dernière graine) : "
+              f"{makespan_lower_bound(services, vms_template):.2f}")
+
+    for label, (reached, elapsed) in totals.items():
+        print(f"Départ à {label} : cible atteinte {reached} fois, temps total {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/run.py
+# Banc d'essai en ligne de commande (sans Streamlit ni matplotlib) : balaye
+# algorithmes × nb de services × nb de VMs × graines × paramètres de l'AG.
+# Usage : python -m benchmarks.run --algorithms first-fit best-fit --services 100 1000 \
+#             --vms 10 50 --seeds 1 2 3 --repeats 5 --csv results.csv --json results.json
+import argparse
+import csv
+import itertools
+import json
+import math
+import sys
+from typing import List, Dict
+
+from algorithms import ALGORITHMS, METAHEURISTICS
+from utils.helpers import generate_random_data, compute_metrics, run_algorithm
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentile par interpolation linéaire (même convention que numpy.percentile)."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def ga_settings(args) -> List[Dict]:
+    """Combinaisons des paramètres de l'AG à balayer."""
+    keys = ("pop_size", "generations", "objective", "islands")
+    grid = itertools.product(args.pop_size, args.generations, args.objective, args.islands)
+    return [dict(zip(keys, values)) for values in grid]
+
+
+def run_cell(name: str, n_services: int, n_vms: int, seed: int, params: Dict, repeats: int,
+             speeds=None) -> Dict:
+    """Exécute une configuration `repeats` fois et agrège les durées."""
+    services, vms_template = generate_random_data(n_services, n_vms, seed, speeds)
+    if name in METAHEURISTICS:
+        params = dict(params, seed=seed)
+    times = []
+    for _ in range(repeats):
+        _, vms_result, elapsed = run_algorithm(name, services, vms_template, **params)
+        times.append(elapsed)
+    # Les exécutions sont déterministes (graine fixée) : métriques de la dernière
+    metrics = compute_metrics(vms_result, services)
+
+    row = {"algorithm": name, "services": n_services, "vms": n_vms, "seed": seed}
+    for key in ("pop_size", "generations", "objective", "islands"):
+        row[key] = params.get(key, "")
+    row["repeats"] = repeats
+    row["time_min_s"] = min(times)
+    row["time_mean_s"] = sum(times) / len(times)
+    for q in PERCENTILES:
+        row[f"time_p{q}_s"] = percentile(times, q)
+    row["makespan"] = metrics["makespan"]
+    row["rejected"] = metrics["rejected"]
+    row["vms_used"] = metrics["vms_used"]
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai des algorithmes d'affectation (balayage de paramètres)")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS),
+                        metavar="ALGO", help=f"parmi : {', '.join(ALGORITHMS)}")
+    parser.add_argument("--services", nargs="+", type=int, default=[100])
+    parser.add_argument("--vms", nargs="+", type=int, default=[10])
+    parser.add_argument("--seeds", nargs="+", type=int, default=[123])
+    parser.add_argument("--repeats", type=int, default=5, help="exécutions par configuration")
+    parser.add_argument("--pop-size", nargs="+", type=int, default=[100])
+    parser.add_argument("--generations", nargs="+", type=int, default=[200])
+    parser.add_argument("--objective", nargs="+", default=["makespan"], choices=["makespan", "vms", "hybrid"])
+    parser.add_argument("--islands", nargs="+", type=int, default=[1])
+    parser.add_argument("--speeds", nargs="+", type=float,
+                        help="vitesses possibles des VMs (flotte hétérogène, ex. 0.5 1 2)")
+    parser.add_argument("--csv", help="fichier CSV de sortie")
+    parser.add_argument("--json", help="fichier JSON de sortie")
+    args = parser.parse_args(argv)
+
+    rows = []
+    for name, n_services, n_vms, seed in itertools.product(args.algorithms, args.services, args.vms, args.seeds):
+        settings = ga_settings(args) if name in METAHEURISTICS else [{}]
+        for params in settings:
+            row = run_cell(name, n_services, n_vms, seed, params, max(1, args.repeats), args.speeds)
+            rows.append(row)
+            label = f"{name} {n_services}x{n_vms} seed={seed}"
+            if params:
+                label += " " + " ".join(f"{k}={v}" for k, v in params.items())
+            print(f"{label:<70} p50={row['time_p50_s']:.4f}s p90={row['time_p90_s']:.4f}s "
+                  f"makespan={row['makespan']} rejetés={row['rejected']} VMs={row['vms_used']}",
+                  flush=True)
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,208 @@
+# benchmarks/scaling.py
+# Passage à l'échelle des algorithmes sur des instances fixes (graine fixée), des données
+# fournies (data/*.json) jusqu'à 10^5-10^6 services : durée, pic mémoire et qualité par
+# algorithme, exposant empirique de la durée en fonction de la taille (pente locale entre
+# les plus grandes échelles), et comparaison à une référence enregistrée (code de sortie 1
+# en cas de régression de durée, d'exposant ou de mémoire).
+# Usage : python -m benchmarks.scaling --save-baseline benchmarks/scaling_baseline.json
+#         python -m benchmarks.scaling --check benchmarks/scaling_baseline.json
+#         python -m benchmarks.scaling --scales data 1000x200 100000x20000 1000000x200000 --algorithms first-fit
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from algorithms import ALGORITHMS, METAHEURISTICS
+from utils.helpers import load_data, compute_metrics, run_algorithm
+from benchmarks.run import percentile
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Services et VMs croissent ensemble (5 services par VM) : un algorithme en O(n x m), comme
+# Min-Min / Max-Min qui évaluent chaque service sur toutes les VMs, tend vers un exposant
+# de 2 par rapport au nombre de services
+DEFAULT_SCALES = ["data", "1000x200", "10000x2000", "100000x20000"]
+
+# Budget réduit de l'AG : on mesure le coût d'une génération, pas la qualité finale
+GA_PARAMS = {"pop_size": 30, "generations": 20, "tolerance": None}
+
+# Au-delà, l'AG n'est mesuré qu'à la demande : même au budget réduit, sa durée dépasse
+# plusieurs minutes (~200 s à 100000x20000, pour ~400 Mo de mémoire)
+GA_MAX_SERVICES = 10_000
+
+# Durées trop courtes pour l'ajustement (bruit de mesure)
+MIN_TIME_S = 0.005
+
+# Durées de référence trop courtes pour conclure à un ralentissement
+MIN_COMPARE_S = 0.05
+
+# Pics mémoire de référence trop faibles pour conclure à une régression (Mo)
+MIN_COMPARE_MB = 1.0
+
+# Au-delà de cette durée, une seule exécution chronométrée suffit
+SINGLE_RUN_S = 1.0
+
+
+def load_scale(scale: str, seed: int):
+    """Instance d'une échelle : "data" (fichiers JSON fournis) ou "SERVICESxVMS" (générée)."""
+    if scale == "data":
+        return load_data(os.path.join(DATA_DIR, "vms.json"), os.path.join(DATA_DIR, "services.json"))
+    from utils.workload import legacy_instance
+    n_services, n_vms = (int(x) for x in scale.lower().split("x"))
+    # Mêmes instances que generate_random_data, générées en NumPy
+    services, state = legacy_instance(n_services, n_vms, seed)
+    return services.to_services(), state.to_vms()
+
+
+def measure(name: str, services, vms_template, params: Dict, repeats: int, memory: bool) -> Dict:
+    """
+    Durée minimale (la moins perturbée par la machine) et médiane sur `repeats`
+    exécutions, pic mémoire (tracemalloc) et qualité.
+    """
+    times = []
+    for _ in range(repeats):
+        _, vms_result, elapsed = run_algorithm(name, services, vms_template, **params)
+        times.append(elapsed)
+        if elapsed > SINGLE_RUN_S:
+            break
+    peak_mb = None
+    if memory:
+        # Exécution séparée : tracemalloc ralentit les allocations Python
+        tracemalloc.start()
+        run_algorithm(name, services, vms_template, **params)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    metrics = compute_metrics(vms_result, services)
+    return {"time_s": min(times), "time_p50_s": percentile(times, 50), "peak_mb": peak_mb, "makespan": metrics["makespan"],
+            "rejected": metrics["rejected"], "vms_used": metrics["vms_used"]}
+
+
+def local_slopes(rows: List[Dict]) -> List[float]:
+    """
+    Pentes de log(durée) en fonction de log(nombre de services) entre échelles générées
+    (même proportion de VMs) consécutives, par taille croissante ; seules les durées d'au
+    moins MIN_TIME_S sont retenues.
+    """
+    points = sorted((r["services"], r["time_s"]) for r in rows if r["scale"] != "data" and r["time_s"] >= MIN_TIME_S)
+    return [(math.log(t2) - math.log(t1)) / (math.log(n2) - math.log(n1))
+            for (n1, t1), (n2, t2) in zip(points, points[1:]) if n2 > n1]
+
+
+def fit_exponent(rows: List[Dict]) -> Optional[float]:
+    """
+    Exposant empirique : pente locale entre les deux plus grandes échelles mesurées (None
+    s'il y en a moins de deux). Un ajustement sur toutes les échelles le sous-estime : sur
+    les petites instances, les coûts fixes masquent la croissance.
+    """
+    slopes = local_slopes(rows)
+    return slopes[-1] if slopes else None
+
+
+def compare(report: Dict, baseline: Dict, exponent_tolerance: float, slowdown: float) -> List[str]:
+    """
+    Régressions par rapport à la référence : exposant supérieur de plus de
+    `exponent_tolerance`, ou durée (référence d'au moins MIN_COMPARE_S) ou pic mémoire
+    (référence d'au moins MIN_COMPARE_MB) multiplié par plus de `slowdown` sur une échelle
+    mesurée des deux côtés. Les changements de qualité sont signalés sans faire échouer la
+    comparaison.
+    """
+    failures = []
+    if report["scales"] != baseline["scales"]:
+        print("AVERTISSEMENT : échelles différentes de celles de la référence, exposants mesurés sur d'autres tailles")
+    for name, exponent in report["exponents"].items():
+        reference = baseline["exponents"].get(name)
+        if exponent is not None and reference is not None and exponent > reference + exponent_tolerance:
+            failures.append(f"{name} : exposant {exponent:.2f} > {reference:.2f} + {exponent_tolerance:g}")
+    reference_rows = {(r["algorithm"], r["scale"]): r for r in baseline["results"]}
+    for row in report["results"]:
+        reference = reference_rows.get((row["algorithm"], row["scale"]))
+        if reference is None:
+            continue
+        label = f"{row['algorithm']} {row['scale']}"
+        if reference["time_s"] >= MIN_COMPARE_S and row["time_s"] > slowdown * reference["time_s"]:
+            failures.append(f"{label} : {row['time_s']:.4f} s > {slowdown:g} x {reference['time_s']:.4f} s")
+        if (row["makespan"], row["rejected"]) != (reference["makespan"], reference["rejected"]):
+            print(f"AVERTISSEMENT : {label} : makespan {reference['makespan']} -> {row['makespan']}, "
+                  f"rejetés {reference['rejected']} -> {row['rejected']}")
+        if (row["peak_mb"] is not None and (reference.get("peak_mb") or 0) >= MIN_COMPARE_MB
+                and row["peak_mb"] > slowdown * reference["peak_mb"]):
+            failures.append(f"{label} : pic mémoire {row['peak_mb']:.1f} Mo > {slowdown:g} x "
+                            f"{reference['peak_mb']:.1f} Mo")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Passage à l'échelle des algorithmes et régressions de complexité")
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS),
+                        metavar="ALGO", help=f"parmi : {', '.join(ALGORITHMS)}")
+    parser.add_argument("--scales", nargs="+", default=DEFAULT_SCALES,
+                        help="\"data\" ou SERVICESxVMS (instances generate_random_data)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5, help="exécutions chronométrées par mesure")
+    parser.add_argument("--budget-s", type=float, default=30.0,
+                        help="au-delà de cette durée, les échelles suivantes ne sont pas mesurées pour l'algorithme")
+    parser.add_argument("--ga-max-services", type=int, default=GA_MAX_SERVICES,
+                        help="échelle maximale pour les métaheuristiques")
+    parser.add_argument("--no-memory", action="store_true", help="pas de mesure du pic mémoire")
+    parser.add_argument("--json", help="fichier JSON du rapport")
+    parser.add_argument("--save-baseline", help="enregistre le rapport comme référence")
+    parser.add_argument("--check", help="référence à laquelle comparer (code de sortie 1 si régression)")
+    parser.add_argument("--exponent-tolerance", type=float, default=0.3)
+    parser.add_argument("--slowdown", type=float, default=1.5,
+                        help="facteur de ralentissement (et d'augmentation du pic mémoire) toléré")
+    args = parser.parse_args(argv)
+
+    results, skipped = [], set()
+    print(f"{'algorithme':>18} {'échelle':>15} | {'durée (s)':>9} | {'mémoire (Mo)':>12} | {'makespan':>9} | "
+          f"{'rejetés':>7}")
+    for scale in args.scales:
+        services, vms_template = load_scale(scale, args.seed)
+        for name in args.algorithms:
+            if name in skipped or (name in METAHEURISTICS and len(services) > args.ga_max_services):
+                continue
+            params = dict(GA_PARAMS, seed=args.seed) if name in METAHEURISTICS else {}
+            row = {"algorithm": name, "scale": scale, "services": len(services), "vms": len(vms_template)}
+            row.update(measure(name, services, vms_template, params, max(1, args.repeats), not args.no_memory))
+            results.append(row)
+            memory = f"{row['peak_mb']:>12.1f}" if row["peak_mb"] is not None else f"{'-':>12}"
+            print(f"{name:>18} {scale:>15} | {row['time_s']:>9.4f} | {memory} | {row['makespan']:>9.2f} | "
+                  f"{row['rejected']:>7}", flush=True)
+            if row["time_s"] > args.budget_s:
+                skipped.add(name)
+
+    rows = {name: [r for r in results if r["algorithm"] == name] for name in args.algorithms}
+    slopes = {name: local_slopes(rows[name]) for name in args.algorithms}
+    exponents = {name: fit_exponent(rows[name]) for name in args.algorithms}
+    print("\nExposant empirique (durée ~ services^k, VMs proportionnelles), pente entre les deux plus grandes "
+          "échelles ; pentes locales par taille croissante :")
+    for name, exponent in exponents.items():
+        print(f"  {name:<18} {'-' if exponent is None else f'{exponent:.2f}':>5}   "
+              f"{' '.join(f'{slope:.2f}' for slope in slopes[name])}")
+
+    report = {"python": platform.python_version(), "machine": platform.machine(), "processor": platform.processor(),
+              "created": time.strftime("%Y-%m-%d %H:%M:%S"), "seed": args.seed, "scales": args.scales,
+              "results": results, "exponents": exponents,
+              "slopes": slopes}
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+    if not args.check:
+        return 0
+    with open(args.check) as f:
+        baseline = json.load(f)
+    failures = compare(report, baseline, args.exponent_tolerance, args.slowdown)
+    for failure in failures:
+        print(f"ÉCHEC : {failure}")
+    if not failures:
+        print("OK")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
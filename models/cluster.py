@@ -0,0 +1,314 @@
+# models/cluster.py
+# État du cluster en « structure de tableaux » : une colonne NumPy par grandeur au lieu
+# d'un objet Python par VM / par service. Des vues légères (__slots__) exposent la même
+# API que Service et VM pour que les algorithmes existants fonctionnent sans changement.
+import numpy as np
+from typing import List, Optional, Union
+from models.entities import Service, VM
+
+
+class ServiceBatch:
+    """
+    Lot de services en colonnes (cpu, ram, exec_time en float64).
+
+    Les identifiants ne sont stockés que s'ils diffèrent des positions 0..n-1 : un
+    service coûte alors 24 octets (+ 4 octets d'affectation dans ClusterState).
+    """
+    __slots__ = ("cpu", "ram", "exec_time", "_ids")
+
+    def __init__(self, cpu, ram, exec_time, ids=None):
+        self.cpu = np.asarray(cpu, dtype=np.float64)
+        self.ram = np.asarray(ram, dtype=np.float64)
+        self.exec_time = np.asarray(exec_time, dtype=np.float64)
+        if ids is not None:
+            ids = np.asarray(ids, dtype=np.int64)
+            if np.array_equal(ids, np.arange(len(ids))):
+                ids = None
+        self._ids = ids
+
+    @classmethod
+    def from_columns(cls, cpu, ram, exec_time, ids=None) -> "ServiceBatch":
+        """
+        Lot construit directement sur des colonnes float64 existantes (par ex. projetées
+        en mémoire), sans copie ni lecture : `ids` vaut None pour les identifiants 0..n-1.
+        """
+        batch = cls.__new__(cls)
+        batch.cpu, batch.ram, batch.exec_time, batch._ids = cpu, ram, exec_time, ids
+        return batch
+
+    @classmethod
+    def from_services(cls, services: List[Service]) -> "ServiceBatch":
+        return cls([s.cpu for s in services], [s.ram for s in services],
+                   [s.exec_time for s in services], [s.id for s in services])
+
+    def __len__(self):
+        return len(self.cpu)
+
+    def __getitem__(self, key: slice) -> "ServiceBatch":
+        """Sous-lot (tranche) : les colonnes sont des vues, sans copie."""
+        if self._ids is None:
+            positions = range(len(self.cpu))[key]
+            ids = np.arange(positions.start, positions.stop, positions.step)
+        else:
+            ids = self._ids[key]
+        return ServiceBatch(self.cpu[key], self.ram[key], self.exec_time[key], ids)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids if self._ids is not None else np.arange(len(self.cpu))
+
+    @property
+    def nbytes(self) -> int:
+        ids_bytes = self._ids.nbytes if self._ids is not None else 0
+        return self.cpu.nbytes + self.ram.nbytes + self.exec_time.nbytes + ids_bytes
+
+    def id_of(self, index: int) -> int:
+        return int(self._ids[index]) if self._ids is not None else int(index)
+
+    def view(self, index: int) -> "ServiceView":
+        return ServiceView(self, index)
+
+    def views(self) -> List["ServiceView"]:
+        return [ServiceView(self, i) for i in range(len(self))]
+
+    def to_services(self) -> List[Service]:
+        ids = self.ids.tolist()
+        return [Service(i, c, r, t) for i, c, r, t in
+                zip(ids, self.cpu.tolist(), self.ram.tolist(), self.exec_time.tolist())]
+
+
+class ServiceView:
+    """Vue d'un service d'un ServiceBatch, avec l'API de `Service`."""
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: ServiceBatch, index: int):
+        self.batch = batch
+        self.index = index
+
+    @property
+    def id(self) -> int:
+        return self.batch.id_of(self.index)
+
+    @property
+    def cpu(self) -> float:
+        return float(self.batch.cpu[self.index])
+
+    @property
+    def ram(self) -> float:
+        return float(self.batch.ram[self.index])
+
+    @property
+    def exec_time(self) -> float:
+        return float(self.batch.exec_time[self.index])
+
+    def __repr__(self):
+        return f"S{self.id}(cpu={self.cpu}, ram={self.ram}, t={self.exec_time})"
+
+
+class ClusterState:
+    """
+    Capacités, vitesses, ressources libres / utilisées, temps de complétion et nombre de
+    services de chaque VM, plus le vecteur d'affectation des services (-1 : non affecté).
+
+    Toutes les requêtes sur une VM sont en O(1). Les mises à jour reproduisent les
+    opérations de `VM.assign` dans le même ordre, donc les mêmes valeurs flottantes.
+    """
+    __slots__ = ("cpu_capacity", "ram_capacity", "speed", "cpu_free", "ram_free", "cpu_used", "ram_used",
+                 "completion_time", "n_services", "assignment", "services", "_ids", "_service_index")
+
+    def __init__(self, cpu_capacity, ram_capacity, services: Optional[ServiceBatch] = None, ids=None,
+                 speed=None):
+        self.cpu_capacity = np.asarray(cpu_capacity, dtype=np.float64)
+        self.ram_capacity = np.asarray(ram_capacity, dtype=np.float64)
+        n_vms = len(self.cpu_capacity)
+        self.speed = np.ones(n_vms) if speed is None else np.asarray(speed, dtype=np.float64)
+        self.cpu_free = self.cpu_capacity.copy()
+        self.ram_free = self.ram_capacity.copy()
+        self.cpu_used = np.zeros(n_vms)
+        self.ram_used = np.zeros(n_vms)
+        self.completion_time = np.zeros(n_vms)
+        self.n_services = np.zeros(n_vms, dtype=np.int32)
+        self.services = services if services is not None else ServiceBatch([], [], [])
+        self.assignment = np.full(len(self.services), -1, dtype=np.int32)
+        if ids is not None:
+            ids = np.asarray(ids, dtype=np.int64)
+            if np.array_equal(ids, np.arange(n_vms)):
+                ids = None
+        self._ids = ids
+        self._service_index = None   # id de service -> position (construit à la demande)
+
+    @classmethod
+    def from_vms(cls, vms: List[VM], services: Union[List[Service], ServiceBatch, None] = None) -> "ClusterState":
+        """État vide (VMs réinitialisées) à partir d'objets VM et d'une liste de services."""
+        if services is not None and not isinstance(services, ServiceBatch):
+            services = ServiceBatch.from_services(services)
+        return cls([vm.cpu_capacity for vm in vms], [vm.ram_capacity for vm in vms],
+                   services, [vm.id for vm in vms], [vm.speed for vm in vms])
+
+    def __len__(self):
+        return len(self.cpu_capacity)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.cpu_capacity, self.ram_capacity, self.speed, self.cpu_free, self.ram_free, self.cpu_used,
+                  self.ram_used, self.completion_time, self.n_services, self.assignment)
+        ids_bytes = self._ids.nbytes if self._ids is not None else 0
+        return sum(a.nbytes for a in arrays) + ids_bytes + self.services.nbytes
+
+    def vm_id(self, vm: int) -> int:
+        return int(self._ids[vm]) if self._ids is not None else int(vm)
+
+    def service_position(self, service) -> int:
+        """Position d'un service (ServiceView du lot ou objet Service) dans le lot."""
+        if isinstance(service, ServiceView) and service.batch is self.services:
+            return service.index
+        if self._service_index is None:
+            self._service_index = {sid: i for i, sid in enumerate(self.services.ids.tolist())}
+        return self._service_index[service.id]
+
+    def can_host(self, vm: int, service: int) -> bool:
+        return bool(self.cpu_free[vm] >= self.services.cpu[service] and
+                    self.ram_free[vm] >= self.services.ram[service])
+
+    def assign(self, vm: int, service: int):
+        if not self.can_host(vm, service):
+            raise ValueError(f"VM{self.vm_id(vm)} ne peut pas héberger S{self.services.id_of(service)}")
+        cpu, ram = self.services.cpu[service], self.services.ram[service]
+        self.cpu_free[vm] -= cpu
+        self.ram_free[vm] -= ram
+        self.cpu_used[vm] += cpu
+        self.ram_used[vm] += ram
+        # On suppose exécution séquentielle sur la VM
+        self.completion_time[vm] += self.services.exec_time[service] / self.speed[vm]
+        self.n_services[vm] += 1
+        self.assignment[service] = vm
+
+    def release(self, vm: int, service: int):
+        """
+        Libère les ressources d'un service affecté à la VM (inverse de assign). Les
+        totaux de la VM sont recalculés à partir de ses services restants : O(n) si
+        elle en garde, O(1) si elle est vidée.
+        """
+        if self.assignment[service] != vm:
+            raise ValueError(f"S{self.services.id_of(service)} n'est pas hébergé par VM{self.vm_id(vm)}")
+        self.assignment[service] = -1
+        self.n_services[vm] -= 1
+        # Totaux recalculés à partir des services restants (dans l'ordre des services) :
+        # pas de résidu d'arrondi, une VM vidée retrouve exactement sa capacité
+        remaining = self.services_of(vm) if self.n_services[vm] else np.empty(0, dtype=np.intp)
+        cpu, ram = self.services.cpu[remaining], self.services.ram[remaining]
+        # np.cumsum accumule séquentiellement : même arrondi que les `-=` / `+=` de assign
+        self.cpu_free[vm] = np.cumsum(np.concatenate(([self.cpu_capacity[vm]], -cpu)))[-1]
+        self.ram_free[vm] = np.cumsum(np.concatenate(([self.ram_capacity[vm]], -ram)))[-1]
+        self.cpu_used[vm] = np.cumsum(np.concatenate(([0.0], cpu)))[-1]
+        self.ram_used[vm] = np.cumsum(np.concatenate(([0.0], ram)))[-1]
+        self.completion_time[vm] = np.cumsum(np.concatenate(([0.0], self.services.exec_time[remaining]
+                                                             / self.speed[vm])))[-1]
+
+    def reset(self, vm: Optional[int] = None):
+        """Réinitialise une VM (ou toutes si vm est None)."""
+        selector = slice(None) if vm is None else vm
+        self.cpu_free[selector] = self.cpu_capacity[selector]
+        self.ram_free[selector] = self.ram_capacity[selector]
+        self.cpu_used[selector] = 0.0
+        self.ram_used[selector] = 0.0
+        self.completion_time[selector] = 0.0
+        self.n_services[selector] = 0
+        if vm is None:
+            self.assignment[:] = -1
+        else:
+            self.assignment[self.assignment == vm] = -1
+
+    def services_of(self, vm: int) -> np.ndarray:
+        """Positions des services affectés à une VM, dans l'ordre des services (O(n))."""
+        return np.flatnonzero(self.assignment == vm)
+
+    def vms(self) -> List["VMView"]:
+        return [VMView(self, v) for v in range(len(self))]
+
+    def assignment_dict(self):
+        """Affectation au format des algorithmes : {id service: id VM}."""
+        positions = np.flatnonzero(self.assignment >= 0)
+        return {self.services.id_of(s): self.vm_id(v)
+                for s, v in zip(positions.tolist(), self.assignment[positions].tolist())}
+
+    def to_vms(self) -> List[VM]:
+        """Matérialise des objets VM remplis (affichage, métriques)."""
+        vms = [VM(self.vm_id(v), float(self.cpu_capacity[v]), float(self.ram_capacity[v]), float(self.speed[v]))
+               for v in range(len(self))]
+        services = self.services
+        for s, v in enumerate(self.assignment.tolist()):
+            if v >= 0:
+                vms[v].assign(Service(services.id_of(s), float(services.cpu[s]),
+                                      float(services.ram[s]), float(services.exec_time[s])))
+        return vms
+
+
+class VMView:
+    """Vue d'une VM d'un ClusterState, avec l'API de `VM` (requêtes en O(1))."""
+    __slots__ = ("state", "index")
+
+    def __init__(self, state: ClusterState, index: int):
+        self.state = state
+        self.index = index
+
+    @property
+    def id(self) -> int:
+        return self.state.vm_id(self.index)
+
+    @property
+    def cpu_capacity(self) -> float:
+        return float(self.state.cpu_capacity[self.index])
+
+    @property
+    def ram_capacity(self) -> float:
+        return float(self.state.ram_capacity[self.index])
+
+    @property
+    def speed(self) -> float:
+        return float(self.state.speed[self.index])
+
+    @property
+    def cpu_free(self) -> float:
+        return float(self.state.cpu_free[self.index])
+
+    @property
+    def ram_free(self) -> float:
+        return float(self.state.ram_free[self.index])
+
+    @property
+    def completion_time(self) -> float:
+        return float(self.state.completion_time[self.index])
+
+    @property
+    def services(self) -> List[ServiceView]:
+        """Services affectés (liste construite à la demande : O(n), à réserver à l'affichage)."""
+        batch = self.state.services
+        return [ServiceView(batch, s) for s in self.state.services_of(self.index).tolist()]
+
+    def exec_time_of(self, service) -> float:
+        return service.exec_time / self.speed
+
+    def can_host(self, service) -> bool:
+        return (self.cpu_free >= service.cpu and
+                self.ram_free >= service.ram)
+
+    def assign(self, service):
+        if not self.can_host(service):
+            raise ValueError(f"VM{self.id} ne peut pas héberger {service}")
+        self.state.assign(self.index, self.state.service_position(service))
+
+    def release(self, service):
+        self.state.release(self.index, self.state.service_position(service))
+
+    def reset(self):
+        self.state.reset(self.index)
+
+    def cpu_used(self) -> float:
+        return float(self.state.cpu_used[self.index])
+
+    def ram_used(self) -> float:
+        return float(self.state.ram_used[self.index])
+
+    def __repr__(self):
+        return f"VM{self.id}(free_cpu={self.cpu_free:.1f}, free_ram={self.ram_free:.1f})"
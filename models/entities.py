@@ -13,14 +13,22 @@ class Service:
 
 
 class VM:
-    def __init__(self, id: int, cpu_capacity: float, ram_capacity: float):
+    def __init__(self, id: int, cpu_capacity: float, ram_capacity: float, speed: float = 1.0):
         self.id = id
         self.cpu_capacity = cpu_capacity
         self.ram_capacity = ram_capacity
+        self.speed = speed      # vitesse relative à la VM de référence (génération d'instance)
         self.cpu_free = cpu_capacity
         self.ram_free = ram_capacity
         self.services: List[Service] = []
         self.completion_time = 0.0   # makespan de cette VM
+        # Totaux utilisés tenus à jour par assign() : cpu_used()/ram_used() en O(1)
+        self._cpu_used = 0
+        self._ram_used = 0
+
+    def exec_time_of(self, service: Service) -> float:
+        """Temps d'exécution du service sur cette VM (même valeur que la matrice ETC, models/etc.py)."""
+        return service.exec_time / self.speed
 
     def can_host(self, service: Service) -> bool:
         return (self.cpu_free >= service.cpu and 
@@ -32,18 +40,55 @@ class VM:
         self.services.append(service)
         self.cpu_free -= service.cpu
         self.ram_free -= service.ram
+        self._cpu_used += service.cpu
+        self._ram_used += service.ram
         # On suppose exécution séquentielle sur la VM
-        self.completion_time += service.exec_time
+        self.completion_time += self.exec_time_of(service)
+
+    def release(self, service: Service):
+        """
+        Libère les ressources d'un service hébergé (inverse de assign). Les totaux sont
+        recalculés à partir des services restants, dans leur ordre d'affectation : des
+        `+=` / `-=` successifs laisseraient un résidu d'arrondi, et une VM vidée ne
+        retrouverait pas exactement sa capacité.
+        """
+        self.services.remove(service)
+        self.cpu_free = self.cpu_capacity
+        self.ram_free = self.ram_capacity
+        self._cpu_used = 0
+        self._ram_used = 0
+        self.completion_time = 0.0
+        for remaining in self.services:
+            self.cpu_free -= remaining.cpu
+            self.ram_free -= remaining.ram
+            self._cpu_used += remaining.cpu
+            self._ram_used += remaining.ram
+            self.completion_time += self.exec_time_of(remaining)
+
+    def snapshot(self) -> tuple:
+        """Ressources libres, totaux utilisés et fin d'exécution, valeurs flottantes exactes."""
+        return self.cpu_free, self.ram_free, self._cpu_used, self._ram_used, self.completion_time
+
+    def restore(self, services: List[Service], snapshot: tuple):
+        """
+        Remet la VM dans l'état d'une VM qui a reçu `services` (dans cet ordre) par assign,
+        `snapshot` étant son snapshot() : mêmes valeurs, sans rejouer les affectations.
+        """
+        self.services = list(services)
+        self.cpu_free, self.ram_free, self._cpu_used, self._ram_used, self.completion_time = snapshot
 
     def reset(self):
         self.cpu_free = self.cpu_capacity
         self.ram_free = self.ram_capacity
         self.services.clear()
         self.completion_time = 0.0
+        self._cpu_used = 0
+        self._ram_used = 0
     def cpu_used(self):
-        return sum(service.cpu for service in self.services)
+        return self._cpu_used
     def ram_used(self):
-        return sum(service.ram for service in self.services)
+        return self._ram_used
 
     def __repr__(self):
-        return f"VM{self.id}(free_cpu={self.cpu_free:.1f}, free_ram={self.ram_free:.1f})"
+        speed = f", speed={self.speed}" if self.speed != 1.0 else ""
+        return f"VM{self.id}(free_cpu={self.cpu_free:.1f}, free_ram={self.ram_free:.1f}{speed})"
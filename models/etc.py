@@ -0,0 +1,32 @@
+# models/etc.py
+# Matrice ETC (Expected Time to Compute) : temps d'exécution de chaque service sur
+# chaque VM, etc[s, v] = exec_time[s] / speed[v]. Min-Min / Max-Min, l'AG et ses
+# opérateurs calculent les cases à la demande (même division) ; la matrice complète
+# (n_services x n_vms) ne sert qu'aux métriques, sur des instances de taille modeste.
+import numpy as np
+from typing import List
+from models.entities import Service, VM
+
+
+def vm_speeds(vms: List[VM]) -> np.ndarray:
+    return np.array([vm.speed for vm in vms], dtype=np.float64)
+
+
+def etc_matrix(services: List[Service], vms: List[VM]) -> np.ndarray:
+    """
+    Matrice (n_services x n_vms) des temps d'exécution. Chaque case est la même division
+    flottante que `VM.exec_time_of` : les temps de complétion cumulés à partir de la
+    matrice sont identiques bit à bit à ceux de `VM.assign`.
+    """
+    exec_time = np.array([s.exec_time for s in services], dtype=np.float64)
+    return exec_time[:, None] / vm_speeds(vms)[None, :]
+
+
+def completion_times(etc: np.ndarray, genome) -> np.ndarray:
+    """
+    Temps de complétion de chaque VM pour une affectation (position de VM par service,
+    -1 : service non placé), accumulés dans l'ordre des services (celui de l'AG).
+    """
+    genome = np.asarray(genome, dtype=np.intp)
+    placed = np.flatnonzero(genome >= 0)
+    return np.bincount(genome[placed], weights=etc[placed, genome[placed]], minlength=etc.shape[1])
@@ -0,0 +1,3 @@
+# tests/__init__.py
+# Tests d'équivalence : chaque chemin optimisé est comparé, sur des instances à graine
+# fixée, à l'implémentation de référence qu'il remplace. Lancement : python -m pytest -q
@@ -0,0 +1,35 @@
+# tests/test_first_fit.py
+import pytest
+from models.entities import Service, VM
+from utils.helpers import generate_random_data
+from algorithms.first_fit import first_fit
+from algorithms.best_fit import best_fit
+
+
+def _fresh(vms_template):
+    return [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+
+
+def _placements(vms):
+    return [[service.id for service in vm.services] for vm in vms]
+
+
+@pytest.mark.parametrize("algorithm", [first_fit, best_fit])
+@pytest.mark.parametrize("n_services, n_vms", [(300, 70), (3000, 500), (5000, 400)])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_indexed_matches_linear_scan(algorithm, n_services, n_vms, seed):
+    services, vms_template = generate_random_data(n_services, n_vms, seed)
+    linear, indexed = _fresh(vms_template), _fresh(vms_template)
+    assert algorithm(services, linear, indexed=False) == algorithm(services, indexed, indexed=True)
+    assert _placements(linear) == _placements(indexed)
+
+
+@pytest.mark.parametrize("algorithm", [first_fit, best_fit])
+def test_indexed_ties(algorithm):
+    # VMs identiques et demandes entières : égalités de capacité libre (et de clé de
+    # Best-Fit) partout, départagées par la position dans la liste
+    services = [Service(i, float(1 + i % 3), float(2 + i % 4), 1.0) for i in range(900)]
+    vms_template = [VM(j, 8.0, 16.0) for j in range(200)]
+    linear, indexed = _fresh(vms_template), _fresh(vms_template)
+    assert algorithm(services, linear, indexed=False) == algorithm(services, indexed, indexed=True)
+    assert _placements(linear) == _placements(indexed)
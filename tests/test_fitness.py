@@ -0,0 +1,46 @@
+# tests/test_fitness.py
+import random
+import numpy as np
+import pytest
+from models.entities import VM
+from utils.helpers import generate_random_data
+from algorithms import fitness
+from algorithms.fitness import PopulationEvaluator, FitnessCache, INFEASIBLE_FITNESS
+
+
+def _reference(genome, services, vms_template, objective):
+    """Évaluation d'origine : un individu à la fois, sur des VMs temporaires."""
+    vms = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+    for service, position in zip(services, genome):
+        if not vms[position].can_host(service):
+            return float(INFEASIBLE_FITNESS)
+        vms[position].assign(service)
+    makespan = max(vm.completion_time for vm in vms)
+    vms_used = sum(1 for vm in vms if vm.services)
+    if objective == "vms":
+        return float(vms_used)
+    if objective == "hybrid":
+        return 0.7 * (makespan / max(s.exec_time for s in services)) + 0.3 * vms_used
+    return makespan
+
+
+@pytest.mark.parametrize("objective", ["makespan", "vms", "hybrid"])
+@pytest.mark.parametrize("speeds", [None, (0.5, 1.0, 1.5, 2.0)])
+@pytest.mark.parametrize("seed", [1, 2])
+def test_population_matches_per_individual_evaluation(objective, speeds, seed, monkeypatch):
+    services, vms_template = generate_random_data(60, 25, seed, speeds)
+    rng = random.Random(seed)
+    n_vms = len(vms_template)
+    # Génomes aléatoires (souvent infaisables) et répartis à tour de rôle (faisables)
+    genomes = [[rng.randrange(n_vms) for _ in services] for _ in range(40)]
+    genomes += [[(i + shift) % n_vms for i in range(len(services))] for shift in range(40)]
+    expected = [_reference(genome, services, vms_template, objective) for genome in genomes]
+    assert INFEASIBLE_FITNESS in expected and min(expected) < INFEASIBLE_FITNESS
+
+    evaluator = PopulationEvaluator(services, vms_template, objective)
+    assert evaluator.evaluate(genomes).tolist() == expected
+    # Population découpée en lots de quelques individus : mêmes valeurs
+    monkeypatch.setattr(fitness, "MAX_GENES_PER_BATCH", 7 * len(services))
+    assert evaluator.evaluate(genomes).tolist() == expected
+    cache = FitnessCache()
+    assert np.array_equal(cache.evaluate(evaluator, genomes + genomes[:10]), expected + expected[:10])
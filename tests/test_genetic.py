@@ -0,0 +1,21 @@
+# tests/test_genetic.py
+import pytest
+from models.entities import Service, VM
+from algorithms.fitness import PopulationEvaluator
+from algorithms.genetic import _build_solution, _final_repair
+
+
+def _instance():
+    # s0 et s1 surchargent VM0 ; VM1 est déjà utilisée (par s2) et a la place, VM2 est vide
+    services = [Service(0, 6.0, 6.0, 10.0), Service(1, 6.0, 6.0, 10.0), Service(2, 1.0, 1.0, 50.0)]
+    vms_template = [VM(0, 10.0, 10.0), VM(1, 10.0, 10.0), VM(2, 10.0, 10.0)]
+    return services, vms_template, [0, 0, 1]
+
+
+@pytest.mark.parametrize("objective, vms_used", [("makespan", 3), ("vms", 2)])
+def test_final_repair_follows_objective(objective, vms_used):
+    services, vms_template, genome = _instance()
+    repairer = _final_repair(services, vms_template, objective, PopulationEvaluator(services, vms_template, objective))
+    assignment, vms = _build_solution(genome, services, vms_template, repairer=repairer)
+    assert len(assignment) == 3
+    assert sum(1 for vm in vms if vm.services) == vms_used
@@ -0,0 +1,29 @@
+# tests/test_helpers.py
+import multiprocessing
+import time
+from utils.helpers import generate_random_data, run_algorithms_concurrently
+
+SLOW = {"pop_size": 50, "generations": 10 ** 6}
+
+
+def test_timeout_counts_from_each_algorithm_start():
+    services, vms_template = generate_random_data(60, 10, 1)
+    start = time.perf_counter()
+    outcomes = list(run_algorithms_concurrently(["genetic algorithm", "min-min", "nope"], services, vms_template,
+                                                SLOW, timeout=1.0, workers=1))
+    by_name = {outcome["name"]: outcome for outcome in outcomes}
+    assert [outcome["name"] for outcome in outcomes] == ["genetic algorithm", "min-min", "nope"]
+    assert "délai" in by_name["genetic algorithm"]["error"]
+    # min-min ne démarre qu'après l'arrêt de l'AG : son délai ne court qu'à partir de là
+    assert by_name["min-min"]["error"] is None and by_name["min-min"]["assignment"]
+    assert "Algorithme inconnu" in by_name["nope"]["error"]
+    assert time.perf_counter() - start < 10
+    assert not multiprocessing.active_children()
+
+
+def test_closing_the_generator_stops_running_processes():
+    services, vms_template = generate_random_data(60, 10, 1)
+    outcomes = run_algorithms_concurrently(["genetic algorithm", "first-fit"], services, vms_template, SLOW)
+    assert next(outcomes)["name"] == "first-fit"
+    outcomes.close()
+    assert not multiprocessing.active_children()
@@ -0,0 +1,77 @@
+# tests/test_min_min.py
+import random
+import pytest
+from models.entities import Service, VM
+from utils.helpers import generate_random_data
+from algorithms.min_min import min_min
+from algorithms.max_min import max_min
+
+
+def _fresh(vms_template):
+    return [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+
+
+def _placements(vms):
+    return [[service.id for service in vm.services] for vm in vms]
+
+
+@pytest.mark.parametrize("algorithm", [min_min, max_min])
+@pytest.mark.parametrize("speeds", [None, (0.5, 1, 1.5, 2)])
+@pytest.mark.parametrize("n_services, n_vms", [(300, 70), (2000, 130), (600, 300)])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_indexed_matches_argmin(algorithm, speeds, n_services, n_vms, seed):
+    services, vms_template = generate_random_data(n_services, n_vms, seed, speeds=speeds)
+    reference, indexed = _fresh(vms_template), _fresh(vms_template)
+    assert algorithm(services, reference, indexed=False) == algorithm(services, indexed, indexed=True)
+    assert _placements(reference) == _placements(indexed)
+
+
+@pytest.mark.parametrize("algorithm", [min_min, max_min])
+def test_indexed_ties(algorithm):
+    # Temps d'exécution entiers et VMs identiques : nombreuses égalités, départagées par la position
+    services = [Service(i, 1.0 + i % 3, 2.0 + i % 5, float(i % 4)) for i in range(400)]
+    vms_template = [VM(j, 12.0, 24.0) for j in range(100)]
+    reference, indexed = _fresh(vms_template), _fresh(vms_template)
+    assert algorithm(services, reference, indexed=False) == algorithm(services, indexed, indexed=True)
+    assert _placements(reference) == _placements(indexed)
+
+
+def _textbook(services, vms, longest_first):
+    """
+    Min-Min / Max-Min par balayage de tous les couples (service restant, VM) à chaque
+    étape : meilleur temps de complétion de chaque service (première VM à égalité), puis
+    le service au plus petit (ou plus grand) de ces temps (premier de la liste à égalité).
+    """
+    assignment, remaining = {}, list(services)
+    while remaining:
+        chosen = None
+        for service in remaining:
+            best = None
+            for vm in vms:
+                if vm.can_host(service):
+                    end = vm.completion_time + vm.exec_time_of(service)
+                    if best is None or end < best[0]:
+                        best = (end, vm)
+            if best is not None and (chosen is None or (best[0] > chosen[0] if longest_first else best[0] < chosen[0])):
+                chosen = (best[0], best[1], service)
+        if chosen is None:
+            break
+        _, vm, service = chosen
+        vm.assign(service)
+        assignment[service.id] = vm.id
+        remaining.remove(service)
+    return assignment
+
+
+@pytest.mark.parametrize("algorithm, longest_first", [(min_min, False), (max_min, True)])
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_heap_order_matches_pairwise_scan(algorithm, longest_first, indexed, seed):
+    # Capacités larges (aucune contrainte ne s'applique), durées entières et vitesses en
+    # puissances de 2 : fins d'exécution exactes, donc nombreuses égalités
+    rng = random.Random(seed)
+    services = [Service(i, 1.0, 1.0, float(rng.randint(1, 6))) for i in range(120)]
+    vms_template = [VM(j, 1000.0, 1000.0, rng.choice((0.5, 1.0, 2.0))) for j in range(70)]
+    reference, heap_based = _fresh(vms_template), _fresh(vms_template)
+    assert algorithm(services, heap_based, indexed=indexed) == _textbook(services, reference, longest_first)
+    assert _placements(heap_based) == _placements(reference)
@@ -0,0 +1,39 @@
+# tests/test_nsga2.py
+import numpy as np
+import pytest
+from algorithms.nsga2 import non_dominated_sort
+
+
+def _brute_force_ranks(values: np.ndarray) -> np.ndarray:
+    """Rangs par épluchage de la matrice de dominance complète."""
+    dominates = ((values[:, None, :] <= values[None, :, :]).all(axis=2)
+                 & (values[:, None, :] < values[None, :, :]).any(axis=2))
+    ranks = np.full(len(values), -1)
+    left = np.ones(len(values), dtype=bool)
+    rank = 0
+    while left.any():
+        front = left & ~dominates[left].any(axis=0)
+        ranks[front] = rank
+        left &= ~front
+        rank += 1
+    return ranks
+
+
+def _chain(n_objectives: int) -> np.ndarray:
+    # Chaîne de dominance : chaque point domine le suivant (un front par point)
+    return np.repeat(np.arange(300, dtype=float)[::-1, None], n_objectives, axis=1)
+
+
+@pytest.mark.parametrize("n_objectives", [1, 2, 3, 4])
+@pytest.mark.parametrize("block_size", [1, 7, 128])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_ranks_match_brute_force(n_objectives, block_size, seed):
+    rng = np.random.default_rng(seed)
+    continuous = rng.random((400, n_objectives))
+    ties = rng.integers(0, 5, (400, n_objectives)).astype(float)   # doublons et égalités
+    for values in (continuous, ties, _chain(n_objectives)):
+        assert np.array_equal(non_dominated_sort(values, block_size), _brute_force_ranks(values))
+
+
+def test_single_point():
+    assert non_dominated_sort(np.array([[1.0, 2.0, 3.0]])).tolist() == [0]
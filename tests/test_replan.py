@@ -0,0 +1,90 @@
+# tests/test_replan.py
+import random
+import pytest
+from models.entities import Service, VM
+from utils.helpers import generate_random_data
+from algorithms.min_min import min_min
+from algorithms.replan import Replanner
+
+
+def _plan():
+    vms = [VM(0, 10.0, 10.0), VM(1, 10.0, 10.0)]
+    for i, vm in enumerate(vms):
+        for k in range(3):
+            vm.assign(Service(3 * i + k, 0.1 * (k + 1), 0.3, 1.0 + k))
+    return vms
+
+
+def _state(planner):
+    return (dict(planner.location), [(vm.cpu_free, vm.ram_free, vm.completion_time, list(vm.services))
+                                     for vm in planner.vms],
+            planner.cpu_free.tolist(), planner.ram_free.tolist(), planner.completion.tolist())
+
+
+@pytest.mark.parametrize("delta", [
+    {"removed": [0, 42]},
+    {"removed": [0, 0]},
+    {"removed": [1], "resized": [Service(1, 0.5, 0.5, 1.0)]},
+    {"resized": [Service(42, 0.5, 0.5, 1.0)]},
+    {"removed": [0], "added": [Service(2, 1.0, 1.0, 1.0)]},
+    {"removed": [0], "added": [Service(7, 1.0, 1.0, 1.0), Service(7, 1.0, 1.0, 1.0)]},
+])
+def test_invalid_delta_leaves_plan_unchanged(delta):
+    planner = Replanner(_plan())
+    before = _state(planner)
+    with pytest.raises(ValueError):
+        planner.apply(**delta)
+    assert _state(planner) == before
+
+
+def test_removed_id_can_be_added_back():
+    planner = Replanner(_plan())
+    planner.apply(removed=[0], added=[Service(0, 1.0, 1.0, 1.0)])
+    assert 0 in planner.location
+
+
+def test_release_restores_exact_capacity():
+    vm = VM(0, 10.0, 10.0)
+    services = [Service(i, 0.1 * (i + 1), 0.7, 1.0) for i in range(7)]
+    for service in services:
+        vm.assign(service)
+    for service in services:
+        vm.release(service)
+    assert (vm.cpu_free, vm.ram_free, vm.completion_time) == (10.0, 10.0, 0.0)
+
+
+def test_emptied_vm_hosts_full_service():
+    planner = Replanner([VM(0, 10.0, 10.0)])
+    planner.apply(added=[Service(i, 0.1 * (i + 1), 0.7, 1.0) for i in range(7)])
+    planner.apply(removed=list(range(7)), added=[Service(99, 10.0, 10.0, 1.0)])
+    assert planner.location == {99: 0}
+
+
+def _copy(vms):
+    copies = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms]
+    for vm, copy in zip(vms, copies):
+        for service in vm.services:
+            copy.assign(service)
+    return copies
+
+
+@pytest.mark.parametrize("speeds", [None, (0.5, 1.0, 1.5, 2.0)])
+@pytest.mark.parametrize("n_services, n_vms", [(600, 130), (3000, 300)])
+@pytest.mark.parametrize("seed", [1, 2])
+def test_indexed_find_matches_argmin(speeds, n_services, n_vms, seed):
+    services, vms = generate_random_data(n_services, n_vms, seed, speeds)
+    min_min(services[:n_services // 2], vms)
+    planners = [Replanner(vms, indexed=True), Replanner(_copy(vms), indexed=False)]
+    rng = random.Random(seed)
+    next_id = n_services
+    for _ in range(15):
+        placed = rng.sample(sorted(planners[0].location), 20)
+        removed = placed[:10]
+        resized = [Service(sid, s.cpu * f, s.ram * f, s.exec_time * f)
+                   for sid in placed[10:] for s in [planners[0].services[sid]] for f in [rng.uniform(0.5, 1.5)]]
+        added = [Service(next_id + i, s.cpu, s.ram, s.exec_time)
+                 for i, s in enumerate(rng.sample(services[n_services // 2:], 10))]
+        next_id += 10
+        reports = [planner.apply(added, removed, resized, max_migrations=10) for planner in planners]
+        assert reports[0] == reports[1]
+        assert planners[0].assignment == planners[1].assignment
@@ -0,0 +1,43 @@
+# tests/test_sharded.py
+import pytest
+from models.entities import VM
+from utils.helpers import generate_random_data, compute_metrics
+from algorithms.genetic import genetic_algorithm
+from algorithms.nsga2 import nsga2
+from algorithms.sharded import sharded_schedule
+
+
+@pytest.mark.parametrize("n_services", [0, 1])
+def test_ga_with_fewer_than_two_services(n_services):
+    services, vms_template = generate_random_data(n_services, 3, 1)
+    assignment, vms = genetic_algorithm(services, vms_template, pop_size=10, generations=5, seed=1)
+    assert len(assignment) == n_services
+    assert all(p["rejected"] == 0 for p in nsga2(services, vms_template, pop_size=10, generations=5, seed=1))
+
+
+def test_sharded_ga_with_tiny_zones():
+    # 3 services pour 8 zones : des zones reçoivent un seul service, d'autres aucun
+    services, vms_template = generate_random_data(3, 40, 1)
+    stats = {}
+    assignment, vms = sharded_schedule(services, vms_template, algorithm="genetic algorithm", n_zones=8,
+                                       workers=1, params={"generations": 5, "seed": 1}, stats=stats)
+    assert min(stats["zone_services"]) == 0 and 1 in stats["zone_services"]
+    assert len(assignment) == 3
+    assert compute_metrics(vms, services)["rejected"] == 0
+
+
+@pytest.mark.parametrize("algorithm", ["min-min", "best-fit"])
+def test_pool_matches_current_process(algorithm):
+    # Zones envoyées en colonnes et VMs reconstruites par snapshot : mêmes VMs, au flottant près
+    services, vms_template = generate_random_data(3000, 400, 2, (0.5, 1.0, 2.0))
+    runs = [sharded_schedule(services, vms_template, algorithm, n_zones=4, workers=workers)
+            for workers in (1, 2)]
+    (serial, serial_vms), (pooled, pooled_vms) = runs
+    assert serial == pooled
+    for vm, other in zip(serial_vms, pooled_vms):
+        assert vm.snapshot() == other.snapshot()
+        assert [s.id for s in vm.services] == [s.id for s in other.services]
+        replay = VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed)
+        for service in vm.services:
+            replay.assign(service)
+        assert replay.snapshot() == vm.snapshot()
@@ -0,0 +1,126 @@
+# utils/cache.py
+# Caches LRU bornés pour l'application : instances générées et résultats des algorithmes,
+# réutilisés d'une ré-exécution du script Streamlit à l'autre.
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from models.entities import Service, VM
+from utils.helpers import generate_random_data, run_algorithm
+
+# Valeur renvoyée par `get` en cas d'échec (None peut être une valeur valide)
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Cache LRU borné à `max_entries` entrées, avec compteurs de succès/échecs.
+
+    Les accès sont protégés par un verrou : Streamlit exécute les sessions dans des
+    threads différents et le cache est partagé entre elles (`st.cache_resource`).
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default=MISSING):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Valeur en cache ou calculée (puis mémorisée). Renvoie (valeur, succès du cache)."""
+        value = self.get(key)
+        if value is not MISSING:
+            return value, True
+        value = compute()
+        self.put(key, value)
+        return value, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                "max_entries": self.max_entries}
+
+
+def instance_key(n_services: int, n_vms: int, seed: int) -> tuple:
+    return ("instance", int(n_services), int(n_vms), int(seed))
+
+
+def result_key(algorithm: str, n_services: int, n_vms: int, seed: int, params: Optional[Dict] = None) -> tuple:
+    """Clé d'un résultat : instance + algorithme + paramètres (triés, pour un ordre stable)."""
+    return ("result", algorithm, int(n_services), int(n_vms), int(seed),
+            tuple(sorted((params or {}).items())))
+
+
+class SolveCache:
+    """
+    Instances générées et résultats (affectation, VMs remplies, durée) des algorithmes.
+
+    Les objets renvoyés sont partagés avec le cache : ils ne doivent pas être modifiés.
+    """
+
+    def __init__(self, max_instances: int = 16, max_results: int = 64):
+        self.instances = LRUCache(max_instances)
+        self.results = LRUCache(max_results)
+
+    def instance(self, n_services: int, n_vms: int, seed: int) -> Tuple[Tuple[List[Service], List[VM]], bool]:
+        return self.instances.get_or_compute(instance_key(n_services, n_vms, seed),
+                                             lambda: generate_random_data(n_services, n_vms, seed))
+
+    def cached_result(self, algorithm: str, n_services: int, n_vms: int, seed: int,
+                      params: Optional[Dict] = None):
+        """Résultat en cache (affectation, VMs, durée) ou MISSING (compte comme un échec)."""
+        return self.results.get(result_key(algorithm, n_services, n_vms, seed, params))
+
+    def store_result(self, algorithm: str, n_services: int, n_vms: int, seed: int,
+                     params: Optional[Dict], result: Tuple[Dict[int, int], List[VM], float]):
+        self.results.put(result_key(algorithm, n_services, n_vms, seed, params), result)
+
+    def solve(self, algorithm: str, n_services: int, n_vms: int, seed: int,
+              params: Optional[Dict] = None) -> Tuple[Tuple[Dict[int, int], List[VM], float], bool]:
+        """Résultat d'un algorithme sur une instance générée (calculé au premier appel)."""
+        def compute():
+            services, vms_template = self.instance(n_services, n_vms, seed)[0]
+            return run_algorithm(algorithm, services, vms_template, **(params or {}))
+        return self.results.get_or_compute(result_key(algorithm, n_services, n_vms, seed, params), compute)
+
+    def pareto_front(self, n_services: int, n_vms: int, seed: int,
+                     params: Optional[Dict] = None) -> Tuple[Tuple[List[Dict], float], bool]:
+        """Front de Pareto NSGA-II (algorithms/nsga2.py) d'une instance générée et durée du calcul."""
+        def compute():
+            from algorithms.nsga2 import nsga2
+            services, vms_template = self.instance(n_services, n_vms, seed)[0]
+            start = time.perf_counter()
+            front = nsga2(services, vms_template, **(params or {}))
+            return front, time.perf_counter() - start
+        return self.results.get_or_compute(result_key("nsga2", n_services, n_vms, seed, params), compute)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"instances": self.instances.stats(), "results": self.results.stats()}
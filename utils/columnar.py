@@ -0,0 +1,189 @@
+# utils/columnar.py
+# Format d'instance en colonnes binaires : un répertoire contenant un fichier .npy par
+# colonne (services : id, cpu, ram, exec_time ; VMs : id, cpu_capacity, ram_capacity, speed)
+# et un meta.json. Le chargement est sans copie (memory-mapping) et peut se faire par tranches.
+# Conversion depuis le format JSON : python -m utils.columnar data/services.json data/vms.json data/instance
+import json
+import os
+import sys
+from typing import Iterable, Iterator, List, Tuple, Union
+import numpy as np
+from models.entities import Service, VM
+from models.cluster import ServiceBatch, ClusterState
+
+FORMAT_NAME = "cloud-instance-columnar"
+FORMAT_VERSION = 1
+
+SERVICE_COLUMNS = ("cpu", "ram", "exec_time")
+VM_COLUMNS = ("cpu_capacity", "ram_capacity")
+
+
+def _column_path(path: str, table: str, column: str) -> str:
+    return os.path.join(path, f"{table}.{column}.npy")
+
+
+def _save_ids(path: str, table: str, ids: np.ndarray) -> bool:
+    """Écrit la colonne des identifiants, sauf s'ils valent 0..n-1. Renvoie True si écrite."""
+    if np.array_equal(ids, np.arange(len(ids))):
+        return False
+    np.save(_column_path(path, table, "id"), ids.astype(np.int64))
+    return True
+
+
+def _save_speeds(path: str, speeds) -> bool:
+    """Écrit la colonne des vitesses des VMs, sauf si elles valent toutes 1. Renvoie True si écrite."""
+    if speeds is None:
+        return False
+    speeds = np.asarray(speeds, dtype=np.float64)
+    if (speeds == 1.0).all():
+        return False
+    np.save(_column_path(path, "vms", "speed"), speeds)
+    return True
+
+
+def _write_meta(path: str, n_services: int, n_vms: int, service_ids: bool, vm_ids: bool, vm_speeds: bool):
+    meta = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "services": n_services,
+        "vms": n_vms,
+        "service_ids": service_ids,   # False : identifiants implicites 0..n-1
+        "vm_ids": vm_ids,
+        "vm_speeds": vm_speeds,       # False : toutes les VMs à la vitesse de référence
+    }
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+
+def save_columns(path: str, services: dict, vms: dict):
+    """
+    Écrit une instance à partir de colonnes (dict nom -> tableau) ; les colonnes "id"
+    (identifiants 0..n-1 par défaut) et "speed" des VMs (1 par défaut) sont facultatives.
+    """
+    os.makedirs(path, exist_ok=True)
+    n_services = len(services["cpu"])
+    n_vms = len(vms["cpu_capacity"])
+    for column in SERVICE_COLUMNS:
+        np.save(_column_path(path, "services", column), np.asarray(services[column], dtype=np.float64))
+    for column in VM_COLUMNS:
+        np.save(_column_path(path, "vms", column), np.asarray(vms[column], dtype=np.float64))
+    service_ids = _save_ids(path, "services", np.asarray(services.get("id", np.arange(n_services))))
+    vm_ids = _save_ids(path, "vms", np.asarray(vms.get("id", np.arange(n_vms))))
+    vm_speeds = _save_speeds(path, vms.get("speed"))
+    _write_meta(path, n_services, n_vms, service_ids, vm_ids, vm_speeds)
+
+
+def save_service_chunks(path: str, chunks: Iterable[ServiceBatch], n_services: int, vms: dict):
+    """
+    Écrit une instance dont les services arrivent par tranches (identifiants implicites
+    0..n-1, `n_services` au total) : chaque colonne est un fichier .npy projeté en
+    mémoire, rempli tranche par tranche sans tenir tous les services en mémoire.
+    """
+    os.makedirs(path, exist_ok=True)
+    columns = {column: np.lib.format.open_memmap(_column_path(path, "services", column), mode="w+",
+                                                 dtype=np.float64, shape=(n_services,))
+               for column in SERVICE_COLUMNS}
+    start = 0
+    for chunk in chunks:
+        for column in SERVICE_COLUMNS:
+            columns[column][start:start + len(chunk)] = getattr(chunk, column)
+        start += len(chunk)
+    if start != n_services:
+        raise ValueError(f"{start} services écrits, {n_services} attendus")
+    for column in SERVICE_COLUMNS:
+        columns[column].flush()
+    del columns
+    n_vms = len(vms["cpu_capacity"])
+    for column in VM_COLUMNS:
+        np.save(_column_path(path, "vms", column), np.asarray(vms[column], dtype=np.float64))
+    vm_ids = _save_ids(path, "vms", np.asarray(vms.get("id", np.arange(n_vms))))
+    _write_meta(path, n_services, n_vms, False, vm_ids, _save_speeds(path, vms.get("speed")))
+
+
+def save_instance(path: str, services: Union[List[Service], ServiceBatch], vms: List[VM]):
+    """Écrit une instance (objets Service / VM ou ServiceBatch) au format colonnes."""
+    if not isinstance(services, ServiceBatch):
+        services = ServiceBatch.from_services(services)
+    save_columns(path,
+                 {"id": services.ids, "cpu": services.cpu, "ram": services.ram, "exec_time": services.exec_time},
+                 {"id": [vm.id for vm in vms],
+                  "cpu_capacity": [vm.cpu_capacity for vm in vms],
+                  "ram_capacity": [vm.ram_capacity for vm in vms],
+                  "speed": [vm.speed for vm in vms]})
+
+
+def read_meta(path: str) -> dict:
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} : format d'instance inconnu ({meta.get('format')})")
+    if meta.get("version", 0) > FORMAT_VERSION:
+        raise ValueError(f"{path} : version {meta['version']} non supportée (max {FORMAT_VERSION})")
+    return meta
+
+
+def _load_table(path: str, table: str, columns, has_ids: bool, mmap: bool) -> dict:
+    mode = "r" if mmap else None
+    data = {column: np.load(_column_path(path, table, column), mmap_mode=mode) for column in columns}
+    data["id"] = np.load(_column_path(path, table, "id"), mmap_mode=mode) if has_ids else None
+    return data
+
+
+def load_services(path: str, mmap: bool = True) -> ServiceBatch:
+    """
+    Services de l'instance en colonnes. Avec mmap=True (défaut), les colonnes sont des
+    tableaux projetés en mémoire : rien n'est lu tant qu'on n'y accède pas.
+    """
+    meta = read_meta(path)
+    data = _load_table(path, "services", SERVICE_COLUMNS, meta["service_ids"], mmap)
+    # ServiceBatch() comparerait les identifiants à 0..n-1, ce qui lirait toute la colonne
+    return ServiceBatch.from_columns(data["cpu"], data["ram"], data["exec_time"], data["id"])
+
+
+def load_instance(path: str, mmap: bool = True) -> Tuple[ServiceBatch, ClusterState]:
+    """Instance en colonnes : (services, état du cluster vide sur ces services)."""
+    meta = read_meta(path)
+    services = load_services(path, mmap)
+    vms = _load_table(path, "vms", VM_COLUMNS, meta["vm_ids"], mmap=False)
+    speed = np.load(_column_path(path, "vms", "speed")) if meta.get("vm_speeds") else None
+    return services, ClusterState(vms["cpu_capacity"], vms["ram_capacity"], services, vms["id"], speed)
+
+
+def load_data_columnar(path: str) -> Tuple[List[Service], List[VM]]:
+    """Même résultat que `load_data` (objets Service / VM) à partir du format colonnes."""
+    services, state = load_instance(path)
+    return services.to_services(), state.to_vms()
+
+
+def iter_service_chunks(path: str, chunk_size: int = 65_536) -> Iterator[ServiceBatch]:
+    """Parcourt les services par tranches (vues sur le fichier projeté, mémoire bornée)."""
+    services = load_services(path, mmap=True)
+    for start in range(0, len(services), chunk_size):
+        yield services[start:start + chunk_size]
+
+
+def convert_json(services_file: str, vms_file: str, path: str):
+    """Convertit une instance au format JSON (data/services.json, data/vms.json) en colonnes."""
+    with open(services_file) as f:
+        records = json.load(f)
+    services = {"id": np.fromiter((r["id"] for r in records), dtype=np.int64, count=len(records))}
+    for column in SERVICE_COLUMNS:
+        services[column] = np.fromiter((r[column] for r in records), dtype=np.float64, count=len(records))
+    del records
+
+    with open(vms_file) as f:
+        records = json.load(f)
+    vms = {"id": [r["id"] for r in records]}
+    for column in VM_COLUMNS:
+        vms[column] = [r[column] for r in records]
+    vms["speed"] = [r.get("speed", 1.0) for r in records]
+    save_columns(path, services, vms)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4:
+        print("Usage : python -m utils.columnar <services.json> <vms.json> <répertoire de sortie>")
+        sys.exit(1)
+    convert_json(*sys.argv[1:])
+    meta = read_meta(sys.argv[3])
+    print(f"{meta['services']} services, {meta['vms']} VMs -> {sys.argv[3]}")
@@ -1,9 +1,13 @@
 # utils/helpers.py
-import streamlit as st
 import json
+import multiprocessing
 import random
+import time
+from multiprocessing.connection import wait as connection_wait
 from models.entities import VM, Service
-from typing import List, Dict
+from algorithms import get_algorithm, METAHEURISTICS
+from utils import instrumentation
+from typing import List, Dict, Tuple, Optional, Iterator
 
 def load_data(vms_file: str = "data/vms.json", services_file: str = "data/services.json"):
     with open(vms_file) as f:
@@ -15,33 +19,162 @@ def load_data(vms_file: str = "data/vms.json", services_file: str = "data/servic
     services = [Service(**data) for data in services_data]
     return services, vms
 
-def generate_random_data(num_services=20, num_vms=6, seed=42):
-    random.seed(seed)
+def generate_random_data(num_services=20, num_vms=6, seed=42, speeds: Optional[Tuple[float, ...]] = None):
+    """
+    Instance aléatoire reproductible. `speeds` : vitesses possibles des VMs (flotte
+    hétérogène), tirées après le reste de l'instance : services et capacités sont ceux
+    de l'instance homogène de même graine.
+
+    Les tirages utilisent un random.Random propre à l'appel : l'état global de `random`
+    n'est pas modifié. utils/workload.py génère les mêmes instances en colonnes NumPy
+    (legacy_instance), ainsi que d'autres distributions.
+    """
+    rng = random.Random(seed)
     services = [
         Service(i,
-                round(random.uniform(1, 5), 2),
-                round(random.uniform(2, 12), 2),
-                round(random.uniform(5, 40), 2))
+                round(rng.uniform(1, 5), 2),
+                round(rng.uniform(2, 12), 2),
+                round(rng.uniform(5, 40), 2))
         for i in range(num_services)
     ]
     vms = [
         VM(i,
-           round(random.uniform(12, 28), 2),
-           round(random.uniform(24, 64), 2))
+           round(rng.uniform(12, 28), 2),
+           round(rng.uniform(24, 64), 2))
         for i in range(num_vms)
     ]
+    if speeds:
+        for vm in vms:
+            vm.speed = rng.choice(speeds)
     return services, vms
 
-def compute_metrics(vms: List[VM], services: List[Service]) -> Dict:
+def compute_metrics(vms: List[VM], services: List[Service], etc=None) -> Dict:
+    """
+    Métriques d'une solution. Avec `etc` (matrice ETC de l'instance, models/etc.py), les
+    temps de complétion sont recalculés à partir de la matrice, comme dans l'AG ;
+    sinon on lit ceux des VMs, cumulés par `VM.assign` avec les mêmes valeurs.
+    """
     total_services = len(services)
     assigned = sum(len(vm.services) for vm in vms)
-    makespan = max((vm.completion_time for vm in vms), default=0)
+    if etc is not None:
+        from models.etc import completion_times
+        row = {s.id: i for i, s in enumerate(services)}
+        genome = [-1] * len(services)
+        for v, vm in enumerate(vms):
+            for s in vm.services:
+                genome[row[s.id]] = v
+        makespan = float(completion_times(etc, genome).max(initial=0))
+    else:
+        makespan = max((vm.completion_time for vm in vms), default=0)
     cpu_util = sum((vm.cpu_capacity - vm.cpu_free) / vm.cpu_capacity for vm in vms) / len(vms) * 100
     ram_util = sum((vm.ram_capacity - vm.ram_free) / vm.ram_capacity for vm in vms) / len(vms) * 100
+    vms_used = sum(1 for vm in vms if vm.services)
     return {
         "makespan": round(makespan, 2),
         "assigned": assigned,
         "rejected": total_services - assigned,
+        "vms_used": vms_used,
         "cpu_util_%": round(cpu_util, 2),
         "ram_util_%": round(ram_util, 2)
     }
+
+def run_algorithm(name: str, services: List[Service], vms_template: List[VM],
+                  local_search: Optional[str] = None, local_search_budget: float = 1.0,
+                  **params) -> Tuple[Dict[int, int], List[VM], float]:
+    """
+    Exécute un algorithme du registre sur une copie propre des VMs.
+    `params` n'est transmis qu'aux métaheuristiques (pop_size, generations, objective, ...).
+    `local_search` ("descent", "tabu" ou "annealing") améliore ensuite la solution par
+    recherche locale (algorithms/local_search.py) pendant au plus `local_search_budget`
+    secondes, comptées dans la durée.
+    Renvoie (affectation, VMs remplies, durée en secondes mesurée avec perf_counter).
+    """
+    algo = get_algorithm(name)
+    start = time.perf_counter()
+    with instrumentation.phase(name):
+        if name in METAHEURISTICS:
+            assignment, vms_result = algo(services, vms_template, **params)
+        else:
+            vms_result = [VM(vm.id, vm.cpu_capacity, vm.ram_capacity, vm.speed) for vm in vms_template]
+            assignment = algo(services.copy(), vms_result)
+    if local_search is not None:
+        from algorithms.local_search import local_search as improve
+        with instrumentation.phase("local_search"):
+            assignment = improve(services, vms_result, assignment, strategy=local_search,
+                                 time_budget=local_search_budget, seed=params.get("seed"))
+    elapsed = time.perf_counter() - start
+    return assignment, vms_result, elapsed
+
+
+def _run_in_process(connection, name: str, services: List[Service], vms_template: List[VM], params: Dict):
+    """Corps d'un processus de run_algorithms_concurrently : envoie le résultat ou l'erreur."""
+    try:
+        result = (run_algorithm(name, services, vms_template, **params), None)
+    except Exception as e:
+        result = (None, str(e) or type(e).__name__)
+    connection.send(result)
+    connection.close()
+
+
+def run_algorithms_concurrently(names: List[str], services: List[Service], vms_template: List[VM],
+                                params: Optional[Dict] = None, timeout: Optional[float] = None,
+                                workers: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Exécute plusieurs algorithmes en parallèle, chacun dans son propre processus (et sur
+    sa propre copie des VMs), au plus `workers` à la fois (par défaut tous), et produit
+    les résultats dans l'ordre où ils se terminent :
+    {"name", "assignment", "vms", "elapsed", "error"} ("error" vaut None en cas de succès).
+
+    `timeout` (secondes) est compté pour chaque algorithme depuis le démarrage de son
+    processus : un algorithme en attente d'une place n'use pas son délai. À l'échéance,
+    le processus est arrêté et l'algorithme signalé en erreur ; les autres continuent.
+    """
+    params = params or {}
+    context = multiprocessing.get_context()
+    waiting = list(names)
+    running = {}   # connexion -> (nom, processus, échéance)
+    try:
+        while waiting or running:
+            while waiting and len(running) < (workers or len(names)):
+                name = waiting.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_run_in_process, daemon=True,
+                                          args=(sender, name, services, vms_template, params))
+                process.start()
+                sender.close()
+                deadline = None if timeout is None else time.perf_counter() + timeout
+                running[receiver] = (name, process, deadline)
+
+            deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+            remaining = None if not deadlines else max(0.0, min(deadlines) - time.perf_counter())
+            ready = connection_wait(list(running), timeout=remaining)
+            for receiver in sorted(ready, key=lambda r: names.index(running[r][0])):
+                name, process, _ = running.pop(receiver)
+                try:
+                    result, error = receiver.recv()
+                except EOFError:
+                    result, error = None, f"processus arrêté (code {process.exitcode})"
+                receiver.close()
+                process.join()
+                if error is None:
+                    assignment, vms_result, elapsed = result
+                    yield {"name": name, "assignment": assignment, "vms": vms_result,
+                           "elapsed": elapsed, "error": None}
+                else:
+                    yield {"name": name, "assignment": None, "vms": None, "elapsed": None, "error": error}
+
+            now = time.perf_counter()
+            for receiver, (name, process, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline and receiver not in ready:
+                    del running[receiver]
+                    process.terminate()
+                    process.join()
+                    receiver.close()
+                    yield {"name": name, "assignment": None, "vms": None, "elapsed": None,
+                           "error": f"délai de {timeout:g} s dépassé"}
+    finally:
+        # Générateur abandonné ou interrompu : aucun processus ne survit
+        for receiver, (_, process, _) in running.items():
+            process.terminate()
+            process.join()
+            receiver.close()
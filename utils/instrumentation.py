@@ -0,0 +1,235 @@
+# utils/instrumentation.py
+# Instrumentation optionnelle des algorithmes : compteurs (appels à can_host / assign,
+# évaluations de l'AG, succès du cache, génomes infaisables), durées par phase et
+# statistiques par génération. Export JSON / CSV.
+#
+# Désactivée par défaut et sans coût : les méthodes des chemins critiques (VM.can_host,
+# VM.assign, ...) ne sont remplacées par des versions qui comptent que tant qu'un bloc
+# `with profiling():` est ouvert ; ailleurs, les seuls points d'instrumentation sont un
+# test `current() is None` par génération ou par exécution.
+#
+# Le profileur actif est propre à chaque contexte d'exécution (ContextVar) : plusieurs
+# threads (sessions Streamlit) peuvent profiler en même temps, chacun ne compte que ses
+# propres appels.
+# Usage : python -m utils.instrumentation --algorithm "genetic algorithm" --services 200 --vms 20 --json profil.json
+import csv
+import io
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, List, Optional
+
+# Profileur actif du contexte courant (None : instrumentation désactivée)
+_current: ContextVar[Optional["Profiler"]] = ContextVar("profiler", default=None)
+
+# Méthodes remplacées tant qu'au moins un profileur est actif, tous threads confondus :
+# (classe, méthode, original) et nombre de blocs `profiling()` ouverts
+_patch_lock = threading.Lock()
+_patched: List[tuple] = []
+_active_profilers = 0
+
+# Méthodes comptées pendant le profilage : (module, classe, méthode, compteur)
+HOT_METHODS = (
+    ("models.entities", "VM", "can_host", "vm.can_host"),
+    ("models.entities", "VM", "assign", "vm.assign"),
+    ("models.entities", "VM", "release", "vm.release"),
+    ("algorithms.vm_index", "FirstFitIndex", "find", "index.first_fit.find"),
+    ("algorithms.vm_index", "BestFitIndex", "find", "index.best_fit.find"),
+)
+
+_NULL_PHASE = nullcontext()
+
+
+class Profiler:
+    """Compteurs, durées par phase et statistiques par génération d'une exécution."""
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.generations: List[Dict] = []
+        self.started = time.perf_counter()
+        self.stopped: Optional[float] = None
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+
+    @contextmanager
+    def phase(self, name: str):
+        """Chronomètre un bloc ; les appels successifs d'une même phase sont cumulés."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.phases.setdefault(name, {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+            stats["calls"] += 1
+            stats["total_s"] += elapsed
+            stats["max_s"] = max(stats["max_s"], elapsed)
+
+    def generation(self, **fields):
+        """Enregistre les statistiques d'une génération (numéro, durée, évaluations, ...)."""
+        self.generations.append(fields)
+
+    def report(self) -> Dict:
+        return {
+            "elapsed_s": (self.stopped or time.perf_counter()) - self.started,
+            "counters": dict(sorted(self.counters.items())),
+            "phases": {name: dict(stats) for name, stats in sorted(self.phases.items(),
+                                                                     key=lambda item: -item[1]["total_s"])},
+            "generations": list(self.generations),
+        }
+
+    def rows(self) -> List[Dict]:
+        """Rapport à plat : une ligne (section, nom, mesure, valeur) par valeur."""
+        report = self.report()
+        rows = [{"section": "total", "name": "elapsed", "metric": "s", "value": report["elapsed_s"]}]
+        rows += [{"section": "counter", "name": name, "metric": "count", "value": value}
+                 for name, value in report["counters"].items()]
+        rows += [{"section": "phase", "name": name, "metric": metric, "value": value}
+                 for name, stats in report["phases"].items() for metric, value in stats.items()]
+        rows += [{"section": "generation", "name": entry.get("generation", i), "metric": metric, "value": value}
+                 for i, entry in enumerate(report["generations"])
+                 for metric, value in entry.items() if metric != "generation"]
+        return rows
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        text = json.dumps(self.report(), indent=2)
+        if path:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def to_csv(self, path: Optional[str] = None) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=["section", "name", "metric", "value"])
+        writer.writeheader()
+        writer.writerows(self.rows())
+        text = buffer.getvalue()
+        if path:
+            with open(path, "w", newline="") as f:
+                f.write(text)
+        return text
+
+
+def current() -> Optional[Profiler]:
+    """Profileur actif dans le contexte courant, ou None si l'instrumentation est désactivée."""
+    return _current.get()
+
+
+def count(name: str, n: int = 1):
+    profiler = _current.get()
+    if profiler is not None:
+        profiler.counters[name] += n
+
+
+def phase(name: str):
+    """Chronomètre un bloc si un profileur est actif (sinon contexte vide réutilisé)."""
+    profiler = _current.get()
+    if profiler is None:
+        return _NULL_PHASE
+    return profiler.phase(name)
+
+
+def _counting(method, counter: str):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        # Appel d'un autre thread, sans profileur : rien à compter
+        profiler = _current.get()
+        if profiler is not None:
+            profiler.counters[counter] += 1
+        return method(*args, **kwargs)
+    return wrapper
+
+
+def _patch():
+    """Remplace les méthodes de HOT_METHODS au premier profileur actif."""
+    global _active_profilers
+    from importlib import import_module
+    with _patch_lock:
+        if _active_profilers == 0:
+            for module, cls_name, method, counter in HOT_METHODS:
+                cls = getattr(import_module(module), cls_name)
+                original = cls.__dict__[method]
+                _patched.append((cls, method, original))
+                setattr(cls, method, _counting(original, counter))
+        _active_profilers += 1
+
+
+def _unpatch():
+    """Restaure les méthodes d'origine quand le dernier profileur actif se termine."""
+    global _active_profilers
+    with _patch_lock:
+        _active_profilers -= 1
+        if _active_profilers == 0:
+            for cls, method, original in _patched:
+                setattr(cls, method, original)
+            _patched.clear()
+
+
+@contextmanager
+def profiling(profiler: Optional[Profiler] = None):
+    """
+    Active l'instrumentation dans le bloc et renvoie le profileur. Les méthodes de
+    HOT_METHODS sont remplacées par des versions qui comptent leurs appels tant qu'un
+    bloc est ouvert (dans n'importe quel thread) ; chaque appel n'est compté que par le
+    profileur du contexte qui l'exécute. Les processus de calcul séparés (modèle en îles
+    avec plusieurs workers, comparaison concurrente) ne sont pas instrumentés.
+
+    Lève RuntimeError si un profileur est déjà actif dans le même contexte (blocs
+    imbriqués) : les compteurs du bloc extérieur seraient incomplets.
+    """
+    if _current.get() is not None:
+        raise RuntimeError("Instrumentation déjà active dans ce contexte")
+    profiler = profiler or Profiler()
+    _patch()
+    token = _current.set(profiler)
+    profiler.started = time.perf_counter()
+    try:
+        yield profiler
+    finally:
+        profiler.stopped = time.perf_counter()
+        _current.reset(token)
+        _unpatch()
+
+
+def main():
+    import argparse
+    from algorithms import ALGORITHMS, METAHEURISTICS
+    from utils.helpers import generate_random_data, run_algorithm
+
+    parser = argparse.ArgumentParser(description="Profil d'exécution d'un algorithme sur une instance aléatoire")
+    parser.add_argument("--algorithm", default="genetic algorithm", choices=list(ALGORITHMS))
+    parser.add_argument("--services", type=int, default=100)
+    parser.add_argument("--vms", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=123)
+    parser.add_argument("--generations", type=int, default=200)
+    parser.add_argument("--json", help="fichier JSON de sortie")
+    parser.add_argument("--csv", help="fichier CSV de sortie")
+    args = parser.parse_args()
+
+    services, vms_template = generate_random_data(args.services, args.vms, args.seed)
+    params = {"generations": args.generations, "seed": args.seed} if args.algorithm in METAHEURISTICS else {}
+    with profiling() as profiler:
+        run_algorithm(args.algorithm, services, vms_template, **params)
+
+    report = profiler.report()
+    print(f"{args.algorithm} sur {args.services} services x {args.vms} VMs : {report['elapsed_s']:.4f} s")
+    for name, value in report["counters"].items():
+        print(f"  {name:<28} {value:>12}")
+    for name, stats in report["phases"].items():
+        print(f"  {name:<28} {stats['total_s']:>10.4f} s  ({stats['calls']} appels, max {stats['max_s']:.4f} s)")
+    if args.json:
+        profiler.to_json(args.json)
+    if args.csv:
+        profiler.to_csv(args.csv)
+
+
+if __name__ == "__main__":
+    # Exécuté avec -m, ce fichier est le module __main__ : on passe par utils.instrumentation,
+    # le module que voient les algorithmes
+    from utils.instrumentation import main as _main
+    _main()
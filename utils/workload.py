@@ -0,0 +1,183 @@
+# utils/workload.py
+# Générateur d'instances synthétiques vectorisé (NumPy) : chaque exécution a ses propres
+# flux numpy.random.Generator (l'état global de `random` n'est jamais modifié), plusieurs
+# distributions de services et une génération par tranches pour les instances qui ne
+# tiennent pas en mémoire.
+# Usage : python -m utils.workload 10000000 50000 data/instance --distribution bimodal --seed 1
+import argparse
+import random
+from typing import Iterator, Optional, Tuple
+import numpy as np
+from models.cluster import ServiceBatch, ClusterState
+
+DISTRIBUTIONS = ("uniform", "lognormal", "bimodal", "correlated")
+
+# Bornes des tirages, identiques à generate_random_data (utils/helpers.py)
+CPU_RANGE = (1, 5)
+RAM_RANGE = (2, 12)
+EXEC_RANGE = (5, 40)
+VM_CPU_RANGE = (12, 28)
+VM_RAM_RANGE = (24, 64)
+
+# Un flux indépendant par colonne de services : les valeurs ne dépendent pas de la taille
+# des tranches, et les VMs ne dépendent pas du nombre de services
+_STREAMS = ("cpu", "ram", "exec_time", "class", "vms")
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """
+    round(x, 2) de Python sur un tableau. np.round arrondit x * 100 (produit inexact) :
+    le résultat ne diffère que si x * 100 est très proche d'une demi-unité, ces valeurs
+    sont recalculées avec round.
+    """
+    scaled = np.asarray(values, dtype=np.float64) * 100
+    result = np.round(scaled) / 100
+    near = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near.any():
+        result[near] = [round(x, 2) for x in np.asarray(values)[near].tolist()]
+    return result
+
+
+def legacy_generator(seed: int) -> np.random.Generator:
+    """
+    Generator MT19937 dans l'état de random.Random(seed) : ses tirages random() sont ceux
+    de random.random() (même générateur, même conversion en double sur 53 bits).
+    """
+    state = random.Random(seed).getstate()[1]
+    bit_generator = np.random.MT19937()
+    bit_generator.state = {"bit_generator": "MT19937",
+                           "state": {"key": np.array(state[:624], dtype=np.uint32), "pos": state[624]}}
+    return np.random.Generator(bit_generator)
+
+
+def legacy_instance(num_services: int = 20, num_vms: int = 6, seed: int = 42,
+                    speeds: Optional[Tuple[float, ...]] = None) -> Tuple[ServiceBatch, ClusterState]:
+    """
+    Même instance que generate_random_data(num_services, num_vms, seed, speeds), en colonnes :
+    mêmes tirages dans le même ordre (cpu, ram, exec_time de chaque service, puis
+    capacités de chaque VM), mêmes formules a + (b - a) * u et mêmes arrondis.
+    """
+    rng = legacy_generator(seed)
+    draws = rng.random(3 * num_services).reshape(num_services, 3)
+    columns = [round2(low + (high - low) * draws[:, k])
+               for k, (low, high) in enumerate((CPU_RANGE, RAM_RANGE, EXEC_RANGE))]
+    draws = rng.random(2 * num_vms).reshape(num_vms, 2)
+    cpu_capacity = round2(VM_CPU_RANGE[0] + (VM_CPU_RANGE[1] - VM_CPU_RANGE[0]) * draws[:, 0])
+    ram_capacity = round2(VM_RAM_RANGE[0] + (VM_RAM_RANGE[1] - VM_RAM_RANGE[0]) * draws[:, 1])
+    speed = None
+    if speeds:
+        # random.choice (tirage avec rejet) : on reprend l'état du flux dans un random.Random
+        state = rng.bit_generator.state["state"]
+        python_rng = random.Random()
+        python_rng.setstate((3, tuple(state["key"].tolist()) + (int(state["pos"]),), None))
+        speed = [python_rng.choice(speeds) for _ in range(num_vms)]
+    services = ServiceBatch(*columns)
+    return services, ClusterState(cpu_capacity, ram_capacity, services, speed=speed)
+
+
+def _streams(seed: Optional[int]) -> dict:
+    """Un Generator par flux, dérivés de la graine (SeedSequence.spawn)."""
+    children = np.random.SeedSequence(seed).spawn(len(_STREAMS))
+    return {name: np.random.Generator(np.random.PCG64(child)) for name, child in zip(_STREAMS, children)}
+
+
+def _scaled(u: np.ndarray, bounds: Tuple[float, float]) -> np.ndarray:
+    low, high = bounds
+    return low + (high - low) * u
+
+
+def _draw_services(streams: dict, n: int, distribution: str, heavy_fraction: float,
+                   sigma: float, correlation: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    bounds = (CPU_RANGE, RAM_RANGE, EXEC_RANGE)
+    names = ("cpu", "ram", "exec_time")
+    if distribution == "uniform":
+        return tuple(_scaled(streams[name].random(n), b) for name, b in zip(names, bounds))
+    if distribution == "lognormal":
+        # Médiane au centre géométrique de l'intervalle, valeurs ramenées dans l'intervalle
+        return tuple(np.clip(np.sqrt(b[0] * b[1]) * np.exp(sigma * streams[name].standard_normal(n)), *b)
+                     for name, b in zip(names, bounds))
+    if distribution == "bimodal":
+        # Services lourds (40 % haut de chaque intervalle) et légers (40 % bas)
+        heavy = streams["class"].random(n) < heavy_fraction
+        u = [streams[name].random(n) * 0.4 for name in names]
+        return tuple(_scaled(np.where(heavy, 0.6 + v, v), b) for v, b in zip(u, bounds))
+    if distribution == "correlated":
+        # La RAM suit le CPU : mélange u_ram = c * u_cpu + (1 - c) * u, c = correlation
+        u_cpu = streams["cpu"].random(n)
+        u_ram = correlation * u_cpu + (1 - correlation) * streams["ram"].random(n)
+        return (_scaled(u_cpu, CPU_RANGE), _scaled(u_ram, RAM_RANGE),
+                _scaled(streams["exec_time"].random(n), EXEC_RANGE))
+    raise ValueError(f"Distribution inconnue : {distribution} (attendu : {', '.join(DISTRIBUTIONS)})")
+
+
+def iter_services(num_services: int, seed: Optional[int] = 42, distribution: str = "uniform",
+                  chunk_size: int = 1_000_000, heavy_fraction: float = 0.2, sigma: float = 0.5,
+                  correlation: float = 0.8) -> Iterator[ServiceBatch]:
+    """
+    Services par tranches de `chunk_size` (identifiants consécutifs à partir de 0), à
+    mémoire bornée ; la concaténation des tranches ne dépend pas de `chunk_size`.
+
+    Args:
+        distribution: "uniform" (mêmes bornes que generate_random_data), "lognormal"
+                      (écart-type `sigma` du logarithme), "bimodal" (fraction
+                      `heavy_fraction` de services lourds, les autres légers) ou
+                      "correlated" (RAM corrélée au CPU, `correlation` entre 0 et 1)
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution inconnue : {distribution} (attendu : {', '.join(DISTRIBUTIONS)})")
+    streams = _streams(seed)
+    for start in range(0, num_services, chunk_size):
+        n = min(chunk_size, num_services - start)
+        cpu, ram, exec_time = _draw_services(streams, n, distribution, heavy_fraction, sigma, correlation)
+        ids = np.arange(start, start + n) if start else None
+        yield ServiceBatch(round2(cpu), round2(ram), round2(exec_time), ids)
+
+
+def generate_vms(num_vms: int, seed: Optional[int] = 42,
+                 speeds: Optional[Tuple[float, ...]] = None) -> ClusterState:
+    """VMs de l'instance (capacités uniformes, vitesses tirées parmi `speeds`), sans services."""
+    rng = _streams(seed)["vms"]
+    cpu_capacity = round2(_scaled(rng.random(num_vms), VM_CPU_RANGE))
+    ram_capacity = round2(_scaled(rng.random(num_vms), VM_RAM_RANGE))
+    speed = rng.choice(np.asarray(speeds, dtype=np.float64), num_vms) if speeds else None
+    return ClusterState(cpu_capacity, ram_capacity, speed=speed)
+
+
+def generate_workload(num_services: int = 20, num_vms: int = 6, seed: Optional[int] = 42,
+                      distribution: str = "uniform", speeds: Optional[Tuple[float, ...]] = None,
+                      **shape) -> Tuple[ServiceBatch, ClusterState]:
+    """
+    Instance complète en colonnes : (services, état du cluster vide sur ces services).
+    `shape` : heavy_fraction, sigma, correlation (voir iter_services). Pour retrouver
+    exactement les instances de generate_random_data, utiliser legacy_instance.
+    """
+    chunks = list(iter_services(num_services, seed, distribution, max(1, num_services), **shape))
+    services = chunks[0] if chunks else ServiceBatch([], [], [])
+    vms = generate_vms(num_vms, seed, speeds)
+    return services, ClusterState(vms.cpu_capacity, vms.ram_capacity, services,
+                                  speed=vms.speed if speeds else None)
+
+
+def write_workload(path: str, num_services: int, num_vms: int, seed: Optional[int] = 42,
+                   distribution: str = "uniform", speeds: Optional[Tuple[float, ...]] = None,
+                   chunk_size: int = 1_000_000, **shape):
+    """Écrit une instance au format colonnes (utils/columnar.py) tranche par tranche."""
+    from utils.columnar import save_service_chunks
+    vms = generate_vms(num_vms, seed, speeds)
+    save_service_chunks(path, iter_services(num_services, seed, distribution, chunk_size, **shape), num_services,
+                        {"cpu_capacity": vms.cpu_capacity, "ram_capacity": vms.ram_capacity,
+                         "speed": vms.speed if speeds else None})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Instance synthétique au format colonnes, générée par tranches")
+    parser.add_argument("services", type=int)
+    parser.add_argument("vms", type=int)
+    parser.add_argument("path", help="répertoire de sortie")
+    parser.add_argument("--distribution", default="uniform", choices=DISTRIBUTIONS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--speeds", nargs="+", type=float, help="vitesses possibles des VMs")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    write_workload(args.path, args.services, args.vms, args.seed, args.distribution, args.speeds, args.chunk_size)
+    print(f"{args.services} services ({args.distribution}), {args.vms} VMs -> {args.path}")